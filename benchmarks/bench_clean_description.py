@@ -0,0 +1,109 @@
+"""Micro-benchmark for AIWriter._clean_description on real release bodies.
+
+Compares the precompiled, windowed cleaner against the original
+seventeen-pass implementation and reports any outputs that differ.
+
+Usage:
+    python -m benchmarks.bench_clean_description            # fetch from GitHub
+    python -m benchmarks.bench_clean_description --save releases.json
+    python -m benchmarks.bench_clean_description --input releases.json
+"""
+
+import argparse
+import json
+import os
+import re
+import timeit
+
+import requests
+
+from src.config import GITHUB_API_BASE, GITHUB_OWNER, GITHUB_REPO
+from src.generator.ai_writer import MAX_DESCRIPTION_LENGTH, AIWriter
+
+
+def legacy_clean_description(text: str) -> str:
+    """The original multi-pass implementation, kept as the baseline."""
+    if not text:
+        return ""
+    text = re.sub(r"<!--.*?-->", "", text, flags=re.DOTALL)
+    text = re.sub(r"<[^>]+>", "", text)
+    text = re.sub(r"Greptile (?:Overview|Summary|Confidence Score)[^\n]*", "", text)
+    text = re.sub(r"Context used:.*", "", text, flags=re.DOTALL)
+    text = re.sub(r"#{1,6}\s+", "", text)
+    text = re.sub(r"\*{1,2}([^*]+)\*{1,2}", r"\1", text)
+    text = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", text)
+    text = re.sub(r"!\[[^\]]*\]\([^)]+\)", "", text)
+    text = re.sub(r"```[^`]*```", "", text, flags=re.DOTALL)
+    text = text.replace("```", "")
+    text = re.sub(r"`([^`]*)`", r"\1", text)
+    text = text.replace("`", "")
+    text = re.sub(r"^[-*_]{3,}\s*$", "", text, flags=re.MULTILINE)
+    text = re.sub(r"^\|.*\|$", "", text, flags=re.MULTILINE)
+    text = re.sub(r"\s+", " ", text).strip()
+    if len(text) > MAX_DESCRIPTION_LENGTH:
+        text = text[:MAX_DESCRIPTION_LENGTH].rsplit(" ", 1)[0] + "..."
+    return text
+
+
+def fetch_release_bodies(pages: int) -> list[str]:
+    """Download release bodies from the OpenClaw repository."""
+    headers = {}
+    token = os.environ.get("GITHUB_TOKEN", "")
+    if token:
+        headers["Authorization"] = f"token {token}"
+    url = f"{GITHUB_API_BASE}/repos/{GITHUB_OWNER}/{GITHUB_REPO}/releases"
+    bodies: list[str] = []
+    for page in range(1, pages + 1):
+        resp = requests.get(
+            url, headers=headers, params={"per_page": 100, "page": page}, timeout=30
+        )
+        resp.raise_for_status()
+        releases = resp.json()
+        if not releases:
+            break
+        bodies.extend(rel.get("body") or "" for rel in releases)
+    return [body for body in bodies if body]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--input", help="JSON list of release bodies to use instead of fetching")
+    parser.add_argument("--save", help="write the fetched release bodies to this JSON file")
+    parser.add_argument("--pages", type=int, default=3, help="release pages to fetch (100 per page)")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repetitions")
+    args = parser.parse_args()
+
+    if args.input:
+        with open(args.input) as f:
+            bodies = json.load(f)
+    else:
+        bodies = fetch_release_bodies(args.pages)
+        if args.save:
+            with open(args.save, "w") as f:
+                json.dump(bodies, f)
+
+    if not bodies:
+        raise SystemExit("No release bodies to benchmark.")
+
+    total_kb = sum(len(b) for b in bodies) / 1024
+    print(f"{len(bodies)} release bodies, {total_kb:.1f} KB total, "
+          f"largest {max(len(b) for b in bodies) / 1024:.1f} KB")
+
+    mismatches = [
+        b for b in bodies if legacy_clean_description(b) != AIWriter._clean_description(b)
+    ]
+    print(f"Output mismatches vs legacy: {len(mismatches)}")
+
+    for label, func in (
+        ("legacy", legacy_clean_description),
+        ("current", AIWriter._clean_description),
+    ):
+        best = min(
+            timeit.repeat(lambda: [func(b) for b in bodies], number=1, repeat=args.repeat)
+        )
+        print(f"{label:>8}: {best * 1000:8.2f} ms total, "
+              f"{best / len(bodies) * 1e6:8.1f} us per body")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark pulling one publish time out of a growing npm packument.
+
+Builds synthetic packuments with N versions (each carrying the kind of
+manifest npm stores per version) and compares json.loads on the whole
+body against streaming it through extract_json in 64 KB chunks. Reports
+time and peak traced memory at each size.
+
+Usage:
+    python -m benchmarks.bench_packument
+    python -m benchmarks.bench_packument --versions 100,1000,10000
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Callable
+
+from src.collectors.json_stream import extract_json
+
+_CHUNK = 64 * 1024
+
+
+def build_packument(versions: int) -> bytes:
+    names = [f"1.{i // 100}.{i % 100}" for i in range(versions)]
+    manifest = {
+        "name": "openclaw",
+        "description": "Personal AI assistant that runs on your own devices",
+        "license": "MIT",
+        "dependencies": {f"dep-{d}": f"^{d}.0.0" for d in range(25)},
+        "dist": {"tarball": "https://registry.npmjs.org/openclaw/-/openclaw.tgz",
+                 "shasum": "0" * 40, "integrity": "sha512-" + "A" * 88},
+    }
+    doc = {
+        "_id": "openclaw",
+        "name": "openclaw",
+        "dist-tags": {"latest": names[-1]},
+        "versions": {name: {**manifest, "version": name} for name in names},
+        "time": {"created": "2024-01-01T00:00:00.000Z",
+                 **{name: f"2024-01-01T00:00:{i % 60:02d}.000Z" for i, name in enumerate(names)}},
+    }
+    return json.dumps(doc).encode()
+
+
+def measure(fn: Callable[[], object]) -> tuple[float, float]:
+    """Seconds and peak traced MB for one call."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / (1024 * 1024)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--versions", default="100,1000,5000",
+                        help="comma-separated version counts")
+    args = parser.parse_args()
+
+    print(f"{'versions':>9} {'size MB':>8} {'loads s':>8} {'loads MB':>9} {'stream s':>9} {'stream MB':>10}")
+    for count in (int(n) for n in args.versions.split(",")):
+        body = build_packument(count)
+        latest = json.loads(body)["dist-tags"]["latest"]
+        chunks = [body[i:i + _CHUNK] for i in range(0, len(body), _CHUNK)]
+
+        def full() -> object:
+            return json.loads(b"".join(chunks))["time"][latest]
+
+        def streamed() -> object:
+            return extract_json(iter(chunks), [("time", latest)])[("time", latest)]
+
+        assert full() == streamed()
+        loads_s, loads_mb = measure(full)
+        stream_s, stream_mb = measure(streamed)
+        print(f"{count:>9} {len(body) / 1e6:>8.2f} {loads_s:>8.3f} {loads_mb:>9.1f} "
+              f"{stream_s:>9.3f} {stream_mb:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Payload-size comparison of default responses against the projected requests.
+
+Sends each API request twice, once with the API's default response shape
+and once with the field projection or lightweight endpoint the collector
+uses, and prints the decoded body sizes. Needs network access; requests
+whose API key isn't set in the environment are skipped.
+
+Usage:
+    python -m benchmarks.bench_payload
+    python -m benchmarks.bench_payload --output payload.json
+"""
+
+import argparse
+import json
+import os
+from typing import Callable
+
+import requests
+
+from src.collectors.github_activity import ACTIVITY_QUERY
+from src.collectors.npm_registry import NPM_LATEST_URL
+from src.collectors.stackoverflow import FILTER_INCLUDE
+from src.collectors.vscode_marketplace import QUERY_FLAGS
+from src.collectors.youtube import SEARCH_FIELDS
+from src.config import (
+    GITHUB_API_BASE,
+    GITHUB_GRAPHQL,
+    GITHUB_OWNER,
+    GITHUB_REPO,
+    NPM_PACKAGE_URL,
+    STACKOVERFLOW_API_URL,
+    VSCODE_EXTENSION_NAME,
+    VSCODE_MARKETPLACE_URL,
+    YOUTUBE_API_URL,
+)
+
+_TIMEOUT = 30
+_HEADERS = {"User-Agent": "OpenClawNewsletter/1.0"}
+
+
+def _size(resp: requests.Response) -> int:
+    resp.raise_for_status()
+    return len(resp.content)
+
+
+def github_activity() -> tuple[int, int] | None:
+    token = os.environ.get("GITHUB_TOKEN")
+    if not token:
+        return None
+    auth = {**_HEADERS, "Authorization": f"Bearer {token}"}
+    default = requests.get(
+        f"{GITHUB_API_BASE}/repos/{GITHUB_OWNER}/{GITHUB_REPO}/issues",
+        params={"state": "all", "sort": "updated", "per_page": 30},
+        headers=auth, timeout=_TIMEOUT,
+    )
+    projected = requests.post(
+        GITHUB_GRAPHQL,
+        json={"query": ACTIVITY_QUERY,
+              "variables": {"owner": GITHUB_OWNER, "name": GITHUB_REPO, "first": 30}},
+        headers=auth, timeout=_TIMEOUT,
+    )
+    return _size(default), _size(projected)
+
+
+def youtube() -> tuple[int, int] | None:
+    key = os.environ.get("YOUTUBE_API_KEY")
+    if not key:
+        return None
+    params = {"part": "snippet", "q": "openclaw", "type": "video", "order": "date",
+              "maxResults": 10, "key": key}
+    url = f"{YOUTUBE_API_URL}/search"
+    default = requests.get(url, params=params, headers=_HEADERS, timeout=_TIMEOUT)
+    projected = requests.get(url, params={**params, "fields": SEARCH_FIELDS},
+                             headers=_HEADERS, timeout=_TIMEOUT)
+    return _size(default), _size(projected)
+
+
+def stackoverflow() -> tuple[int, int]:
+    filter_resp = requests.get(
+        f"{STACKOVERFLOW_API_URL}/filters/create",
+        params={"include": ";".join(FILTER_INCLUDE), "base": "none", "unsafe": "false"},
+        headers=_HEADERS, timeout=_TIMEOUT,
+    )
+    filter_resp.raise_for_status()
+    search_filter = filter_resp.json()["items"][0]["filter"]
+    params = {"order": "desc", "sort": "activity", "tagged": "openclaw", "site": "stackoverflow"}
+    url = f"{STACKOVERFLOW_API_URL}/search"
+    default = requests.get(url, params=params, headers=_HEADERS, timeout=_TIMEOUT)
+    projected = requests.get(url, params={**params, "filter": search_filter},
+                             headers=_HEADERS, timeout=_TIMEOUT)
+    return _size(default), _size(projected)
+
+
+def npm_registry() -> tuple[int, int]:
+    default = requests.get(NPM_PACKAGE_URL, headers=_HEADERS, timeout=_TIMEOUT)
+    projected = requests.get(NPM_LATEST_URL, headers=_HEADERS, timeout=_TIMEOUT)
+    return _size(default), _size(projected)
+
+
+def vscode_marketplace() -> tuple[int, int]:
+    def query(flags: int) -> requests.Response:
+        return requests.post(
+            VSCODE_MARKETPLACE_URL,
+            json={"filters": [{"criteria": [{"filterType": 7, "value": VSCODE_EXTENSION_NAME}]}],
+                  "flags": flags},
+            headers={**_HEADERS, "Accept": "application/json;api-version=6.0-preview.1"},
+            timeout=_TIMEOUT,
+        )
+
+    return _size(query(914)), _size(query(QUERY_FLAGS))
+
+
+_REQUESTS: dict[str, Callable[[], tuple[int, int] | None]] = {
+    "github_activity": github_activity,
+    "youtube": youtube,
+    "stackoverflow": stackoverflow,
+    "npm_registry": npm_registry,
+    "vscode_marketplace": vscode_marketplace,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="also write the sizes to this JSON file")
+    args = parser.parse_args()
+
+    results = {}
+    print(f"{'collector':<20} {'default B':>10} {'projected B':>12} {'ratio':>7}")
+    for name, measure in _REQUESTS.items():
+        try:
+            sizes = measure()
+        except requests.RequestException as e:
+            print(f"{name:<20} failed: {e}")
+            continue
+        if sizes is None:
+            print(f"{name:<20} skipped (no API key)")
+            continue
+        default, projected = sizes
+        results[name] = {"default_bytes": default, "projected_bytes": projected}
+        print(f"{name:<20} {default:>10} {projected:>12} {default / max(projected, 1):>6.1f}x")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""End-to-end pipeline benchmark on recorded HTTP traffic.
+
+Record a cassette once with network access, then replay it as often as
+needed with no network. Each replay runs ``main()`` in a scratch copy of
+the site with a fake Claude and a fake Buttondown, and the per-stage
+timings come from the run report that ``main()`` writes.
+
+Usage:
+    python -m benchmarks.bench_pipeline --record            # needs network
+    python -m benchmarks.bench_pipeline --repeat 5          # offline replay
+    python -m benchmarks.bench_pipeline --output after.json
+
+Each replay starts from an empty state file, so every recorded item is new.
+Collectors with wall-clock lookback windows (GitHub releases) may keep
+fewer items as the cassette ages.
+"""
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import statistics
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator
+
+from benchmarks.cassette import (
+    Cassette,
+    api_environment,
+    fake_claude,
+    http_transport,
+    present_api_keys,
+)
+from src.config import Config
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CASSETTE = os.path.join(REPO_ROOT, "benchmarks", "cassettes", "pipeline.json.gz")
+
+
+@contextmanager
+def scratch_site() -> Iterator[str]:
+    """Run inside a temporary copy of the templates and published site."""
+    previous = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="newsletter-bench-") as workdir:
+        shutil.copytree(os.path.join(REPO_ROOT, "templates"), os.path.join(workdir, "templates"))
+        shutil.copytree(os.path.join(REPO_ROOT, "docs"), os.path.join(workdir, "docs"))
+        os.chdir(workdir)
+        try:
+            yield workdir
+        finally:
+            os.chdir(previous)
+
+
+def run_once(cassette: Cassette, record: bool, claude_latency: float) -> dict:
+    """Run the whole pipeline once and return its run report entry."""
+    from src.main import main
+
+    with scratch_site() as workdir:
+        report_path = os.path.join(workdir, "run-report.json")
+        os.environ["RUN_REPORT_FILE"] = report_path
+        # A scratch token cache, so recording fetches the token exchange and a
+        # replayed (redacted) token never lands in the real cache
+        os.environ["TOKEN_CACHE_FILE"] = os.path.join(workdir, "tokens.json")
+        # Replays must not open real connections
+        os.environ["PREWARM_CONNECTIONS"] = "1" if record else "0"
+        try:
+            with api_environment(cassette.env_keys), fake_claude(claude_latency), \
+                    http_transport(cassette, record):
+                main([])
+        finally:
+            os.environ.pop("RUN_REPORT_FILE", None)
+            os.environ.pop("TOKEN_CACHE_FILE", None)
+            os.environ.pop("PREWARM_CONNECTIONS", None)
+        with open(report_path) as f:
+            return json.load(f)[-1]
+
+
+def summarize(reports: list[dict]) -> dict:
+    """Median stage and collector timings across runs."""
+    stages: dict[str, list[float]] = {}
+    collectors: dict[str, list[float]] = {}
+    for report in reports:
+        for name, seconds in report["stages"].items():
+            stages.setdefault(name, []).append(seconds)
+        for name, entry in report["collectors"].items():
+            collectors.setdefault(name, []).append(entry["wall_time_s"])
+    last = reports[-1]
+    return {
+        "runs": len(reports),
+        "duration_s": statistics.median(r["duration_s"] for r in reports),
+        "peak_rss_mb": max((r["peak_rss_mb"] or 0) for r in reports),
+        "items": last["totals"]["items"],
+        "stages": {name: statistics.median(v) for name, v in stages.items()},
+        "collectors": {
+            name: {
+                "wall_time_s": statistics.median(v),
+                "items": last["collectors"][name]["items"],
+                "requests": last["collectors"][name]["requests"],
+                "bytes_downloaded": last["collectors"][name]["bytes_downloaded"],
+            }
+            for name, v in collectors.items()
+        },
+    }
+
+
+def print_summary(summary: dict, top: int) -> None:
+    print(f"{summary['runs']} runs, {summary['items']} items, "
+          f"median {summary['duration_s'] * 1000:.1f} ms, peak RSS {summary['peak_rss_mb']} MB")
+    print("\nStage                    median ms")
+    for name, seconds in summary["stages"].items():
+        print(f"  {name:<22} {seconds * 1000:10.2f}")
+    print(f"\nSlowest {top} collectors      median ms  items  requests       KB")
+    ranked = sorted(summary["collectors"].items(), key=lambda kv: -kv[1]["wall_time_s"])
+    for name, c in ranked[:top]:
+        print(f"  {name:<24} {c['wall_time_s'] * 1000:10.2f} {c['items']:6d} {c['requests']:9d} "
+              f"{c['bytes_downloaded'] / 1024:8.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cassette", default=DEFAULT_CASSETTE, help="cassette file (.json.gz)")
+    parser.add_argument("--record", action="store_true",
+                        help="fetch live responses and write the cassette")
+    parser.add_argument("--repeat", type=int, default=3, help="replay runs to time")
+    parser.add_argument("--claude-latency", type=float, default=0.0,
+                        help="seconds the fake Claude waits per section")
+    parser.add_argument("--top", type=int, default=15, help="collectors to list")
+    parser.add_argument("--output", help="write the summary as JSON for later comparison")
+    parser.add_argument("--verbose", action="store_true", help="keep the pipeline's INFO logs")
+    args = parser.parse_args()
+
+    if args.record:
+        # Pick up keys from .env the same way a normal run would
+        Config.from_env()
+        # Claude and Buttondown are faked, so always exercise those stages
+        env_keys = sorted(set(present_api_keys()) | {"ANTHROPIC_API_KEY", "BUTTONDOWN_API_KEY"})
+        cassette = Cassette(env_keys=env_keys, recorded_at=datetime.utcnow().isoformat())
+    else:
+        if not os.path.exists(args.cassette):
+            raise SystemExit(f"No cassette at {args.cassette}; record one with --record.")
+        cassette = Cassette.load(args.cassette)
+
+    from src import main as pipeline  # noqa: F401 - configures logging on import
+    if not args.verbose:
+        logging.getLogger().setLevel(logging.WARNING)
+
+    if args.record:
+        run_once(cassette, record=True, claude_latency=0.0)
+        cassette.save(args.cassette)
+        print(f"Recorded {sum(len(v) for v in cassette.interactions.values())} responses "
+              f"to {args.cassette}")
+        return
+
+    print(f"Cassette recorded {cassette.recorded_at or 'at an unknown time'}, "
+          f"{len(cassette.interactions)} distinct requests")
+    reports = []
+    for _ in range(args.repeat):
+        cassette.rewind()
+        reports.append(run_once(cassette, record=False, claude_latency=args.claude_latency))
+    if cassette.misses:
+        print(f"Warning: {len(set(cassette.misses))} requests were not in the cassette "
+              f"(answered 404), e.g. {cassette.misses[0]}")
+
+    summary = summarize(reports)
+    print_summary(summary, args.top)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""Scale benchmark for assembly, rendering and state on synthetic items.
+
+Generates N ContentItems spread across collectors the way a busy week
+looks (mostly tweets, GitHub activity and forum posts), with heavy-tailed
+engagement counts, Markdown-laden descriptions and a share of cross-source
+duplicates. Each stage is timed at every size and the log-log slope
+between sizes is reported: ~1.0 is linear, and anything clearly above
+that is a superlinear hot spot.
+
+Usage:
+    python -m benchmarks.bench_scale
+    python -m benchmarks.bench_scale --sizes 1000,10000,100000,1000000
+    python -m benchmarks.bench_scale --output scale.json
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+import random
+import tempfile
+import time
+from typing import Callable
+
+from src.config import COLLECTOR_SECTION_MAP, Config
+from src.generator.ai_writer import AIWriter
+from src.generator.content_assembler import ContentAssembler
+from src.models.data_models import CollectorResult, ContentItem
+from src.renderer.html_renderer import HTMLRenderer
+from src.state.state_manager import StateManager
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Relative volume per collector during a viral week; unlisted collectors get 1
+_SOURCE_WEIGHTS = {
+    "twitter": 30,
+    "github_activity": 20,
+    "reddit": 10,
+    "hackernews": 8,
+    "youtube": 5,
+    "devto": 5,
+    "stackoverflow": 4,
+    "github_releases": 2,
+}
+
+# Engagement counters each source reports, as read by AIWriter._engagement_score
+_SOURCE_METRICS = {
+    "twitter": ("like_count", "retweet_count", "reply_count", "quote_count"),
+    "reddit": ("score", "num_comments"),
+    "hackernews": ("points", "num_comments"),
+    "github_activity": ("comments",),
+    "stackoverflow": ("score", "answer_count"),
+    "devto": ("likes", "comments"),
+    "youtube": ("likes",),
+}
+
+# Share of items that repeat an earlier story from another source
+_DUPLICATE_RATE = 0.03
+# Slope above which a stage is flagged as superlinear
+_SUPERLINEAR_SLOPE = 1.25
+
+_TOPIC_WORDS = [
+    "openclaw", "agent", "skill", "release", "plugin", "gateway", "memory", "browser",
+    "security", "sandbox", "model", "prompt", "workflow", "voice", "telegram", "discord",
+    "self-hosted", "assistant", "integration", "benchmark", "tutorial", "update",
+]
+
+
+def _vocabulary(rng: random.Random, size: int = 5000) -> list[str]:
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words = {"".join(rng.choice(letters) for _ in range(rng.randint(3, 10))) for _ in range(size)}
+    return sorted(words)
+
+
+def _description_pool(rng: random.Random, vocab: list[str], size: int = 2000) -> list[str]:
+    """Markdown/HTML bodies with lognormal lengths, shared across items to save memory."""
+    pool = []
+    for _ in range(size):
+        target = min(int(rng.lognormvariate(6.0, 1.2)), 40_000)
+        parts: list[str] = []
+        length = 0
+        while length < target:
+            words = " ".join(rng.choice(vocab) for _ in range(rng.randint(5, 20)))
+            kind = rng.random()
+            if kind < 0.1:
+                part = f"## {words}\n"
+            elif kind < 0.2:
+                part = f"- **{words}** [link](https://example.com/{rng.randint(1, 9999)})\n"
+            elif kind < 0.25:
+                part = f"```\n{words}\n```\n"
+            elif kind < 0.28:
+                part = f"<!-- {words} -->\n"
+            elif kind < 0.3:
+                part = f"| {words} | {words} |\n"
+            else:
+                part = words + ". "
+            parts.append(part)
+            length += len(part)
+        pool.append("".join(parts))
+    return pool
+
+
+def generate_items(n: int, seed: int = 0) -> list[ContentItem]:
+    """Build n synthetic items with realistic source mix and engagement."""
+    rng = random.Random(seed)
+    vocab = _vocabulary(rng)
+    descriptions = _description_pool(rng, vocab)
+    sources = list(COLLECTOR_SECTION_MAP)
+    weights = [_SOURCE_WEIGHTS.get(s, 1) for s in sources]
+
+    items: list[ContentItem] = []
+    for i, source in enumerate(rng.choices(sources, weights, k=n)):
+        if items and rng.random() < _DUPLICATE_RATE:
+            original = items[rng.randrange(len(items))]
+            title, url = original.title, original.url
+        else:
+            words = rng.sample(_TOPIC_WORDS, 2) + [rng.choice(vocab) for _ in range(rng.randint(3, 10))]
+            rng.shuffle(words)
+            title = " ".join(words).capitalize()
+            url = f"https://{source.replace('_', '-')}.example.com/{i}"
+        metadata = {
+            key: int(rng.lognormvariate(1.5, 1.6)) for key in _SOURCE_METRICS.get(source, ())
+        }
+        items.append(ContentItem(
+            id=f"{source}:{i}",
+            source=source,
+            title=title,
+            url=url,
+            description=rng.choice(descriptions) if rng.random() < 0.8 else "",
+            author=rng.choice(vocab),
+            published_at=f"2026-10-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:00:00Z",
+            content_type=source,
+            metadata=metadata,
+        ))
+    return items
+
+
+def _by_collector(items: list[ContentItem]) -> list[CollectorResult]:
+    grouped: dict[str, list[ContentItem]] = {}
+    for item in items:
+        grouped.setdefault(item.source, []).append(item)
+    return [CollectorResult(collector_name=name, items=group) for name, group in grouped.items()]
+
+
+def _timed(func: Callable[[], object], repeat: int) -> tuple[float, object]:
+    best, result = math.inf, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def bench_size(n: int, workdir: str, repeat: int, seed: int) -> dict[str, float]:
+    """Time every stage at one size; returns seconds per stage."""
+    items = generate_items(n, seed)
+    results = _by_collector(items)
+    config = Config(
+        templates_dir=os.path.join(REPO_ROOT, "templates"),
+        docs_dir=workdir,
+        issues_dir=os.path.join(workdir, "issues"),
+        state_file=os.path.join(workdir, "state.json"),
+    )
+    timings: dict[str, float] = {}
+
+    # A fresh writer per call so the description cache doesn't carry over
+    timings["assemble"], issue = _timed(
+        lambda: ContentAssembler(config).assemble(results, "2026-10-19"), repeat
+    )
+    timings["format_items"], _ = _timed(lambda: AIWriter(config)._format_items(items), repeat)
+    timings["fallback_html"], _ = _timed(lambda: AIWriter(config)._fallback_html(items), repeat)
+    timings["render_issue"], _ = _timed(lambda: HTMLRenderer(config).render_issue(issue), repeat)
+
+    def mark_and_save() -> None:
+        if os.path.exists(config.state_file):
+            os.remove(config.state_file)
+        state = StateManager(config.state_file, config.max_state_entries)
+        state.mark_items_covered([item.id for item in items])
+        state.save()
+
+    timings["state_mark_save"], _ = _timed(mark_and_save, repeat)
+    return timings
+
+
+def slope(sizes: list[int], seconds: list[float]) -> float:
+    """Least-squares slope of log(time) against log(size)."""
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(max(t, 1e-9)) for t in seconds]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    var = sum((x - mean_x) ** 2 for x in xs)
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / var if var else 0.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000",
+                        help="comma-separated item counts (up to 1000000)")
+    parser.add_argument("--repeat", type=int, default=1, help="timing repetitions per stage")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write timings and slopes as JSON")
+    args = parser.parse_args()
+    sizes = sorted(int(s) for s in args.sizes.split(","))
+    logging.getLogger().setLevel(logging.WARNING)
+
+    table: dict[int, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory(prefix="newsletter-scale-") as workdir:
+        for n in sizes:
+            table[n] = bench_size(n, workdir, args.repeat, args.seed)
+            print(f"N={n:>8}: " + "  ".join(f"{k} {v * 1000:.1f}ms" for k, v in table[n].items()))
+
+    stages = list(table[sizes[0]])
+    print("\nStage              " + "".join(f"{n:>12}" for n in sizes) + "     slope")
+    slopes = {}
+    for stage in stages:
+        seconds = [table[n][stage] for n in sizes]
+        slopes[stage] = slope(sizes, seconds) if len(sizes) > 1 else None
+        flag = ""
+        if slopes[stage] is not None and slopes[stage] > _SUPERLINEAR_SLOPE:
+            flag = "  <- superlinear"
+        shown = f"{slopes[stage]:10.2f}" if slopes[stage] is not None else " " * 10
+        print(f"  {stage:<17}" + "".join(f"{t * 1000:10.1f}ms" for t in seconds) + shown + flag)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"sizes": sizes, "timings": {str(n): t for n, t in table.items()},
+                       "slopes": slopes}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Startup import-time benchmark for the collector registry.
+
+Each scenario runs in a fresh interpreter and times importing src.main
+plus the collector modules that scenario would load:
+
+    eager        every collector module, as main.py used to import them
+    configured   only collectors whose API keys are set in this environment
+    single       one collector, as with --collectors hackernews
+
+Usage:
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --repeat 20 --importtime
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_CHILD = """
+import json, sys, time
+start = time.perf_counter()
+import src.main
+from src.collectors.registry import COLLECTORS
+from src.config import Config
+scenario = sys.argv[1]
+if scenario == "eager":
+    specs = COLLECTORS
+elif scenario == "configured":
+    config = Config.from_env()
+    specs = [s for s in COLLECTORS if s.is_configured(config)]
+else:
+    specs = [s for s in COLLECTORS if s.name == scenario]
+for spec in specs:
+    spec.load()
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "modules": len(sys.modules), "collectors": len(specs)}))
+"""
+
+_SCENARIOS = ("eager", "configured", "hackernews")
+
+
+def run_child(scenario: str, extra_args: list[str] | None = None) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *(extra_args or []), "-c", _CHILD, scenario],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def top_imports(scenario: str, top: int) -> list[tuple[int, str]]:
+    """Slowest imports by cumulative time, from python -X importtime."""
+    stderr = run_child(scenario, ["-X", "importtime"]).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if "." not in name.strip():
+            rows.append((int(cumulative), name.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10, help="interpreter launches per scenario")
+    parser.add_argument("--importtime", action="store_true",
+                        help="also list the slowest top-level imports in the eager scenario")
+    args = parser.parse_args()
+
+    results = {}
+    for scenario in _SCENARIOS:
+        runs = [json.loads(run_child(scenario).stdout) for _ in range(args.repeat)]
+        results[scenario] = runs
+        median = statistics.median(r["seconds"] for r in runs)
+        print(f"{scenario:>12}: {median * 1000:8.1f} ms median, "
+              f"{runs[0]['collectors']:2d} collectors, {runs[0]['modules']} modules loaded")
+
+    eager = statistics.median(r["seconds"] for r in results["eager"])
+    for scenario in _SCENARIOS[1:]:
+        lazy = statistics.median(r["seconds"] for r in results[scenario])
+        print(f"{scenario} saves {(eager - lazy) * 1000:.1f} ms "
+              f"({(1 - lazy / eager) * 100:.0f}%) over eager")
+
+    if args.importtime:
+        print("\nSlowest top-level imports (eager, cumulative us)")
+        for cumulative, name in top_imports("eager", 10):
+            print(f"  {cumulative:10d}  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""Record and replay HTTP traffic so the pipeline can be benchmarked offline.
+
+Every request made through ``requests`` ends up in ``HTTPAdapter.send``;
+patching that one method captures all collectors, whichever session they
+use. Recorded responses are stored in a gzipped JSON cassette keyed by
+method, URL and request body, and replayed in order on later runs.
+
+Credentials never reach the cassette: request headers are not stored,
+query parameters that carry API keys are redacted before matching, and
+token fields in JSON or form-encoded response bodies (an OAuth token
+exchange, for instance) are redacted before the body is stored. Cassettes
+still hold live third-party content, so benchmarks/cassettes/ is gitignored.
+
+Claude and Buttondown are always faked, in both modes, so recording a
+cassette neither spends tokens nor emails subscribers.
+"""
+
+import base64
+import gzip
+import hashlib
+import json
+import os
+import sys
+import time
+import types
+from contextlib import contextmanager
+from html import escape
+from typing import Iterator
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# Environment variables that enable optional collectors or outputs
+API_KEY_VARS = (
+    "ANTHROPIC_API_KEY",
+    "GITHUB_TOKEN",
+    "TWITTER_BEARER_TOKEN",
+    "REDDIT_CLIENT_ID",
+    "REDDIT_CLIENT_SECRET",
+    "NEWSAPI_KEY",
+    "DISCORD_BOT_TOKEN",
+    "MOLTBOOK_TOKEN",
+    "YOUTUBE_API_KEY",
+    "EVENTBRITE_TOKEN",
+    "BUTTONDOWN_API_KEY",
+)
+
+# Query parameters whose values are credentials
+_SECRET_PARAMS = {"key", "apikey", "api_key", "access_token", "token", "client_secret"}
+# Response body fields whose values are credentials
+_SECRET_FIELDS = {
+    "access_token", "refresh_token", "id_token", "token", "client_secret",
+    "api_key", "apikey", "password", "secret",
+}
+
+# Response headers that describe the wire encoding rather than the body we store
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "set-cookie"}
+
+_BUTTONDOWN_HOST = "api.buttondown.com"
+
+
+def _request_key(request: requests.PreparedRequest) -> str:
+    parts = urlsplit(request.url)
+    query = sorted(
+        (k, "REDACTED" if k.lower() in _SECRET_PARAMS else v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+    )
+    url = urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ""))
+    body = request.body or b""
+    if isinstance(body, str):
+        body = body.encode()
+    digest = hashlib.sha1(body).hexdigest()[:12] if body else "-"
+    return f"{request.method} {url} {digest}"
+
+
+def _redact_fields(value):
+    if isinstance(value, dict):
+        return {
+            k: "REDACTED" if k.lower() in _SECRET_FIELDS and isinstance(v, str) else _redact_fields(v)
+            for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [_redact_fields(v) for v in value]
+    return value
+
+
+def _redact_body(headers: dict, body: bytes) -> bytes:
+    """The body with credential fields replaced, for JSON and form-encoded responses."""
+    content_type = CaseInsensitiveDict(headers).get("content-type", "").lower()
+    if "json" in content_type:
+        try:
+            data = json.loads(body)
+        except ValueError:
+            return body
+        redacted = _redact_fields(data)
+        return body if redacted == data else json.dumps(redacted).encode()
+    if "x-www-form-urlencoded" in content_type:
+        pairs = parse_qsl(body.decode("utf-8", "replace"), keep_blank_values=True)
+        if any(k.lower() in _SECRET_FIELDS for k, _ in pairs):
+            return urlencode(
+                [(k, "REDACTED" if k.lower() in _SECRET_FIELDS else v) for k, v in pairs]
+            ).encode()
+    return body
+
+
+def _build_response(
+    request: requests.PreparedRequest, status: int, headers: dict, body: bytes, reason: str = ""
+) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = status
+    resp.reason = reason
+    resp.headers = CaseInsensitiveDict(headers)
+    resp._content = body
+    resp._content_consumed = True
+    resp.encoding = get_encoding_from_headers(resp.headers)
+    resp.url = request.url
+    resp.request = request
+    return resp
+
+
+class Cassette:
+    """Recorded responses, keyed by request, replayed in recording order."""
+
+    def __init__(self, interactions: dict[str, list[dict]] | None = None,
+                 env_keys: list[str] | None = None, recorded_at: str = ""):
+        self.interactions = interactions or {}
+        self.env_keys = env_keys or []
+        self.recorded_at = recorded_at
+        self.misses: list[str] = []
+        self._cursors: dict[str, int] = {}
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data["interactions"], data.get("env_keys"), data.get("recorded_at", ""))
+
+    def save(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump({
+                "recorded_at": self.recorded_at,
+                "env_keys": self.env_keys,
+                "interactions": self.interactions,
+            }, f)
+
+    def add(self, request: requests.PreparedRequest, resp: requests.Response) -> None:
+        headers = {k: v for k, v in resp.headers.items() if k.lower() not in _DROPPED_HEADERS}
+        self.interactions.setdefault(_request_key(request), []).append({
+            "status": resp.status_code,
+            "reason": resp.reason or "",
+            "headers": headers,
+            "body": base64.b64encode(_redact_body(headers, resp.content or b"")).decode("ascii"),
+        })
+
+    def play(self, request: requests.PreparedRequest) -> requests.Response:
+        key = _request_key(request)
+        recorded = self.interactions.get(key)
+        if not recorded:
+            self.misses.append(key)
+            return _build_response(request, 404, {}, b"", "Not in cassette")
+        # Replay in order; once exhausted, keep returning the last response
+        index = self._cursors.get(key, 0)
+        self._cursors[key] = index + 1
+        rec = recorded[min(index, len(recorded) - 1)]
+        return _build_response(
+            request, rec["status"], rec["headers"], base64.b64decode(rec["body"]), rec["reason"]
+        )
+
+    def rewind(self) -> None:
+        self._cursors.clear()
+        self.misses.clear()
+
+
+@contextmanager
+def http_transport(cassette: Cassette, record: bool) -> Iterator[Cassette]:
+    """Route all ``requests`` traffic through the cassette.
+
+    In record mode real responses are fetched and stored; otherwise they are
+    served from the cassette and nothing touches the network. Buttondown
+    calls are answered locally in both modes.
+    """
+    original_send = HTTPAdapter.send
+
+    def send(adapter, request, **kwargs):
+        if urlsplit(request.url).hostname == _BUTTONDOWN_HOST:
+            return _build_response(request, 201, {"Content-Type": "application/json"},
+                                   b'{"id": "benchmark"}', "Created")
+        if not record:
+            return cassette.play(request)
+        resp = original_send(adapter, request, **kwargs)
+        resp.content  # Read streamed bodies so they can be stored and re-read
+        cassette.add(request, resp)
+        return resp
+
+    HTTPAdapter.send = send
+    try:
+        yield cassette
+    finally:
+        HTTPAdapter.send = original_send
+
+
+class _FakeMessages:
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def create(self, model: str, max_tokens: int, messages: list[dict], **kwargs):
+        prompt = messages[-1]["content"]
+        if self.latency:
+            time.sleep(self.latency)
+        titles = [
+            line[len("- Title: "):] for line in prompt.splitlines() if line.startswith("- Title: ")
+        ]
+        text = "<ul>" + "".join(f"<li><strong>{escape(t)}</strong></li>" for t in titles) + "</ul>"
+        usage = types.SimpleNamespace(input_tokens=len(prompt) // 4, output_tokens=len(text) // 4)
+        return types.SimpleNamespace(content=[types.SimpleNamespace(text=text)], usage=usage)
+
+
+class _FakeAnthropic:
+    def __init__(self, api_key: str = "", latency: float = 0.0, **kwargs):
+        self.messages = _FakeMessages(latency)
+
+
+@contextmanager
+def fake_claude(latency: float = 0.0) -> Iterator[None]:
+    """Install a stand-in ``anthropic`` module that answers instantly (or after ``latency``)."""
+    module = types.ModuleType("anthropic")
+    module.Anthropic = lambda api_key="", **kwargs: _FakeAnthropic(api_key, latency)
+    previous = sys.modules.get("anthropic")
+    sys.modules["anthropic"] = module
+    try:
+        yield
+    finally:
+        if previous is None:
+            sys.modules.pop("anthropic", None)
+        else:
+            sys.modules["anthropic"] = previous
+
+
+@contextmanager
+def api_environment(env_keys: list[str]) -> Iterator[None]:
+    """Set exactly the given API key variables (to dummy values), restoring afterwards."""
+    saved = {var: os.environ.get(var) for var in API_KEY_VARS}
+    try:
+        for var in API_KEY_VARS:
+            if var in env_keys:
+                os.environ[var] = os.environ.get(var) or "benchmark"
+            else:
+                os.environ.pop(var, None)
+        yield
+    finally:
+        for var, value in saved.items():
+            if value is None:
+                os.environ.pop(var, None)
+            else:
+                os.environ[var] = value
+
+
+def present_api_keys() -> list[str]:
+    """Names of the API key variables set in the current environment."""
+    return [var for var in API_KEY_VARS if os.environ.get(var)]
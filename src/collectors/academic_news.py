@@ -2,22 +2,23 @@
 
 import logging
 
-import feedparser
-
 from src.collectors.base import BaseCollector
+from src.collectors.keywords import KeywordMatcher
 from src.config import CACM_RSS_URL, SCIENTIFIC_AMERICAN_RSS, SEARCH_KEYWORDS
 from src.models.data_models import ContentItem
 from src.state.state_manager import StateManager
 
 logger = logging.getLogger(__name__)
 
-_ACADEMIC_KEYWORDS = SEARCH_KEYWORDS + ["AI assistant"]
+_ACADEMIC_MATCHER = KeywordMatcher(SEARCH_KEYWORDS + ["AI assistant"])
 
 
 class AcademicNewsCollector(BaseCollector):
     """Parses CACM and Scientific American RSS feeds for OpenClaw-related articles."""
 
     name = "academic_news"
+    # Both feeds carry full article bodies; the headlines are in the first few hundred KB
+    max_bytes = 2 * 1024 * 1024
 
     def collect(self, state: StateManager) -> list[ContentItem]:
         items: list[ContentItem] = []
@@ -30,19 +31,15 @@ class AcademicNewsCollector(BaseCollector):
         return items
 
     def _parse_feed(self, url: str, state: StateManager) -> list[ContentItem]:
-        resp = self._get(url)
-        feed = feedparser.parse(resp.text)
-
         items: list[ContentItem] = []
-        for entry in feed.entries:
-            title = entry.get("title", "")
-            summary = entry.get("summary", "")
-            text = f"{title} {summary}".lower()
-
-            if not any(kw.lower() in text for kw in _ACADEMIC_KEYWORDS):
+        for entry in self._read_feed(url, state):
+            title = entry.title
+            summary = entry.summary
+            matched = _ACADEMIC_MATCHER.find(f"{title} {summary}")
+            if not matched:
                 continue
 
-            link = entry.get("link", "")
+            link = entry.link
             item_id = f"academic:{link}"
             if state.is_covered(item_id):
                 continue
@@ -54,10 +51,10 @@ class AcademicNewsCollector(BaseCollector):
                     title=title,
                     url=link,
                     description=summary,
-                    author=entry.get("author", ""),
-                    published_at=entry.get("published", ""),
+                    author=entry.author,
+                    published_at=entry.published,
                     content_type="academic_article",
-                    metadata={"feed_url": url},
+                    metadata={"feed_url": url, "matched_keywords": matched},
                 )
             )
 
@@ -19,8 +19,7 @@ class AlternativeToCollector(BaseCollector):
     name = "alternativeto"
 
     def collect(self, state: StateManager) -> list[ContentItem]:
-        resp = self._get(ALTERNATIVETO_URL)
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = BeautifulSoup(self._get_text(ALTERNATIVETO_URL), "html.parser")
 
         items: list[ContentItem] = []
 
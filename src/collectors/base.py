@@ -1,27 +1,102 @@
 """Base collector with shared HTTP client, retry logic, and error handling."""
 
+import codecs
+import hashlib
 import logging
+import threading
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterable, Iterator, TypeVar
+from urllib.parse import urlsplit
 
 import requests
 
-from src.config import Config
+from src.collectors.fan_out import fan_out
+from src.collectors.feed_reader import FeedEntry, parse_feed_stream, parse_timestamp
+from src.collectors.http_pool import new_session
+from src.collectors.single_flight import SingleFlight
+from src.config import (
+    CATCH_UP_AFTER_HOURS,
+    COLLECTOR_FRESHNESS,
+    RUN_INTERVAL_HOURS,
+    SEARCH_KEYWORDS,
+    Config,
+)
 from src.models.data_models import CollectorResult, ContentItem
+from src.state.circuit_breaker import CircuitBreaker
+from src.state.host_latency import HostLatency
 from src.state.state_manager import StateManager
+from src.telemetry import HttpStats, redact, span
 
 logger = logging.getLogger(__name__)
 
+# Shared by every collector, so identical GETs in flight at once go out once
+_IN_FLIGHT = SingleFlight()
+
+Q = TypeVar("Q")
+
+
+class CircuitOpenError(requests.RequestException):
+    """The host's circuit breaker is open, so the request wasn't sent."""
+
+
+class BoundedBody:
+    """A streamed response body that stops reading after ``max_bytes``."""
+
+    def __init__(self, resp: requests.Response, max_bytes: int, chunk_size: int = 64 * 1024):
+        self.resp = resp
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+        self.bytes_read = 0
+        self.truncated = False
+
+    def chunks(self) -> Iterator[bytes]:
+        for chunk in self.resp.iter_content(self.chunk_size):
+            remaining = self.max_bytes - self.bytes_read
+            if len(chunk) > remaining:
+                chunk = chunk[:remaining]
+                self.truncated = True
+            self.bytes_read += len(chunk)
+            if chunk:
+                yield chunk
+            if self.truncated:
+                return
+
+    def text_chunks(self) -> Iterator[str]:
+        """Decode the body incrementally, so multi-byte characters can span chunks."""
+        try:
+            decoder = codecs.getincrementaldecoder(self.resp.encoding or "utf-8")(errors="replace")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        for chunk in self.chunks():
+            text = decoder.decode(chunk)
+            if text:
+                yield text
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+
 
 class BaseCollector(ABC):
     """Abstract base class for all content collectors."""
 
     name: str = "base"
+    # Streamed bodies (feeds, scraped pages) are cut off after this many bytes
+    max_bytes: int = 5 * 1024 * 1024
 
     def __init__(self, config: Config):
         self.config = config
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": "OpenClawNewsletter/1.0"})
+        self.session = new_session()
+        self.stats = HttpStats()
+        # Searches fan out over threads, so stats updates go through _count
+        self._stats_lock = threading.Lock()
+        self.wall_time = 0.0
+        self.breaker: CircuitBreaker | None = None
+        self.latency: HostLatency | None = None
+        self.lookback = timedelta(hours=RUN_INTERVAL_HOURS)
 
     def is_available(self) -> bool:
         """Override to return False if required API keys are missing."""
@@ -33,17 +108,113 @@ class BaseCollector(ABC):
         ...
 
     def run(self, state: StateManager) -> CollectorResult:
-        """Execute the collector with error handling."""
+        """Execute the collector with error handling, timing the whole run."""
+        start = time.perf_counter()
+        try:
+            with span(f"collector:{self.name}") as attrs:
+                result = self._run(state)
+                attrs["items"] = len(result.items)
+                return result
+        finally:
+            self.wall_time = time.perf_counter() - start
+
+    def _run(self, state: StateManager) -> CollectorResult:
         if not self.is_available():
             logger.info(f"[{self.name}] Skipped (missing API key or unavailable).")
             return CollectorResult(collector_name=self.name, skipped=True)
+        if self.is_fresh(state):
+            ran_at = state.collector_ran_at(self.name)
+            logger.info(f"[{self.name}] Fresh (last ran {ran_at}); not fetching.")
+            return CollectorResult(collector_name=self.name, fresh=True)
+        self.breaker = CircuitBreaker.from_config(state, self.config)
+        self.latency = HostLatency.from_config(state, self.config)
+        self.lookback = self._lookback(state)
+        circuit = f"collector:{self.name}"
+        if not self.breaker.allow(circuit):
+            until = self.breaker.open_until(circuit)
+            logger.info(f"[{self.name}] Circuit open until {until}; not fetching.")
+            return CollectorResult(collector_name=self.name, circuit_open=True)
         try:
             items = self.collect(state)
+            state.mark_collector_ran(self.name)
+            self.breaker.record_success(circuit)
             logger.info(f"[{self.name}] Collected {len(items)} new items.")
             return CollectorResult(collector_name=self.name, items=items)
         except Exception as e:
-            logger.warning(f"[{self.name}] Failed: {e}")
-            return CollectorResult(collector_name=self.name, error=str(e))
+            # A host circuit that's open already accounts for this outage
+            if not isinstance(e, CircuitOpenError):
+                self.breaker.record_failure(circuit, str(e))
+            error = redact(str(e))
+            logger.warning(f"[{self.name}] Failed: {error}")
+            return CollectorResult(collector_name=self.name, error=error)
+
+    def _count(self, counter: str, amount: int = 1) -> None:
+        """Add to one of self.stats' counters, safely from any thread."""
+        with self._stats_lock:
+            setattr(self.stats, counter, getattr(self.stats, counter) + amount)
+
+    def _lookback(self, state: StateManager) -> timedelta:
+        """How far back to collect: the time since the last issue, at least one run interval."""
+        gap = state.time_since_last_published() or timedelta(0)
+        lookback = max(timedelta(hours=RUN_INTERVAL_HOURS), gap)
+        return min(lookback, timedelta(days=self.config.catchup_max_days))
+
+    @property
+    def catching_up(self) -> bool:
+        """True when runs were missed and the window is wider than usual."""
+        return self.lookback > timedelta(hours=CATCH_UP_AFTER_HOURS)
+
+    def _paginate(
+        self,
+        fetch: Callable[[int], list],
+        reached_end: Callable[[list], bool],
+        max_pages: int,
+    ) -> list:
+        """Fetch numbered pages (from 1) and return their items in page order.
+
+        Normally only the first page is read. When catching up, later pages
+        are fetched ``catchup_concurrency`` at a time until a page comes back
+        empty or ``reached_end`` says it reaches the cursor (items already
+        covered, or older than the lookback window).
+        """
+        first = fetch(1)
+        if not self.catching_up or not first or reached_end(first):
+            return first
+        items = list(first)
+        logger.info(f"[{self.name}] Catching up over {self.lookback}; fetching more pages.")
+        workers = max(1, self.config.catchup_concurrency)
+        page = 2
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            while page <= max_pages:
+                batch = range(page, min(page + workers, max_pages + 1))
+                for result in pool.map(fetch, batch):
+                    items.extend(result)
+                    if not result or reached_end(result):
+                        return items
+                page = batch.stop
+        return items
+
+    def _search_all(
+        self,
+        search: Callable[[Q], list[ContentItem]],
+        queries: Iterable[Q] | None = None,
+    ) -> list[ContentItem]:
+        """Run ``search`` for each query (default: SEARCH_KEYWORDS) concurrently.
+
+        Hits are merged by item ID, keeping the highest engagement counts, so
+        adding keywords widens coverage without adding their latencies up.
+        """
+        if queries is None:
+            queries = SEARCH_KEYWORDS
+        return fan_out(search, queries, self.config.search_concurrency)
+
+    def is_fresh(self, state: StateManager) -> bool:
+        """Return True if the collector completed within its COLLECTOR_FRESHNESS TTL."""
+        ttl_minutes = COLLECTOR_FRESHNESS.get(self.name)
+        ran_at = parse_timestamp(state.collector_ran_at(self.name))
+        if not ttl_minutes or ran_at is None:
+            return False
+        return datetime.now(timezone.utc) - ran_at < timedelta(minutes=ttl_minutes)
 
     @staticmethod
     def _is_retryable(exc: requests.RequestException) -> bool:
@@ -54,35 +225,91 @@ class BaseCollector(ABC):
             return exc.response.status_code >= 500
         return False
 
+    @staticmethod
+    def _trips_circuit(exc: requests.RequestException) -> bool:
+        """Return True if the error suggests the host is down or blocking us."""
+        if isinstance(exc, (requests.ConnectionError, requests.Timeout)):
+            return True
+        if isinstance(exc, requests.HTTPError) and exc.response is not None:
+            status = exc.response.status_code
+            return status >= 500 or status in (403, 429)
+        return False
+
     def _get(self, url: str, **kwargs) -> requests.Response:
         """HTTP GET with retry and timeout. Only retries on 5xx/connection errors."""
-        kwargs.setdefault("timeout", self.config.request_timeout)
-        last_exc = None
-        for attempt in range(self.config.max_retries):
-            try:
-                resp = self.session.get(url, **kwargs)
-                resp.raise_for_status()
-                return resp
-            except requests.RequestException as e:
-                last_exc = e
-                if not self._is_retryable(e) or attempt >= self.config.max_retries - 1:
-                    break
-                wait = self.config.retry_backoff_factor ** attempt
-                logger.warning(
-                    f"[{self.name}] Retry {attempt + 1}/{self.config.max_retries} "
-                    f"for {url} in {wait}s: {e}"
-                )
-                time.sleep(wait)
-        raise last_exc  # type: ignore[misc]
+        return self._request("GET", url, **kwargs)
 
     def _post(self, url: str, **kwargs) -> requests.Response:
         """HTTP POST with retry and timeout. Only retries on 5xx/connection errors."""
-        kwargs.setdefault("timeout", self.config.request_timeout)
+        return self._request("POST", url, **kwargs)
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request, sharing one response between concurrent identical GETs.
+
+        A GET that's already in flight (from any collector) with the same URL,
+        params and headers isn't sent again; the caller waits for that response
+        and it's counted in self.stats.coalesced. Streamed GETs and requests
+        with a body always go out on their own.
+        """
+        if method != "GET" or kwargs.get("stream") or "data" in kwargs or "json" in kwargs:
+            return self._send(method, url, **kwargs)
+        resp, shared = _IN_FLIGHT.do(
+            self._flight_key(method, url, kwargs),
+            lambda: self._send(method, url, **kwargs),
+        )
+        if shared:
+            self._count("coalesced")
+        return resp
+
+    def _flight_key(self, method: str, url: str, kwargs: dict) -> tuple:
+        """Method, URL, params and a digest of the headers sent, which carry the auth scope."""
+        params = kwargs.get("params") or {}
+        items = params.items() if isinstance(params, dict) else params
+        headers = {**self.session.headers, **(kwargs.get("headers") or {})}
+        scope = hashlib.sha256(repr(sorted(headers.items())).encode()).hexdigest()
+        return method, url, tuple(sorted((str(k), str(v)) for k, v in items)), scope
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request with retry and timeout, counting it in self.stats.
+
+        Unless the caller passes one, the timeout comes from the host's latency history.
+        """
+        parts = urlsplit(url)
+        if self.latency is not None:
+            kwargs.setdefault("timeout", self.latency.timeout(parts.hostname))
+        else:
+            kwargs.setdefault("timeout", self.config.request_timeout)
+        stream = kwargs.get("stream", False)
+        circuit = f"host:{parts.hostname}"
+        if self.breaker is not None and not self.breaker.allow(circuit):
+            raise CircuitOpenError(
+                f"Circuit open for {parts.hostname} until {self.breaker.open_until(circuit)}"
+            )
         last_exc = None
         for attempt in range(self.config.max_retries):
             try:
-                resp = self.session.post(url, **kwargs)
+                self._count("requests")
+                # Query strings can carry API keys; keep them out of exported spans
+                with span(
+                    f"http:{method} {parts.hostname}",
+                    url=f"{parts.scheme}://{parts.netloc}{parts.path}",
+                    attempt=attempt + 1,
+                ) as attrs:
+                    sent = time.perf_counter()
+                    resp = self.session.request(method, url, **kwargs)
+                    if self.latency is not None:
+                        self.latency.record(parts.hostname, time.perf_counter() - sent)
+                    attrs["status"] = resp.status_code
+                    # Streamed bodies are counted as they're read, in _stream
+                    if not stream:
+                        attrs["bytes"] = len(resp.content)
+                if not stream:
+                    self._count("bytes_downloaded", len(resp.content))
+                elif not resp.ok:
+                    resp.close()  # Release the connection; the body won't be read
                 resp.raise_for_status()
+                if self.breaker is not None:
+                    self.breaker.record_success(circuit)
                 return resp
             except requests.RequestException as e:
                 last_exc = e
@@ -93,9 +320,56 @@ class BaseCollector(ABC):
                     f"[{self.name}] Retry {attempt + 1}/{self.config.max_retries} "
                     f"for {url} in {wait}s: {e}"
                 )
+                self._count("retries")
                 time.sleep(wait)
+        if self.breaker is not None and self._trips_circuit(last_exc):
+            self.breaker.record_failure(circuit, str(last_exc))
         raise last_exc  # type: ignore[misc]
 
+    @contextmanager
+    def _stream(self, url: str, max_bytes: int | None = None, **kwargs) -> Iterator[BoundedBody]:
+        """GET ``url`` as a stream, reading at most ``max_bytes`` (default self.max_bytes).
+
+        Bodies cut off at the limit are listed in self.stats.oversized.
+        """
+        resp = self._get(url, stream=True, **kwargs)
+        body = BoundedBody(resp, max_bytes or self.max_bytes)
+        try:
+            yield body
+        finally:
+            resp.close()
+            self._count("bytes_downloaded", body.bytes_read)
+            if body.truncated:
+                parts = urlsplit(url)
+                with self._stats_lock:
+                    self.stats.oversized.append(f"{parts.scheme}://{parts.netloc}{parts.path}")
+                logger.warning(f"[{self.name}] {url} exceeds {body.max_bytes} bytes; truncated.")
+
+    def _get_text(self, url: str, max_bytes: int | None = None, **kwargs) -> str:
+        """GET a page as text, decoded incrementally and capped at ``max_bytes``."""
+        with self._stream(url, max_bytes, **kwargs) as body:
+            return "".join(body.text_chunks())
+
+    def _read_feed(self, url: str, state: StateManager, **kwargs) -> list[FeedEntry]:
+        """Stream and parse an RSS/Atom feed, skipping entries older than its cursor.
+
+        The newest publish time seen is kept in state as this feed's cursor,
+        capped at the current time so a future-dated entry can't push it past
+        posts that haven't been published yet. Entries at or after the cursor
+        may have been seen before; collectors drop those with is_covered.
+        """
+        cursor_key = f"{self.name}:{url}"
+        since = parse_timestamp(state.get_cursor(cursor_key))
+        with self._stream(url, **kwargs) as body:
+            entries = parse_feed_stream(body.chunks(), since)
+
+        published = [e.published_at for e in entries if e.published_at is not None]
+        if published:
+            newest = min(max(published), datetime.now(timezone.utc))
+            if since is None or newest > since:
+                state.set_cursor(cursor_key, newest.isoformat())
+        return entries
+
     def _graphql(self, query: str, variables: dict | None = None) -> dict:
         """Execute a GitHub GraphQL query."""
         headers = {"Authorization": f"Bearer {self.config.github_token}"}
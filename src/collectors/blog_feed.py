@@ -2,8 +2,6 @@
 
 import logging
 
-import feedparser
-
 from src.collectors.base import BaseCollector
 from src.config import OFFICIAL_BLOG_RSS
 from src.models.data_models import ContentItem
@@ -18,12 +16,9 @@ class BlogFeedCollector(BaseCollector):
     name = "blog_feed"
 
     def collect(self, state: StateManager) -> list[ContentItem]:
-        resp = self._get(OFFICIAL_BLOG_RSS)
-        feed = feedparser.parse(resp.text)
-
         items: list[ContentItem] = []
-        for entry in feed.entries:
-            link = entry.get("link", "")
+        for entry in self._read_feed(OFFICIAL_BLOG_RSS, state):
+            link = entry.link
             item_id = f"blog:{link}"
             if state.is_covered(item_id):
                 continue
@@ -32,10 +27,10 @@ class BlogFeedCollector(BaseCollector):
                 ContentItem(
                     id=item_id,
                     source=self.name,
-                    title=entry.get("title", ""),
+                    title=entry.title,
                     url=link,
-                    description=entry.get("summary", ""),
-                    published_at=entry.get("published", ""),
+                    description=entry.summary,
+                    published_at=entry.published,
                     content_type="blog_post",
                 )
             )
@@ -19,8 +19,7 @@ class Claw360Collector(BaseCollector):
     name = "claw360"
 
     def collect(self, state: StateManager) -> list[ContentItem]:
-        resp = self._get(CLAW360_URL)
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = BeautifulSoup(self._get_text(CLAW360_URL), "html.parser")
 
         items: list[ContentItem] = []
         for card in soup.select("article, .card, .service, .listing, .integration"):
@@ -23,12 +23,12 @@ class ClawhuntCollector(BaseCollector):
 
         for base_url in (CLAWHUNT_SPACE_URL, CLAWHUNT_SH_URL):
             try:
-                resp = self._get(base_url)
+                html = self._get_text(base_url)
             except Exception as e:
                 logger.warning(f"[clawhunt] Failed to fetch {base_url}: {e}")
                 continue
 
-            soup = BeautifulSoup(resp.text, "html.parser")
+            soup = BeautifulSoup(html, "html.parser")
 
             for card in soup.select(
                 "article, .card, .product, .bounty, .listing, .item"
@@ -1,14 +1,19 @@
 """Collector for Dev.to articles tagged with OpenClaw."""
 
 import logging
+from datetime import datetime, timezone
 
 from src.collectors.base import BaseCollector
-from src.config import DEVTO_API_URL
+from src.collectors.feed_reader import parse_timestamp
+from src.config import DEVTO_API_URL, DEVTO_TAGS
 from src.models.data_models import ContentItem
 from src.state.state_manager import StateManager
 
 logger = logging.getLogger(__name__)
 
+_PAGE_SIZE = 20
+_MAX_PAGES = 10
+
 
 class DevToCollector(BaseCollector):
     """Fetches OpenClaw-tagged articles from the Dev.to API."""
@@ -16,11 +21,24 @@ class DevToCollector(BaseCollector):
     name = "devto"
 
     def collect(self, state: StateManager) -> list[ContentItem]:
-        resp = self._get(
-            DEVTO_API_URL,
-            params={"tag": "openclaw", "per_page": 20},
-        )
-        articles = resp.json()
+        return self._search_all(lambda tag: self._search(tag, state), DEVTO_TAGS)
+
+    def _search(self, tag: str, state: StateManager) -> list[ContentItem]:
+        since = datetime.now(timezone.utc) - self.lookback
+
+        def fetch(page: int) -> list[dict]:
+            params = {"tag": tag, "per_page": _PAGE_SIZE, "page": page}
+            return self._get(DEVTO_API_URL, params=params).json()
+
+        def reached_end(page: list[dict]) -> bool:
+            # Tag listings aren't strictly by date, so only stop once a whole page is old news
+            return len(page) < _PAGE_SIZE or all(
+                state.is_covered(f"devto:{article.get('id', '')}")
+                or (parse_timestamp(article.get("published_at")) or since) < since
+                for article in page
+            )
+
+        articles = self._paginate(fetch, reached_end, _MAX_PAGES)
 
         items: list[ContentItem] = []
         for article in articles:
@@ -41,6 +59,10 @@ class DevToCollector(BaseCollector):
                     author=user.get("username", ""),
                     published_at=article.get("published_at", ""),
                     content_type="devto_article",
+                    metadata={
+                        "likes": article.get("public_reactions_count", 0),
+                        "comments": article.get("comments_count", 0),
+                    },
                 )
             )
 
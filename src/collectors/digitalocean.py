@@ -25,8 +25,7 @@ class DigitalOceanCollector(BaseCollector):
             return []
 
         try:
-            resp = self._get(DIGITALOCEAN_URL)
-            soup = BeautifulSoup(resp.text, "html.parser")
+            soup = BeautifulSoup(self._get_text(DIGITALOCEAN_URL), "html.parser")
 
             # Extract page title
             title_tag = soup.find("h1")
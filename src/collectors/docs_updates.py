@@ -40,8 +40,7 @@ class DocsUpdatesCollector(BaseCollector):
         return items
 
     def _scrape_changelog(self, url: str, state: StateManager) -> list[ContentItem]:
-        resp = self._get(url)
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = BeautifulSoup(self._get_text(url), "html.parser")
 
         # Try to scope to main content area
         main = soup.find("main") or soup.find("article") or soup
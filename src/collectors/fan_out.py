@@ -0,0 +1,43 @@
+"""Run one search per keyword concurrently and merge the hits.
+
+A story found by several keywords comes back once per search, possibly
+with engagement counts read at slightly different moments; the merged
+item keeps the highest of each count.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, TypeVar
+
+from src.models.data_models import ContentItem
+
+Q = TypeVar("Q")
+
+
+def merge_hits(groups: Iterable[list[ContentItem]]) -> list[ContentItem]:
+    """Items from every group, deduplicated by ID in order of first appearance."""
+    merged: dict[str, ContentItem] = {}
+    for items in groups:
+        for item in items:
+            kept = merged.setdefault(item.id, item)
+            if kept is item:
+                continue
+            for key, value in item.metadata.items():
+                current = kept.metadata.get(key)
+                if isinstance(value, (int, float)) and isinstance(current, (int, float)):
+                    kept.metadata[key] = max(current, value)
+                else:
+                    kept.metadata.setdefault(key, value)
+    return list(merged.values())
+
+
+def fan_out(
+    search: Callable[[Q], list[ContentItem]],
+    queries: Iterable[Q],
+    max_workers: int,
+) -> list[ContentItem]:
+    """Run ``search`` for every query at once (up to ``max_workers``) and merge the hits."""
+    queries = list(queries)
+    if len(queries) <= 1:
+        return merge_hits(search(query) for query in queries)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(queries)))) as pool:
+        return merge_hits(pool.map(search, queries))
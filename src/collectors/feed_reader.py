@@ -0,0 +1,190 @@
+"""Streaming RSS/Atom reader shared by the feed collectors.
+
+Feeds are parsed incrementally with an ElementTree pull parser, keeping only
+the handful of fields the collectors read. Feeds that aren't well-formed XML
+fall back to feedparser, which tolerates most real-world breakage.
+"""
+
+import logging
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Local tag names of the elements that hold one feed entry
+_ENTRY_TAGS = {"item", "entry"}
+
+# Entry child elements mapped to FeedEntry fields, in order of preference
+_FIELD_TAGS = {
+    "title": ("title",),
+    "summary": ("description", "summary", "encoded", "content"),
+    "author": ("creator", "author"),
+    "published": ("pubDate", "published", "date", "updated"),
+    "id": ("guid", "id"),
+}
+
+
+@dataclass
+class FeedEntry:
+    """The fields of a feed entry that the collectors use."""
+
+    title: str = ""
+    link: str = ""
+    summary: str = ""
+    author: str = ""
+    published: str = ""  # As written in the feed
+    id: str = ""
+
+    @property
+    def published_at(self) -> datetime | None:
+        return parse_timestamp(self.published)
+
+
+def parse_timestamp(value: str | None) -> datetime | None:
+    """Parse an RFC 822 or ISO 8601 timestamp into an aware UTC datetime."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _element_text(elem: ET.Element) -> str:
+    return "".join(elem.itertext()).strip()
+
+
+def _to_entry(elem: ET.Element) -> FeedEntry:
+    """Build a FeedEntry from a completed <item> or <entry> element."""
+    children: dict[str, ET.Element] = {}
+    link = ""
+    for child in elem:
+        name = _local_name(child.tag)
+        if name == "link":
+            # Atom links carry the URL in href; prefer the alternate link
+            href = child.get("href")
+            if href is None:
+                link = link or (child.text or "").strip()
+            elif child.get("rel", "alternate") == "alternate":
+                link = href.strip()
+            continue
+        children.setdefault(name, child)
+
+    fields: dict[str, str] = {}
+    for field_name, tags in _FIELD_TAGS.items():
+        for tag in tags:
+            child = children.get(tag)
+            if child is None:
+                continue
+            if tag == "author":
+                # Atom nests the name; RSS puts it in the element text
+                name_el = next((c for c in child if _local_name(c.tag) == "name"), None)
+                text = _element_text(name_el if name_el is not None else child)
+            else:
+                text = _element_text(child)
+            if text:
+                fields[field_name] = text
+                break
+    return FeedEntry(link=link, **fields)
+
+
+def _is_older(entry: FeedEntry, since: datetime | None) -> bool:
+    if since is None:
+        return False
+    published = entry.published_at
+    return published is not None and published < since
+
+
+def iter_feed(chunks: Iterable[bytes], since: datetime | None = None) -> Iterator[FeedEntry]:
+    """Yield feed entries from a stream of raw XML chunks.
+
+    Entries published before ``since`` are skipped. Feeds aren't assumed to
+    be in date order (updated or backdated posts move around), so the whole
+    feed is read. Raises ET.ParseError on malformed XML.
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    stack: list[ET.Element] = []
+    for chunk in chunks:
+        parser.feed(chunk)
+        for event, elem in parser.read_events():
+            if event == "start":
+                stack.append(elem)
+                continue
+            stack.pop()
+            if _local_name(elem.tag) not in _ENTRY_TAGS:
+                continue
+            entry = _to_entry(elem)
+            # Drop the parsed element so memory stays flat on long feeds
+            if stack:
+                stack[-1].remove(elem)
+            if _is_older(entry, since):
+                continue
+            yield entry
+    parser.close()
+
+
+def _parse_with_feedparser(content: bytes, since: datetime | None) -> list[FeedEntry]:
+    """Fallback for feeds the XML parser rejects."""
+    import feedparser
+
+    entries: list[FeedEntry] = []
+    for raw in feedparser.parse(content).entries:
+        entry = FeedEntry(
+            title=raw.get("title", ""),
+            link=raw.get("link", ""),
+            summary=raw.get("summary", ""),
+            author=raw.get("author", "") or raw.get("dc_creator", ""),
+            published=raw.get("published", "") or raw.get("updated", ""),
+            id=raw.get("id", ""),
+        )
+        if not _is_older(entry, since):
+            entries.append(entry)
+    return entries
+
+
+def parse_feed_stream(chunks: Iterable[bytes], since: datetime | None = None) -> list[FeedEntry]:
+    """Parse a streamed RSS/Atom document, falling back to feedparser if malformed.
+
+    Entries older than ``since`` are dropped as they're parsed, so memory
+    stays flat. Chunks read so far are kept only to hand a malformed (or
+    cut-off) document to feedparser.
+    """
+    stream = iter(chunks)
+    consumed: list[bytes] = []
+
+    def recorded() -> Iterator[bytes]:
+        for chunk in stream:
+            consumed.append(chunk)
+            yield chunk
+
+    entries: list[FeedEntry] = []
+    try:
+        for entry in iter_feed(recorded(), since):
+            entries.append(entry)
+    except ET.ParseError as e:
+        logger.debug(f"Feed is not well-formed XML ({e}); falling back to feedparser")
+        return _parse_with_feedparser(b"".join(consumed) + b"".join(stream), since)
+    return entries
+
+
+def parse_feed(content: bytes, since: datetime | None = None) -> list[FeedEntry]:
+    """Parse a complete RSS/Atom document, falling back to feedparser if malformed."""
+    try:
+        return list(iter_feed([content], since))
+    except ET.ParseError as e:
+        logger.debug(f"Feed is not well-formed XML ({e}); falling back to feedparser")
+        return _parse_with_feedparser(content, since)
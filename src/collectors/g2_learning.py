@@ -2,10 +2,9 @@
 
 import logging
 
-import feedparser
-
 from src.collectors.base import BaseCollector
-from src.config import G2_LEARNING_URL, SEARCH_KEYWORDS
+from src.collectors.keywords import SEARCH_MATCHER
+from src.config import G2_LEARNING_URL
 from src.models.data_models import ContentItem
 from src.state.state_manager import StateManager
 
@@ -18,19 +17,15 @@ class G2LearningCollector(BaseCollector):
     name = "g2_learning"
 
     def collect(self, state: StateManager) -> list[ContentItem]:
-        resp = self._get(G2_LEARNING_URL)
-        feed = feedparser.parse(resp.text)
-
         items: list[ContentItem] = []
-        for entry in feed.entries:
-            title = entry.get("title", "")
-            summary = entry.get("summary", "")
-            combined = f"{title} {summary}".lower()
-
-            if not any(kw.lower() in combined for kw in SEARCH_KEYWORDS):
+        for entry in self._read_feed(G2_LEARNING_URL, state):
+            title = entry.title
+            summary = entry.summary
+            matched = SEARCH_MATCHER.find(f"{title} {summary}")
+            if not matched:
                 continue
 
-            link = entry.get("link", "")
+            link = entry.link
             item_id = f"g2:{link}"
             if state.is_covered(item_id):
                 continue
@@ -42,9 +37,10 @@ class G2LearningCollector(BaseCollector):
                     title=title,
                     url=link,
                     description=summary,
-                    author=entry.get("author", ""),
-                    published_at=entry.get("published", ""),
+                    author=entry.author,
+                    published_at=entry.published,
                     content_type="article",
+                    metadata={"matched_keywords": matched},
                 )
             )
 
@@ -1,14 +1,42 @@
 """Collector for recent GitHub issues and pull requests."""
 
 import logging
+from datetime import datetime, timezone
 
 from src.collectors.base import BaseCollector
+from src.collectors.feed_reader import parse_timestamp
 from src.config import GITHUB_API_BASE, GITHUB_OWNER, GITHUB_REPO
 from src.models.data_models import ContentItem
 from src.state.state_manager import StateManager
 
 logger = logging.getLogger(__name__)
 
+_PAGE_SIZE = 30
+# When catching up after missed runs: REST pages to read, and GraphQL's node limit
+_MAX_PAGES = 10
+_CATCH_UP_FIRST = 100
+
+# With a token, GraphQL returns only the fields read below instead of the
+# REST issue JSON (reactions, full user objects, milestone, ...)
+_ACTIVITY_FIELDS = """
+  number title url body state createdAt updatedAt
+  author { login }
+  labels(first: 20) { nodes { name } }
+  comments { totalCount }
+"""
+ACTIVITY_QUERY = """
+query($owner: String!, $name: String!, $first: Int!) {
+  repository(owner: $owner, name: $name) {
+    issues(first: $first, orderBy: {field: UPDATED_AT, direction: DESC}) {
+      nodes { %(fields)s }
+    }
+    pullRequests(first: $first, orderBy: {field: UPDATED_AT, direction: DESC}) {
+      nodes { %(fields)s }
+    }
+  }
+}
+""" % {"fields": _ACTIVITY_FIELDS}
+
 
 class GitHubActivityCollector(BaseCollector):
     """Fetches recent issues and PRs from the OpenClaw GitHub repository."""
@@ -16,16 +44,7 @@ class GitHubActivityCollector(BaseCollector):
     name = "github_activity"
 
     def collect(self, state: StateManager) -> list[ContentItem]:
-        url = (
-            f"{GITHUB_API_BASE}/repos/{GITHUB_OWNER}/{GITHUB_REPO}"
-            f"/issues?state=all&sort=updated&per_page=30"
-        )
-        headers = {}
-        if self.config.github_token:
-            headers["Authorization"] = f"token {self.config.github_token}"
-
-        resp = self._get(url, headers=headers)
-        entries = resp.json()
+        entries = self._fetch_graphql() if self.config.github_token else self._fetch_rest()
 
         items: list[ContentItem] = []
         for entry in entries:
@@ -60,3 +79,56 @@ class GitHubActivityCollector(BaseCollector):
             )
 
         return items
+
+    def _updated_before_window(self, entry: dict) -> bool:
+        updated = parse_timestamp(entry.get("updated_at"))
+        return updated is not None and updated < datetime.now(timezone.utc) - self.lookback
+
+    def _fetch_rest(self) -> list[dict]:
+        url = f"{GITHUB_API_BASE}/repos/{GITHUB_OWNER}/{GITHUB_REPO}/issues"
+
+        def fetch(page: int) -> list[dict]:
+            params = {"state": "all", "sort": "updated", "per_page": _PAGE_SIZE, "page": page}
+            return self._get(url, params=params).json()
+
+        def reached_end(page: list[dict]) -> bool:
+            # Sorted by update time, so the window ends at the first stale entry
+            return len(page) < _PAGE_SIZE or self._updated_before_window(page[-1])
+
+        return self._paginate(fetch, reached_end, _MAX_PAGES)
+
+    def _fetch_graphql(self) -> list[dict]:
+        """The most recently updated issues and PRs, shaped like REST issue entries.
+
+        When catching up, one larger query (GraphQL's 100-node limit) stands in
+        for extra pages, trimmed to what was updated within the lookback.
+        """
+        first = _CATCH_UP_FIRST if self.catching_up else _PAGE_SIZE
+        data = self._graphql(
+            ACTIVITY_QUERY,
+            {"owner": GITHUB_OWNER, "name": GITHUB_REPO, "first": first},
+        )
+        repo = data.get("repository") or {}
+        entries = []
+        for kind in ("issues", "pullRequests"):
+            for node in (repo.get(kind) or {}).get("nodes", []):
+                entry = {
+                    "number": node["number"],
+                    "title": node["title"],
+                    "html_url": node.get("url", ""),
+                    "body": node.get("body", ""),
+                    # REST reports merged PRs as closed
+                    "state": "open" if node.get("state") == "OPEN" else "closed",
+                    "created_at": node.get("createdAt", ""),
+                    "updated_at": node.get("updatedAt", ""),
+                    "user": node.get("author") or {},
+                    "labels": (node.get("labels") or {}).get("nodes", []),
+                    "comments": (node.get("comments") or {}).get("totalCount", 0),
+                }
+                if kind == "pullRequests":
+                    entry["pull_request"] = {}
+                entries.append(entry)
+        entries.sort(key=lambda e: e["updated_at"], reverse=True)
+        if self.catching_up:
+            return [e for e in entries if not self._updated_before_window(e)] or entries[:_PAGE_SIZE]
+        return entries[:_PAGE_SIZE]
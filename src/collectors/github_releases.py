@@ -10,6 +10,19 @@ from src.state.state_manager import StateManager
 
 logger = logging.getLogger(__name__)
 
+_PAGE_SIZE = 15
+_MAX_PAGES = 10
+
+
+def _published(rel: dict) -> datetime | None:
+    published = rel.get("published_at", "")
+    if not published:
+        return None
+    try:
+        return datetime.fromisoformat(published.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
 
 class GitHubReleasesCollector(BaseCollector):
     """Fetches recent releases from the OpenClaw GitHub repository."""
@@ -22,23 +35,28 @@ class GitHubReleasesCollector(BaseCollector):
         if self.config.github_token:
             headers["Authorization"] = f"token {self.config.github_token}"
 
-        resp = self._get(url, headers=headers, params={"per_page": 15})
-        releases = resp.json()
+        # Only include releases from the last 3 days, or since the last run if longer ago
+        cutoff = datetime.now(timezone.utc) - max(timedelta(days=3), self.lookback)
 
-        # Only include releases from the last 3 days
-        cutoff = datetime.now(timezone.utc) - timedelta(days=3)
+        def fetch(page: int) -> list[dict]:
+            params = {"per_page": _PAGE_SIZE, "page": page}
+            return self._get(url, headers=headers, params=params).json()
+
+        def reached_end(page: list[dict]) -> bool:
+            # Newest first, so stop at the first covered or too-old release
+            return len(page) < _PAGE_SIZE or any(
+                state.is_covered(f"release:{rel['tag_name']}")
+                or (_published(rel) or cutoff) < cutoff
+                for rel in page
+            )
+
+        releases = self._paginate(fetch, reached_end, _MAX_PAGES)
 
         items: list[ContentItem] = []
         for rel in releases:
-            # Skip releases older than 3 days
-            published = rel.get("published_at", "")
-            if published:
-                try:
-                    pub_dt = datetime.fromisoformat(published.replace("Z", "+00:00"))
-                    if pub_dt < cutoff:
-                        continue
-                except ValueError:
-                    pass
+            pub_dt = _published(rel)
+            if pub_dt is not None and pub_dt < cutoff:
+                continue
 
             item_id = f"release:{rel['tag_name']}"
             if state.is_covered(item_id):
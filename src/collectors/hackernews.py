@@ -1,14 +1,19 @@
 """Collector for Hacker News stories mentioning OpenClaw."""
 
 import logging
+from datetime import datetime, timezone
 
 from src.collectors.base import BaseCollector
+from src.collectors.keywords import phrase_query
 from src.config import HACKERNEWS_API_URL
 from src.models.data_models import ContentItem
 from src.state.state_manager import StateManager
 
 logger = logging.getLogger(__name__)
 
+_PAGE_SIZE = 20
+_MAX_PAGES = 5
+
 
 class HackerNewsCollector(BaseCollector):
     """Fetches OpenClaw-related stories from the Hacker News Algolia API."""
@@ -16,14 +21,31 @@ class HackerNewsCollector(BaseCollector):
     name = "hackernews"
 
     def collect(self, state: StateManager) -> list[ContentItem]:
-        resp = self._get(
-            HACKERNEWS_API_URL,
-            params={"query": "openclaw", "tags": "story", "hitsPerPage": 20},
-        )
-        data = resp.json()
+        return self._search_all(lambda keyword: self._search(keyword, state))
+
+    def _search(self, keyword: str, state: StateManager) -> list[ContentItem]:
+        since = datetime.now(timezone.utc).timestamp() - self.lookback.total_seconds()
+
+        def fetch(page: int) -> list[dict]:
+            # Algolia pages are numbered from 0
+            params = {
+                "query": phrase_query(keyword),
+                "tags": "story",
+                "hitsPerPage": _PAGE_SIZE,
+                "page": page - 1,
+            }
+            return self._get(HACKERNEWS_API_URL, params=params).json().get("hits", [])
+
+        def reached_end(page: list[dict]) -> bool:
+            # Ranked by relevance, not date, so only stop once a whole page is old news
+            return len(page) < _PAGE_SIZE or all(
+                state.is_covered(f"hn:{hit.get('objectID', '')}")
+                or hit.get("created_at_i", since) < since
+                for hit in page
+            )
 
         items: list[ContentItem] = []
-        for hit in data.get("hits", []):
+        for hit in self._paginate(fetch, reached_end, _MAX_PAGES):
             object_id = hit.get("objectID", "")
             item_id = f"hn:{object_id}"
             if state.is_covered(item_id):
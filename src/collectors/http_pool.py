@@ -0,0 +1,153 @@
+"""Connection pool shared by every collector, with DNS caching and pre-warming.
+
+All collector sessions mount one HTTPAdapter, so a connection opened by one
+collector (or by prewarm) is reused by the next one talking to that host.
+That adapter's connections resolve hosts through a small DNS cache whose
+answers expire after a few minutes; other HTTP clients in the process
+(the Anthropic SDK, the email sender) resolve as usual.
+"""
+
+import logging
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NameResolutionError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family
+
+from src import config
+
+logger = logging.getLogger(__name__)
+
+_PREWARM_WORKERS = 16
+# Long enough to cover a run's burst of requests, short enough for the daemon
+# to notice hosts that move
+_DNS_TTL_SECONDS = 300
+
+_dns_lock = threading.Lock()
+_dns_cache: dict[tuple[str, int], tuple[float, list[str]]] = {}
+
+
+def resolve(host: str, port: int) -> list[str]:
+    """Addresses for host, from the cache while its entry is fresh."""
+    key = (host, port)
+    now = time.monotonic()
+    with _dns_lock:
+        cached = _dns_cache.get(key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    # Failures aren't cached, so a flaky lookup is retried next time
+    infos = socket.getaddrinfo(host, port, allowed_gai_family(), socket.SOCK_STREAM)
+    addresses = list(dict.fromkeys(info[4][0] for info in infos))
+    with _dns_lock:
+        _dns_cache[key] = (now + _DNS_TTL_SECONDS, addresses)
+    return addresses
+
+
+class _CachedDNSMixin:
+    """Connect to the cached addresses; TLS still verifies against the host name."""
+
+    def _new_conn(self) -> socket.socket:
+        host = self._dns_host
+        try:
+            addresses = resolve(host, self.port)
+        except socket.gaierror as e:
+            raise NameResolutionError(self.host, self, e) from e
+        error: Exception = NameResolutionError(self.host, self, socket.gaierror("no addresses"))
+        # Like socket.create_connection: try each address until one connects
+        for address in addresses:
+            self._dns_host = address
+            try:
+                return super()._new_conn()
+            except (ConnectTimeoutError, NewConnectionError) as e:
+                error = e
+            finally:
+                self._dns_host = host
+        raise error
+
+
+class _CachedDNSHTTPConnection(_CachedDNSMixin, HTTPConnection):
+    pass
+
+
+class _CachedDNSHTTPSConnection(_CachedDNSMixin, HTTPSConnection):
+    pass
+
+
+class _CachedDNSHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _CachedDNSHTTPConnection
+
+
+class _CachedDNSHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _CachedDNSHTTPSConnection
+
+
+class CollectorAdapter(HTTPAdapter):
+    """HTTPAdapter whose direct (non-proxied) connections use the DNS cache."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CachedDNSHTTPConnectionPool,
+            "https": _CachedDNSHTTPSConnectionPool,
+        }
+
+
+# One pool per host; enough for every source host at once
+SHARED_ADAPTER = CollectorAdapter(pool_connections=64, pool_maxsize=16)
+
+
+def new_session() -> requests.Session:
+    """A session on the shared pool, with the newsletter's User-Agent."""
+    session = requests.Session()
+    session.mount("https://", SHARED_ADAPTER)
+    session.mount("http://", SHARED_ADAPTER)
+    session.headers.update({"User-Agent": "OpenClawNewsletter/1.0"})
+    return session
+
+
+def known_hosts() -> list[str]:
+    """Origins (scheme://host) of every source URL in src/config.py."""
+    urls: list[str] = []
+    for value in vars(config).values():
+        if isinstance(value, str):
+            urls.append(value)
+        elif isinstance(value, (list, tuple)):
+            urls.extend(v for v in value if isinstance(v, str))
+    origins = {
+        f"{parts.scheme}://{parts.netloc}"
+        for parts in map(urlsplit, urls)
+        if parts.scheme in ("http", "https") and parts.netloc
+    }
+    return sorted(origins)
+
+
+def _warm(session: requests.Session, origin: str, timeout: float) -> bool:
+    """HEAD the origin so its connection (DNS, TCP, TLS) is left open in the shared pool.
+
+    Any response will do; the body is empty, so the connection goes straight
+    back to the pool.
+    """
+    try:
+        session.head(f"{origin}/", timeout=timeout, allow_redirects=False)
+    except requests.RequestException as e:
+        logger.debug(f"Pre-warming {origin} failed: {e}")
+        return False
+    return True
+
+
+def prewarm(origins: list[str], timeout: float = 5.0) -> int:
+    """Open one connection to each origin in parallel; returns how many succeeded."""
+    if not origins:
+        return 0
+    session = new_session()
+    with ThreadPoolExecutor(max_workers=min(_PREWARM_WORKERS, len(origins))) as pool:
+        warmed = sum(pool.map(lambda origin: _warm(session, origin, timeout), origins))
+    logger.info(f"Pre-warmed connections to {warmed}/{len(origins)} hosts")
+    return warmed
@@ -0,0 +1,117 @@
+"""Pull a few keys out of a large JSON document without keeping all of it.
+
+Used for registry documents where only a full document is served, such as
+npm packuments that carry every published version. The stream is scanned
+token by token, so memory stays bounded by the chunk size; subtrees with no
+wanted key below them are skipped in one go with the C decoder when they
+fit in the buffer. Reading stops once every wanted key has been found.
+"""
+
+import codecs
+import json
+import re
+from typing import Any, Iterable
+
+# A string (the closing quote is group 1, missing if the buffer ends mid-string)
+# or one structural character. Numbers, literals and whitespace are skipped.
+_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*(")?|[{}\[\]:,]')
+_WHITESPACE = re.compile(r"[ \t\r\n]*")
+_DECODER = json.JSONDecoder()
+
+
+def _lookup(value: Any, keys: tuple[str, ...], path: tuple[str, ...], found: dict) -> None:
+    for key in keys:
+        if not isinstance(value, dict) or key not in value:
+            return
+        value = value[key]
+    found[path] = value
+
+
+def extract_json(chunks: Iterable[bytes], paths: Iterable[tuple[str, ...]]) -> dict[tuple[str, ...], Any]:
+    """Return the values at ``paths`` (tuples of object keys) found in a UTF-8 document.
+
+    Paths that don't exist are missing from the result. Array elements can't
+    be addressed; a path through an array never matches.
+    """
+    wanted = {tuple(path) for path in paths}
+    prefixes = {path[:i] for path in wanted for i in range(len(path))}
+    found: dict[tuple[str, ...], Any] = {}
+    if not wanted:
+        return found
+
+    kinds: list[str] = []  # Open containers, "{" or "["
+    keys: list[str | None] = []  # Current key in each open container (None in arrays)
+    expect_key = False
+    capture_start: int | None = None  # Stream offset where a wanted value begins
+    capture_depth = 0
+    capture_path: tuple = ()
+
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    buf = ""
+    base = 0  # Stream offset of buf[0]
+    pos = 0  # Next index in buf to scan
+    for chunk in chunks:
+        keep = capture_start - base if capture_start is not None else pos
+        buf = buf[keep:] + decoder.decode(chunk)
+        base += keep
+        pos -= keep
+        while True:
+            m = _TOKEN.search(buf, pos)
+            if m is None:
+                pos = len(buf)
+                break
+            token = m.group()
+            if token[0] == '"':
+                if m.group(1) is None:
+                    pos = m.start()  # Wait for the rest of the string
+                    break
+                pos = m.end()
+                if expect_key and kinds[-1] == "{":
+                    keys[-1] = json.loads(token)
+                continue
+
+            if token == ":" and capture_start is None:
+                path = tuple(keys)
+                if path in wanted and path not in found:
+                    capture_start = base + m.end()
+                    capture_depth = len(kinds)
+                    capture_path = path
+                elif path not in prefixes:
+                    # Nothing wanted below this key: skip a nested value in one go if it's
+                    # all in the buffer, otherwise fall through and scan into it
+                    start = _WHITESPACE.match(buf, m.end()).end()
+                    if start < len(buf) and buf[start] in "{[":
+                        try:
+                            _, end = _DECODER.raw_decode(buf, start)
+                        except json.JSONDecodeError:
+                            pass
+                        else:
+                            expect_key = False
+                            pos = end
+                            continue
+            pos = m.end()
+
+            if capture_start is not None and len(kinds) == capture_depth and token in ",}]":
+                value = json.loads(buf[capture_start - base:m.start()])
+                found[capture_path] = value
+                # Wanted paths below this one were inside the captured value
+                for path in wanted:
+                    if len(path) > len(capture_path) and path[:len(capture_path)] == capture_path:
+                        _lookup(value, path[len(capture_path):], path, found)
+                capture_start = None
+                if len(found) == len(wanted):
+                    return found
+
+            if token in "{[":
+                kinds.append(token)
+                keys.append(None)
+                expect_key = token == "{"
+            elif token in "}]":
+                kinds.pop()
+                keys.pop()
+                expect_key = False
+            elif token == ":":
+                expect_key = False
+            elif token == ",":
+                expect_key = kinds[-1] == "{"
+    return found
@@ -0,0 +1,100 @@
+"""Compiled multi-keyword matcher shared by feed and scrape filters."""
+
+import re
+from typing import Iterable
+
+from src.config import SEARCH_KEYWORDS
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _normalize(keyword: str) -> str:
+    """Lowercase a keyword and collapse internal whitespace to single spaces."""
+    return _WHITESPACE.sub(" ", keyword.strip()).lower()
+
+
+def _build_trie(keywords: Iterable[str]) -> dict:
+    """Build a character trie; the empty-string key marks the end of a keyword."""
+    trie: dict = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return trie
+
+
+def _trie_to_regex(node: dict) -> str:
+    """Emit a prefix-factored alternation so shared prefixes are scanned once."""
+    branches = []
+    for char in sorted(k for k in node if k):
+        # Any run of whitespace in the text matches a space in the keyword
+        atom = r"\s+" if char == " " else re.escape(char)
+        branches.append(atom + _trie_to_regex(node[char]))
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if "" in node:
+        # Greedy optional group: the longest keyword wins, shorter ones still match
+        body = f"(?:{body})?"
+    return body
+
+
+class KeywordMatcher:
+    """Case-insensitive, word-bounded matcher for a fixed keyword list.
+
+    All keywords are compiled once into a single trie-shaped regex, so each
+    text is scanned in one pass regardless of how many keywords (product
+    names, aliases) the list grows to.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self._canonical: dict[str, str] = {}
+        for keyword in keywords:
+            normalized = _normalize(keyword)
+            if normalized:
+                self._canonical.setdefault(normalized, keyword)
+        self.keywords = list(self._canonical.values())
+        self._pattern = re.compile(
+            r"(?<!\w)(?:" + _trie_to_regex(_build_trie(self._canonical)) + r")(?!\w)",
+            re.IGNORECASE,
+        )
+
+    def search(self, text: str) -> bool:
+        """Return True if any keyword occurs in the text."""
+        if not text or not self._canonical:
+            return False
+        return self._pattern.search(text) is not None
+
+    def find(self, text: str) -> list[str]:
+        """Return the distinct keywords found in the text, in order of first match."""
+        if not text or not self._canonical:
+            return []
+        found: dict[str, None] = {}
+        for match in self._pattern.finditer(text):
+            found.setdefault(self._canonical[_normalize(match.group(0))], None)
+        return list(found)
+
+
+def phrase_query(keyword: str) -> str:
+    """A search term for one keyword, quoted when it has several words.
+
+    Unquoted, search APIs match any text containing all of the words
+    (Algolia with typo tolerance too), which pulls in off-topic hits.
+    """
+    term = _normalize(keyword)
+    return f'"{term}"' if " " in term else term
+
+
+def any_of_query(keywords: Iterable[str]) -> str:
+    """A boolean search query matching any keyword, multi-word ones as phrases.
+
+    For search APIs with OR support (Twitter, Reddit), this finds every
+    keyword's hits in one request rather than one request per keyword.
+    """
+    terms = dict.fromkeys(phrase_query(k) for k in keywords)
+    return " OR ".join(term for term in terms if term)
+
+
+# Shared matcher for the project-wide search keywords, compiled once per run
+SEARCH_MATCHER = KeywordMatcher(SEARCH_KEYWORDS)
@@ -28,8 +28,7 @@ class LearnClawCollector(BaseCollector):
     }
 
     def collect(self, state: StateManager) -> list[ContentItem]:
-        resp = self._get(LEARNCLAW_URL)
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = BeautifulSoup(self._get_text(LEARNCLAW_URL), "html.parser")
 
         # Scope to main content area to avoid nav/footer
         main = soup.find("main") or soup.find("article") or soup
@@ -2,10 +2,9 @@
 
 import logging
 
-import feedparser
-
 from src.collectors.base import BaseCollector
-from src.config import LOBSTERS_RSS_URL, SEARCH_KEYWORDS
+from src.collectors.keywords import SEARCH_MATCHER
+from src.config import LOBSTERS_RSS_URL
 from src.models.data_models import ContentItem
 from src.state.state_manager import StateManager
 
@@ -18,19 +17,15 @@ class LobstersCollector(BaseCollector):
     name = "lobsters"
 
     def collect(self, state: StateManager) -> list[ContentItem]:
-        resp = self._get(LOBSTERS_RSS_URL)
-        feed = feedparser.parse(resp.text)
-
         items: list[ContentItem] = []
-        for entry in feed.entries:
-            title = entry.get("title", "")
-            summary = entry.get("summary", "")
-            text = f"{title} {summary}".lower()
-
-            if not any(kw.lower() in text for kw in SEARCH_KEYWORDS):
+        for entry in self._read_feed(LOBSTERS_RSS_URL, state):
+            title = entry.title
+            summary = entry.summary
+            matched = SEARCH_MATCHER.find(f"{title} {summary}")
+            if not matched:
                 continue
 
-            link = entry.get("link", "")
+            link = entry.link
             item_id = f"lobsters:{link}"
             if state.is_covered(item_id):
                 continue
@@ -42,8 +37,9 @@ class LobstersCollector(BaseCollector):
                     title=title,
                     url=link,
                     description=summary,
-                    published_at=entry.get("published", ""),
+                    published_at=entry.published,
                     content_type="lobsters_story",
+                    metadata={"matched_keywords": matched},
                 )
             )
 
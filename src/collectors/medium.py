@@ -2,8 +2,6 @@
 
 import logging
 
-import feedparser
-
 from src.collectors.base import BaseCollector
 from src.config import MEDIUM_RSS_URL
 from src.models.data_models import ContentItem
@@ -18,29 +16,22 @@ class MediumCollector(BaseCollector):
     name = "medium"
 
     def collect(self, state: StateManager) -> list[ContentItem]:
-        resp = self._get(MEDIUM_RSS_URL)
-        feed = feedparser.parse(resp.text)
-
         items: list[ContentItem] = []
-        for entry in feed.entries:
-            link = entry.get("link", "")
+        for entry in self._read_feed(MEDIUM_RSS_URL, state):
+            link = entry.link
             item_id = f"medium:{link}"
             if state.is_covered(item_id):
                 continue
 
-            author = entry.get("author", "")
-            if not author:
-                author = entry.get("dc_creator", "")
-
             items.append(
                 ContentItem(
                     id=item_id,
                     source=self.name,
-                    title=entry.get("title", ""),
+                    title=entry.title,
                     url=link,
-                    description=entry.get("summary", ""),
-                    author=author,
-                    published_at=entry.get("published", ""),
+                    description=entry.summary,
+                    author=entry.author,
+                    published_at=entry.published,
                     content_type="medium_article",
                 )
             )
@@ -3,6 +3,7 @@
 import logging
 
 from src.collectors.base import BaseCollector
+from src.collectors.json_stream import extract_json
 from src.config import NPM_PACKAGE_URL
 from src.models.data_models import ContentItem
 from src.state.state_manager import StateManager
@@ -10,18 +11,22 @@ from src.state.state_manager import StateManager
 logger = logging.getLogger(__name__)
 
 NPM_DOWNLOADS_URL = "https://api.npmjs.org/downloads/point/last-week/openclaw"
+# Manifest of the version tagged latest, without the rest of the version history
+NPM_LATEST_URL = f"{NPM_PACKAGE_URL}/latest"
 
 
 class NpmRegistryCollector(BaseCollector):
     """Fetches version and download data from the npm registry."""
 
     name = "npm_registry"
+    # The full packument grows with every release; it's only scanned, never held in memory
+    max_bytes = 50 * 1024 * 1024
 
     def collect(self, state: StateManager) -> list[ContentItem]:
-        resp = self._get(NPM_PACKAGE_URL)
-        data = resp.json()
+        resp = self._get(NPM_LATEST_URL)
+        version_info = resp.json()
 
-        latest_version = data.get("dist-tags", {}).get("latest", "")
+        latest_version = version_info.get("version", "")
         if not latest_version:
             logger.warning("[npm_registry] Could not determine latest version.")
             return []
@@ -39,8 +44,6 @@ class NpmRegistryCollector(BaseCollector):
         except Exception as e:
             logger.warning(f"[npm_registry] Failed to fetch download stats: {e}")
 
-        version_info = data.get("versions", {}).get(latest_version, {})
-
         return [
             ContentItem(
                 id=item_id,
@@ -48,7 +51,7 @@ class NpmRegistryCollector(BaseCollector):
                 title=f"openclaw v{latest_version} on npm",
                 url=f"https://www.npmjs.com/package/openclaw",
                 description=version_info.get("description", ""),
-                published_at=data.get("time", {}).get(latest_version, ""),
+                published_at=self._published_at(latest_version),
                 content_type="package",
                 metadata={
                     "version": latest_version,
@@ -57,3 +60,13 @@ class NpmRegistryCollector(BaseCollector):
                 },
             )
         ]
+
+    def _published_at(self, version: str) -> str:
+        """Publish time of ``version``, which only the full packument records."""
+        try:
+            with self._stream(NPM_PACKAGE_URL) as body:
+                found = extract_json(body.chunks(), [("time", version)])
+        except Exception as e:
+            logger.warning(f"[npm_registry] Failed to fetch publish time: {e}")
+            return ""
+        return found.get(("time", version), "")
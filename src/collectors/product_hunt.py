@@ -19,8 +19,7 @@ class ProductHuntCollector(BaseCollector):
     name = "product_hunt"
 
     def collect(self, state: StateManager) -> list[ContentItem]:
-        resp = self._get(PRODUCT_HUNT_URL)
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = BeautifulSoup(self._get_text(PRODUCT_HUNT_URL), "html.parser")
 
         items: list[ContentItem] = []
 
@@ -1,60 +1,159 @@
 """Collector for Reddit discussions about OpenClaw."""
 
 import logging
+from datetime import datetime, timezone
+
+import requests
 
 from src.collectors.base import BaseCollector
-from src.config import REDDIT_SUBREDDITS
+from src.collectors.keywords import any_of_query
+from src.config import (
+    REDDIT_OAUTH_URL,
+    REDDIT_SUBREDDITS,
+    REDDIT_TOKEN_URL,
+    SEARCH_KEYWORDS,
+    Config,
+)
 from src.models.data_models import ContentItem
 from src.state.state_manager import StateManager
+from src.state.token_cache import TokenCache
 
 logger = logging.getLogger(__name__)
 
+_PAGE_SIZE = 25
+_MAX_PAGES = 4
+# Subreddits searched together as one r/a+b+c listing; more are split across
+# concurrent searches to keep the URL a sensible length
+_SUBREDDITS_PER_SEARCH = 50
+
 
 class RedditCollector(BaseCollector):
-    """Fetches OpenClaw-related posts from configured subreddits using praw."""
+    """Fetches OpenClaw-related posts from configured subreddits via Reddit's OAuth API.
+
+    All subreddits are searched in one combined ``r/a+b+c`` listing, newest
+    first, following ``after`` cursors until posts already covered or older
+    than the lookback window are reached.
+    """
 
     name = "reddit"
 
+    def __init__(self, config: Config):
+        super().__init__(config)
+        self._tokens = TokenCache(config.token_cache_file)
+        self._token: str | None = None
+
     def is_available(self) -> bool:
         return bool(self.config.reddit_client_id and self.config.reddit_client_secret)
 
     def collect(self, state: StateManager) -> list[ContentItem]:
-        import praw
+        # Fetched (or read from the cache) once, before the searches share it
+        self._access_token()
+        query = any_of_query(SEARCH_KEYWORDS)
+        groups = [
+            REDDIT_SUBREDDITS[i:i + _SUBREDDITS_PER_SEARCH]
+            for i in range(0, len(REDDIT_SUBREDDITS), _SUBREDDITS_PER_SEARCH)
+        ]
+        return self._search_all(lambda group: self._search(group, query, state), groups)
 
-        reddit = praw.Reddit(
-            client_id=self.config.reddit_client_id,
-            client_secret=self.config.reddit_client_secret,
-            user_agent=self.config.reddit_user_agent,
+    def _access_token(self) -> str:
+        """An app-only OAuth token, reused from the token cache while it's valid."""
+        if self._token:
+            return self._token
+        client_id = self.config.reddit_client_id
+        token = self._tokens.get(self.name, client_id)
+        if token:
+            # Counted once per run: the token request the cache saved
+            self._count("cache_hits")
+            self._token = token
+            return token
+        resp = self._post(
+            REDDIT_TOKEN_URL,
+            data={"grant_type": "client_credentials"},
+            auth=(client_id, self.config.reddit_client_secret),
+            headers={"User-Agent": self.config.reddit_user_agent},
         )
+        data = resp.json()
+        if "access_token" not in data:
+            raise RuntimeError(f"Reddit token request failed: {data.get('error', data)}")
+        self._tokens.put(self.name, client_id, data["access_token"], data.get("expires_in", 3600))
+        self._token = data["access_token"]
+        return self._token
+
+    def _listing(self, path: str, params: dict) -> dict:
+        """GET an OAuth API listing, fetching a new token once if the cached one is rejected."""
+        def get() -> dict:
+            headers = {
+                "Authorization": f"Bearer {self._access_token()}",
+                "User-Agent": self.config.reddit_user_agent,
+            }
+            return self._get(f"{REDDIT_OAUTH_URL}{path}", params=params, headers=headers).json()
+
+        try:
+            return get()
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code != 401:
+                raise
+        # Revoked or expired early: drop it so the retry fetches a fresh one
+        self._tokens.drop(self.name, self.config.reddit_client_id)
+        self._token = None
+        return get()
+
+    def _search(self, subreddits: list[str], query: str, state: StateManager) -> list[ContentItem]:
+        since = datetime.now(timezone.utc) - self.lookback
+        params = {
+            "q": query,
+            "restrict_sr": "on",
+            "sort": "new",
+            "type": "link",
+            "limit": _PAGE_SIZE,
+            "raw_json": 1,
+        }
+
+        posts: list[dict] = []
+        after = None
+        for _ in range(_MAX_PAGES):
+            listing = self._listing(
+                f"/r/{'+'.join(subreddits)}/search",
+                {**params, "after": after} if after else params,
+            ).get("data", {})
+            page = [child.get("data", {}) for child in listing.get("children", [])]
+            posts.extend(page)
+            after = listing.get("after")
+            # Newest first, so anything covered or older than the window ends the search
+            if not after or not page or any(
+                state.is_covered(f"reddit:{post.get('id')}")
+                or post.get("created_utc", 0) < since.timestamp()
+                for post in page
+            ):
+                break
 
         items: list[ContentItem] = []
-        for subreddit_name in REDDIT_SUBREDDITS:
-            try:
-                subreddit = reddit.subreddit(subreddit_name)
-                for submission in subreddit.search("openclaw", limit=10):
-                    item_id = f"reddit:{submission.id}"
-                    if state.is_covered(item_id):
-                        continue
-
-                    items.append(
-                        ContentItem(
-                            id=item_id,
-                            source=self.name,
-                            title=submission.title,
-                            url=f"https://reddit.com{submission.permalink}",
-                            description=submission.selftext[:500] if submission.selftext else "",
-                            author=str(submission.author) if submission.author else "",
-                            published_at="",
-                            content_type="reddit_post",
-                            metadata={
-                                "subreddit": subreddit_name,
-                                "score": submission.score,
-                                "num_comments": submission.num_comments,
-                                "upvote_ratio": submission.upvote_ratio,
-                            },
-                        )
-                    )
-            except Exception as e:
-                logger.warning(f"Error searching r/{subreddit_name}: {e}")
+        for post in posts:
+            item_id = f"reddit:{post.get('id')}"
+            if state.is_covered(item_id):
+                continue
+
+            created = post.get("created_utc")
+            selftext = post.get("selftext") or ""
+            items.append(
+                ContentItem(
+                    id=item_id,
+                    source=self.name,
+                    title=post.get("title", ""),
+                    url=f"https://reddit.com{post.get('permalink', '')}",
+                    description=selftext[:500],
+                    author=post.get("author", "") or "",
+                    published_at=(
+                        datetime.fromtimestamp(created, timezone.utc).isoformat() if created else ""
+                    ),
+                    content_type="reddit_post",
+                    metadata={
+                        "subreddit": post.get("subreddit", ""),
+                        "score": post.get("score", 0),
+                        "num_comments": post.get("num_comments", 0),
+                        "upvote_ratio": post.get("upvote_ratio", 0.0),
+                    },
+                )
+            )
 
         return items
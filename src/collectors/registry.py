@@ -0,0 +1,147 @@
+"""Registry of collectors, imported lazily by name.
+
+Each collector is described by where to import it from, its tier and the
+Config fields it needs. Collectors missing those settings are skipped
+without importing their module (or its scraping and API dependencies).
+
+Third-party packages can add collectors through the
+``openclaw_newsletter.collectors`` entry-point group, for example::
+
+    [project.entry-points."openclaw_newsletter.collectors"]
+    my_source = "my_package.collector:MySourceCollector"
+
+The entry-point name must match the collector's ``name`` and have a
+section in COLLECTOR_SECTION_MAP for its items to be published.
+"""
+
+import importlib
+import logging
+from dataclasses import dataclass
+from importlib.metadata import entry_points
+from typing import TYPE_CHECKING
+
+from src.config import Config
+
+if TYPE_CHECKING:
+    from src.collectors.base import BaseCollector
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "openclaw_newsletter.collectors"
+
+# Tier given to collectors discovered through entry points
+_PLUGIN_TIER = 10
+
+
+@dataclass(frozen=True)
+class CollectorSpec:
+    """Where to find a collector and what it needs to run."""
+
+    name: str
+    target: str  # "module:ClassName"
+    tier: int
+    requires: tuple[str, ...] = ()  # Config fields that must be non-empty
+
+    def is_configured(self, config: Config) -> bool:
+        return all(getattr(config, field, "") for field in self.requires)
+
+    def load(self) -> type["BaseCollector"]:
+        module_name, _, class_name = self.target.partition(":")
+        return getattr(importlib.import_module(module_name), class_name)
+
+
+def _spec(name: str, class_name: str, tier: int, *requires: str) -> CollectorSpec:
+    return CollectorSpec(name, f"src.collectors.{name}:{class_name}", tier, requires)
+
+
+# Built-in collectors in run order
+COLLECTORS: list[CollectorSpec] = [
+    # Tier 1: Core GitHub
+    _spec("github_releases", "GitHubReleasesCollector", 1),
+    _spec("github_activity", "GitHubActivityCollector", 1),
+    _spec("github_stats", "GitHubStatsCollector", 1),
+    _spec("github_sponsors", "GitHubSponsorsCollector", 1, "github_token"),
+    _spec("clawhub_skills", "ClawHubSkillsCollector", 1),
+    _spec("awesome_skills", "AwesomeSkillsCollector", 1),
+    # Tier 2: Package Registries
+    _spec("npm_registry", "NpmRegistryCollector", 2),
+    _spec("homebrew_stats", "HomebrewStatsCollector", 2),
+    _spec("docker_hub", "DockerHubCollector", 2),
+    _spec("vscode_marketplace", "VSCodeMarketplaceCollector", 2),
+    _spec("huggingface", "HuggingFaceCollector", 2),
+    _spec("digitalocean", "DigitalOceanCollector", 2),
+    # Tier 3: Official Web
+    _spec("blog_feed", "BlogFeedCollector", 3),
+    _spec("showcase", "ShowcaseCollector", 3),
+    _spec("docs_updates", "DocsUpdatesCollector", 3),
+    _spec("learnclaw", "LearnClawCollector", 3),
+    # Tier 4: Tech Media
+    _spec("hackernews", "HackerNewsCollector", 4),
+    _spec("devto", "DevToCollector", 4),
+    _spec("medium", "MediumCollector", 4),
+    _spec("lobsters", "LobstersCollector", 4),
+    _spec("academic_news", "AcademicNewsCollector", 4),
+    _spec("substack", "SubstackCollector", 4),
+    _spec("tldr_news", "TldrNewsCollector", 4),
+    # Tier 5: Ecosystem
+    _spec("claw360", "Claw360Collector", 5),
+    _spec("clawhunt", "ClawhuntCollector", 5),
+    _spec("alternativeto", "AlternativeToCollector", 5),
+    _spec("wikipedia", "WikipediaCollector", 5),
+    _spec("product_hunt", "ProductHuntCollector", 5),
+    _spec("stackoverflow", "StackOverflowCollector", 5),
+    _spec("g2_learning", "G2LearningCollector", 5),
+    # Tier 6: Security & Research
+    _spec("security_feeds", "SecurityFeedsCollector", 6),
+    _spec("arxiv_papers", "ArxivPapersCollector", 6),
+    # Tier 7: Social Media
+    _spec("twitter", "TwitterCollector", 7, "twitter_bearer_token"),
+    _spec("reddit", "RedditCollector", 7, "reddit_client_id", "reddit_client_secret"),
+    _spec("linkedin_news", "LinkedInNewsCollector", 7, "newsapi_key"),
+    _spec("discord_feed", "DiscordFeedCollector", 7, "discord_bot_token"),
+    _spec("moltbook", "MoltbookCollector", 7, "moltbook_token"),
+    # Tier 8: Video & Events
+    _spec("youtube", "YouTubeCollector", 8, "youtube_api_key"),
+    _spec("events", "EventsCollector", 8, "eventbrite_token"),
+    # Tier 9: News Aggregators
+    _spec("tech_news", "TechNewsCollector", 9, "newsapi_key"),
+]
+
+
+def discover_plugins() -> list[CollectorSpec]:
+    """Collectors registered by installed packages, without importing them."""
+    specs = []
+    for ep in entry_points(group=ENTRY_POINT_GROUP):
+        specs.append(CollectorSpec(ep.name, ep.value, _PLUGIN_TIER))
+    return specs
+
+
+def all_collectors() -> list[CollectorSpec]:
+    """Built-in collectors followed by plugins; a plugin can't shadow a built-in name."""
+    builtin = {spec.name for spec in COLLECTORS}
+    plugins = []
+    for spec in discover_plugins():
+        if spec.name in builtin:
+            logger.warning(f"Ignoring plugin collector '{spec.name}': name is already registered")
+            continue
+        plugins.append(spec)
+    return COLLECTORS + plugins
+
+
+def select_collectors(names: list[str] | None = None) -> list[CollectorSpec]:
+    """Return the registered collectors, limited to ``names`` if given.
+
+    Raises:
+        ValueError: If a requested name isn't registered.
+    """
+    specs = all_collectors()
+    if not names:
+        return specs
+    by_name = {spec.name: spec for spec in specs}
+    unknown = [name for name in names if name not in by_name]
+    if unknown:
+        raise ValueError(
+            f"Unknown collector(s): {', '.join(unknown)}. "
+            f"Available: {', '.join(sorted(by_name))}"
+        )
+    return [by_name[name] for name in names]
@@ -2,16 +2,15 @@
 
 import logging
 
-import feedparser
-
 from src.collectors.base import BaseCollector
+from src.collectors.keywords import KeywordMatcher
 from src.config import SECURITY_RSS_FEEDS
 from src.models.data_models import ContentItem
 from src.state.state_manager import StateManager
 
 logger = logging.getLogger(__name__)
 
-_SECURITY_KEYWORDS = ["openclaw", "ai agent security", "ai assistant"]
+_SECURITY_MATCHER = KeywordMatcher(["openclaw", "ai agent security", "ai assistant"])
 
 
 class SecurityFeedsCollector(BaseCollector):
@@ -24,22 +23,19 @@ class SecurityFeedsCollector(BaseCollector):
 
         for feed_url in SECURITY_RSS_FEEDS:
             try:
-                resp = self._get(feed_url)
+                entries = self._read_feed(feed_url, state)
             except Exception as e:
                 logger.warning(f"[security_feeds] Failed to fetch {feed_url}: {e}")
                 continue
 
-            feed = feedparser.parse(resp.text)
-
-            for entry in feed.entries:
-                title = entry.get("title", "")
-                summary = entry.get("summary", "")
-                combined = f"{title} {summary}".lower()
-
-                if not any(kw in combined for kw in _SECURITY_KEYWORDS):
+            for entry in entries:
+                title = entry.title
+                summary = entry.summary
+                matched = _SECURITY_MATCHER.find(f"{title} {summary}")
+                if not matched:
                     continue
 
-                link = entry.get("link", "")
+                link = entry.link
                 item_id = f"security:{link}"
                 if state.is_covered(item_id):
                     continue
@@ -51,10 +47,10 @@ class SecurityFeedsCollector(BaseCollector):
                         title=title,
                         url=link,
                         description=summary,
-                        author=entry.get("author", ""),
-                        published_at=entry.get("published", ""),
+                        author=entry.author,
+                        published_at=entry.published,
                         content_type="security_article",
-                        metadata={"feed": feed_url},
+                        metadata={"feed": feed_url, "matched_keywords": matched},
                     )
                 )
 
@@ -25,8 +25,7 @@ class ShowcaseCollector(BaseCollector):
         return items
 
     def _scrape_page(self, url: str, state: StateManager) -> list[ContentItem]:
-        resp = self._get(url)
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = BeautifulSoup(self._get_text(url), "html.parser")
 
         items: list[ContentItem] = []
         cards = soup.find_all(["article", "div"], class_=lambda c: c and "card" in c)
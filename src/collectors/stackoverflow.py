@@ -1,14 +1,35 @@
 """Collector for StackOverflow questions tagged with openclaw."""
 
 import logging
+from datetime import datetime, timezone
 
 from src.collectors.base import BaseCollector
-from src.config import STACKOVERFLOW_API_URL
+from src.collectors.keywords import phrase_query
+from src.config import SEARCH_KEYWORDS, STACKOVERFLOW_API_URL
 from src.models.data_models import ContentItem
 from src.state.state_manager import StateManager
 
 logger = logging.getLogger(__name__)
 
+# Fields kept by the custom search filter; everything else (bodies, badges,
+# profile images, ...) is left out of the response
+FILTER_INCLUDE = (
+    ".items",
+    "question.question_id",
+    "question.title",
+    "question.link",
+    "question.owner",
+    "question.creation_date",
+    "question.score",
+    "question.answer_count",
+    "question.is_answered",
+    "question.tags",
+    "shallow_user.display_name",
+)
+_FILTER_CACHE_KEY = "stackoverflow:filter"
+_PAGE_SIZE = 30
+_MAX_PAGES = 5
+
 
 class StackOverflowCollector(BaseCollector):
     """Fetches recent StackOverflow questions tagged with openclaw."""
@@ -16,19 +37,37 @@ class StackOverflowCollector(BaseCollector):
     name = "stackoverflow"
 
     def collect(self, state: StateManager) -> list[ContentItem]:
-        resp = self._get(
-            f"{STACKOVERFLOW_API_URL}/search",
-            params={
-                "order": "desc",
-                "sort": "activity",
-                "tagged": "openclaw",
-                "site": "stackoverflow",
-            },
-        )
-        data = resp.json()
+        search_filter = self._search_filter(state)
+        # Questions tagged openclaw, plus any mentioning a keyword in their text
+        queries = [{"tagged": "openclaw"}] + [{"q": phrase_query(keyword)} for keyword in SEARCH_KEYWORDS]
+        return self._search_all(lambda query: self._search(query, search_filter, state), queries)
+
+    def _search(self, query: dict, search_filter: str | None, state: StateManager) -> list[ContentItem]:
+        since = datetime.now(timezone.utc).timestamp() - self.lookback.total_seconds()
+        params = {
+            "order": "desc",
+            "sort": "activity",
+            "site": "stackoverflow",
+            "pagesize": _PAGE_SIZE,
+            **query,
+        }
+        if search_filter:
+            params["filter"] = search_filter
+
+        def fetch(page: int) -> list[dict]:
+            resp = self._get(f"{STACKOVERFLOW_API_URL}/search/advanced", params={**params, "page": page})
+            return resp.json().get("items", [])
+
+        def reached_end(page: list[dict]) -> bool:
+            # Sorted by activity, so old questions can still show up; stop once a page has nothing new
+            return len(page) < _PAGE_SIZE or all(
+                state.is_covered(f"so:{question.get('question_id', '')}")
+                or question.get("creation_date", since) < since
+                for question in page
+            )
 
         items: list[ContentItem] = []
-        for question in data.get("items", []):
+        for question in self._paginate(fetch, reached_end, _MAX_PAGES):
             question_id = question.get("question_id", "")
             item_id = f"so:{question_id}"
             if state.is_covered(item_id):
@@ -56,3 +95,25 @@ class StackOverflowCollector(BaseCollector):
             )
 
         return items
+
+    def _search_filter(self, state: StateManager) -> str | None:
+        """ID of a filter limited to FILTER_INCLUDE, created once and kept in state.
+
+        Filters are immutable, so the ID never needs refreshing. Falls back to
+        the default filter if it can't be created.
+        """
+        cached = state.get_cached(_FILTER_CACHE_KEY)
+        if cached and cached.get("include") == list(FILTER_INCLUDE):
+            self._count("cache_hits")
+            return cached["filter"]
+        try:
+            resp = self._get(
+                f"{STACKOVERFLOW_API_URL}/filters/create",
+                params={"include": ";".join(FILTER_INCLUDE), "base": "none", "unsafe": "false"},
+            )
+            search_filter = resp.json()["items"][0]["filter"]
+        except Exception as e:
+            logger.warning(f"[stackoverflow] Failed to create search filter: {e}")
+            return None
+        state.set_cached(_FILTER_CACHE_KEY, {"include": list(FILTER_INCLUDE), "filter": search_filter})
+        return search_filter
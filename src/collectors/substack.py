@@ -2,10 +2,9 @@
 
 import logging
 
-import feedparser
-
 from src.collectors.base import BaseCollector
-from src.config import SEARCH_KEYWORDS, SUBSTACK_FEEDS
+from src.collectors.keywords import SEARCH_MATCHER
+from src.config import SUBSTACK_FEEDS
 from src.models.data_models import ContentItem
 from src.state.state_manager import StateManager
 
@@ -28,19 +27,15 @@ class SubstackCollector(BaseCollector):
         return items
 
     def _parse_feed(self, url: str, state: StateManager) -> list[ContentItem]:
-        resp = self._get(url)
-        feed = feedparser.parse(resp.text)
-
         items: list[ContentItem] = []
-        for entry in feed.entries:
-            title = entry.get("title", "")
-            summary = entry.get("summary", "")
-            text = f"{title} {summary}".lower()
-
-            if not any(kw.lower() in text for kw in SEARCH_KEYWORDS):
+        for entry in self._read_feed(url, state):
+            title = entry.title
+            summary = entry.summary
+            matched = SEARCH_MATCHER.find(f"{title} {summary}")
+            if not matched:
                 continue
 
-            link = entry.get("link", "")
+            link = entry.link
             item_id = f"substack:{link}"
             if state.is_covered(item_id):
                 continue
@@ -52,10 +47,10 @@ class SubstackCollector(BaseCollector):
                     title=title,
                     url=link,
                     description=summary,
-                    author=entry.get("author", ""),
-                    published_at=entry.get("published", ""),
+                    author=entry.author,
+                    published_at=entry.published,
                     content_type="newsletter_article",
-                    metadata={"feed_url": url},
+                    metadata={"feed_url": url, "matched_keywords": matched},
                 )
             )
 
@@ -6,7 +6,8 @@ import logging
 from bs4 import BeautifulSoup
 
 from src.collectors.base import BaseCollector
-from src.config import SEARCH_KEYWORDS, TLDR_URL
+from src.collectors.keywords import SEARCH_MATCHER
+from src.config import TLDR_URL
 from src.models.data_models import ContentItem
 from src.state.state_manager import StateManager
 
@@ -19,8 +20,7 @@ class TldrNewsCollector(BaseCollector):
     name = "tldr_news"
 
     def collect(self, state: StateManager) -> list[ContentItem]:
-        resp = self._get(TLDR_URL)
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = BeautifulSoup(self._get_text(TLDR_URL), "html.parser")
 
         items: list[ContentItem] = []
         seen_urls: set[str] = set()
@@ -40,8 +40,8 @@ class TldrNewsCollector(BaseCollector):
             if len(title) < 10:
                 continue
 
-            combined = f"{title} {text_block}".lower()
-            if not any(kw.lower() in combined for kw in SEARCH_KEYWORDS):
+            matched = SEARCH_MATCHER.find(f"{title} {text_block}")
+            if not matched:
                 continue
 
             # Deduplicate by URL
@@ -62,6 +62,7 @@ class TldrNewsCollector(BaseCollector):
                     url=href,
                     description=text_block[:500],
                     content_type="tldr_mention",
+                    metadata={"matched_keywords": matched},
                 )
             )
 
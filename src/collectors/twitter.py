@@ -1,17 +1,50 @@
 """Collector for Twitter/X mentions via the Twitter API v2."""
 
 import logging
+import time
 
 from src.collectors.base import BaseCollector
-from src.config import TWITTER_API_URL
+from src.collectors.keywords import any_of_query
+from src.config import SEARCH_KEYWORDS, TWITTER_API_URL
 from src.models.data_models import ContentItem
 from src.state.state_manager import StateManager
 
 logger = logging.getLogger(__name__)
 
+# id and text come by default; ask only for the extra fields read below
+TWEET_FIELDS = "created_at,public_metrics,author_id"
+# Authors come back in the same response as includes.users
+USER_FIELDS = "username,name"
+
+# Recent search returns at most 100 tweets per request; follow next_token
+# for up to this many requests per run
+_PAGE_SIZE = 100
+_MAX_PAGES = 3
+# since_id: everything up to this tweet has been read. When a run runs out of
+# pages first, until_id (the oldest tweet read) and pending_newest (the newest)
+# let the next runs carry on below until_id; since_id moves to pending_newest
+# only once that walk reaches it.
+_SINCE_KEY = "twitter:since_id"
+_UNTIL_KEY = "twitter:until_id"
+_PENDING_KEY = "twitter:pending_newest"
+# Recent search only reaches back 7 days and rejects an older since_id
+_SEARCH_WINDOW_SECONDS = 7 * 24 * 3600
+_TWITTER_EPOCH_MS = 1288834974657
+
+
+def _tweet_time(tweet_id: str) -> float:
+    """Unix time a tweet was posted, from the timestamp in its snowflake ID."""
+    return ((int(tweet_id) >> 22) + _TWITTER_EPOCH_MS) / 1000
+
 
 class TwitterCollector(BaseCollector):
-    """Fetches recent tweets mentioning OpenClaw via Twitter API v2."""
+    """Fetches recent tweets mentioning OpenClaw via Twitter API v2.
+
+    Only tweets newer than the newest one fully read are requested
+    (``since_id``), so a run spends its page budget on tweets it hasn't
+    collected yet. A run that exhausts the budget leaves a resume point, and
+    the next run reads the rest of that window before moving on.
+    """
 
     name = "twitter"
 
@@ -24,33 +57,65 @@ class TwitterCollector(BaseCollector):
             "Authorization": f"Bearer {self.config.twitter_bearer_token}",
         }
         params = {
-            "query": "openclaw",
-            "max_results": 20,
-            "tweet.fields": "created_at,public_metrics,author_id",
+            "query": any_of_query(SEARCH_KEYWORDS),
+            "max_results": _PAGE_SIZE,
+            "tweet.fields": TWEET_FIELDS,
+            "expansions": "author_id",
+            "user.fields": USER_FIELDS,
         }
+        since_id = self._searchable(state.get_cursor(_SINCE_KEY))
+        until_id = self._searchable(state.get_cursor(_UNTIL_KEY))
+        pending_id = state.get_cursor(_PENDING_KEY) if until_id else None
+        if since_id:
+            params["since_id"] = since_id
+        if until_id:
+            params["until_id"] = until_id
 
-        resp = self._get(url, headers=headers, params=params)
-        data = resp.json()
+        tweets: list[dict] = []
+        users: dict[str, dict] = {}
+        newest_id = pending_id
+        oldest_id = None
+        complete = False
+        for _ in range(_MAX_PAGES):
+            data = self._get(url, headers=headers, params=params).json()
+            tweets.extend(data.get("data", []))
+            users.update((user["id"], user) for user in data.get("includes", {}).get("users", []))
+            meta = data.get("meta", {})
+            # Results are newest first, so the first page has the high-water mark
+            newest_id = newest_id or meta.get("newest_id")
+            oldest_id = meta.get("oldest_id") or oldest_id
+            next_token = meta.get("next_token")
+            if not next_token:
+                complete = True
+                break
+            params = {**params, "next_token": next_token}
 
         items: list[ContentItem] = []
-        for tweet in data.get("data", []):
+        for tweet in tweets:
             tweet_id = tweet["id"]
             item_id = f"tweet:{tweet_id}"
             if state.is_covered(item_id):
                 continue
 
             metrics = tweet.get("public_metrics", {})
+            user = users.get(tweet.get("author_id", ""), {})
+            username = user.get("username", "")
             items.append(
                 ContentItem(
                     id=item_id,
                     source=self.name,
                     title=tweet.get("text", "")[:120],
-                    url=f"https://twitter.com/i/web/status/{tweet_id}",
+                    url=(
+                        f"https://twitter.com/{username}/status/{tweet_id}"
+                        if username
+                        else f"https://twitter.com/i/web/status/{tweet_id}"
+                    ),
                     description=tweet.get("text", ""),
-                    author=tweet.get("author_id", ""),
+                    author=username or tweet.get("author_id", ""),
                     published_at=tweet.get("created_at", ""),
                     content_type="tweet",
                     metadata={
+                        "author_name": user.get("name", ""),
                         "like_count": metrics.get("like_count", 0),
                         "retweet_count": metrics.get("retweet_count", 0),
                         "reply_count": metrics.get("reply_count", 0),
@@ -59,4 +124,22 @@ class TwitterCollector(BaseCollector):
                 )
             )
 
+        if complete:
+            # Read down to since_id: everything up to the newest tweet is in
+            if newest_id:
+                state.set_cursor(_SINCE_KEY, newest_id)
+            state.set_cursor(_UNTIL_KEY, "")
+            state.set_cursor(_PENDING_KEY, "")
+        elif oldest_id:
+            logger.info(f"[twitter] Stopped after {_MAX_PAGES} pages; resuming below {oldest_id} next run.")
+            state.set_cursor(_UNTIL_KEY, oldest_id)
+            if newest_id:
+                state.set_cursor(_PENDING_KEY, newest_id)
         return items
+
+    @staticmethod
+    def _searchable(tweet_id: str | None) -> str | None:
+        """The ID, unless it's older than recent search reaches (the API rejects those)."""
+        if tweet_id and _tweet_time(tweet_id) > time.time() - _SEARCH_WINDOW_SECONDS + 3600:
+            return tweet_id
+        return None
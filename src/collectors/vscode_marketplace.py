@@ -9,6 +9,12 @@ from src.state.state_manager import StateManager
 
 logger = logging.getLogger(__name__)
 
+# ExtensionQueryFlags: only what the item needs, no files, asset URIs or version properties
+_INCLUDE_VERSIONS = 0x1
+_INCLUDE_STATISTICS = 0x100
+_INCLUDE_LATEST_VERSION_ONLY = 0x200
+QUERY_FLAGS = _INCLUDE_VERSIONS | _INCLUDE_STATISTICS | _INCLUDE_LATEST_VERSION_ONLY
+
 
 class VSCodeMarketplaceCollector(BaseCollector):
     """Fetches install count, rating, and version from VS Code Marketplace."""
@@ -24,7 +30,7 @@ class VSCodeMarketplaceCollector(BaseCollector):
                     ]
                 }
             ],
-            "flags": 914,
+            "flags": QUERY_FLAGS,
         }
 
         resp = self._post(
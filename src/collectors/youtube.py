@@ -1,14 +1,31 @@
 """Collector for YouTube videos about OpenClaw."""
 
 import logging
+from datetime import datetime, timedelta, timezone
 
 from src.collectors.base import BaseCollector
+from src.collectors.keywords import phrase_query
 from src.config import YOUTUBE_API_URL
 from src.models.data_models import ContentItem
 from src.state.state_manager import StateManager
 
 logger = logging.getLogger(__name__)
 
+# Partial response: only the search fields read below
+SEARCH_FIELDS = (
+    "nextPageToken,items(id/videoId,snippet(title,description,channelTitle,channelId,"
+    "publishedAt,thumbnails/high/url))"
+)
+STATISTICS_FIELDS = "items(id,statistics(viewCount,likeCount,commentCount))"
+# videos.list takes at most this many IDs per call
+_STATISTICS_BATCH = 50
+# Counts this old are still good enough for ranking
+_STATISTICS_TTL = timedelta(hours=12)
+# Each search page costs 100 quota units whatever its size, so catching up
+# asks for full pages of 50 and follows at most this many
+_CATCH_UP_PAGE_SIZE = 50
+_CATCH_UP_MAX_PAGES = 3
+
 
 class YouTubeCollector(BaseCollector):
     """Fetches OpenClaw-related videos via the YouTube Data API v3."""
@@ -19,21 +36,89 @@ class YouTubeCollector(BaseCollector):
         return bool(self.config.youtube_api_key)
 
     def collect(self, state: StateManager) -> list[ContentItem]:
+        items = self._search_all(lambda keyword: self._search(keyword, state))
+        self._add_statistics(items, state)
+        return items
+
+    def _add_statistics(self, items: list[ContentItem], state: StateManager) -> None:
+        """Attach view, like and comment counts, from the cache or batched videos.list calls.
+
+        Search results carry no statistics, so without these every video
+        would rank with zero engagement.
+        """
+        stats: dict[str, dict] = {}
+        missing: list[str] = []
+        for item in items:
+            video_id = item.id.removeprefix("yt:")
+            cached = state.get_cached(f"youtube:stats:{video_id}")
+            if cached is None:
+                missing.append(video_id)
+            else:
+                self._count("cache_hits")
+                stats[video_id] = cached
+
+        for i in range(0, len(missing), _STATISTICS_BATCH):
+            try:
+                resp = self._get(
+                    f"{YOUTUBE_API_URL}/videos",
+                    params={
+                        "part": "statistics",
+                        "id": ",".join(missing[i:i + _STATISTICS_BATCH]),
+                        "fields": STATISTICS_FIELDS,
+                        "key": self.config.youtube_api_key,
+                    },
+                )
+            except Exception as e:
+                logger.warning(f"[youtube] Failed to fetch video statistics: {e}")
+                break
+            for entry in resp.json().get("items", []):
+                raw = entry.get("statistics", {})
+                # Counts arrive as strings; likes and comments can be hidden
+                counts = {
+                    "view_count": int(raw.get("viewCount", 0)),
+                    "like_count": int(raw.get("likeCount", 0)),
+                    "comments": int(raw.get("commentCount", 0)),
+                }
+                stats[entry["id"]] = counts
+                state.set_cached(f"youtube:stats:{entry['id']}", counts, ttl=_STATISTICS_TTL)
+
+        for item in items:
+            item.metadata.update(stats.get(item.id.removeprefix("yt:"), {}))
+
+    def _search(self, keyword: str, state: StateManager) -> list[ContentItem]:
         search_url = f"{YOUTUBE_API_URL}/search"
         params = {
             "part": "snippet",
-            "q": "openclaw",
+            "q": phrase_query(keyword),
             "type": "video",
             "order": "date",
             "maxResults": 10,
+            "fields": SEARCH_FIELDS,
             "key": self.config.youtube_api_key,
         }
+        max_pages = 1
+        if self.catching_up:
+            # Results are newest first, so publishedAfter bounds the pages to the gap
+            since = datetime.now(timezone.utc) - self.lookback
+            params["publishedAfter"] = since.strftime("%Y-%m-%dT%H:%M:%SZ")
+            params["maxResults"] = _CATCH_UP_PAGE_SIZE
+            max_pages = _CATCH_UP_MAX_PAGES
 
-        resp = self._get(search_url, params=params)
-        data = resp.json()
+        # Pages are chained by nextPageToken, so they can't be fetched concurrently
+        entries: list[dict] = []
+        for _ in range(max_pages):
+            data = self._get(search_url, params=params).json()
+            page = data.get("items", [])
+            entries.extend(page)
+            next_token = data.get("nextPageToken")
+            if not next_token or any(
+                state.is_covered(f"yt:{entry.get('id', {}).get('videoId', '')}") for entry in page
+            ):
+                break
+            params = {**params, "pageToken": next_token}
 
         items: list[ContentItem] = []
-        for entry in data.get("items", []):
+        for entry in entries:
             video_id = entry.get("id", {}).get("videoId", "")
             if not video_id:
                 continue
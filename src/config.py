@@ -21,6 +21,8 @@ class Config:
     reddit_client_id: str = ""
     reddit_client_secret: str = ""
     reddit_user_agent: str = "OpenClawNewsletter/1.0"
+    # OAuth tokens cached between runs; empty means ~/.cache/openclaw-newsletter/tokens.json
+    token_cache_file: str = ""
     newsapi_key: str = ""
     discord_bot_token: str = ""
     moltbook_token: str = ""
@@ -36,11 +38,47 @@ class Config:
     request_timeout: int = 30
     max_retries: int = 3
     retry_backoff_factor: float = 2.0
+    # Open connections to every source host in parallel before collecting
+    prewarm_connections: bool = True
+
+    # Adaptive timeouts: each host's (connect, read) timeouts are derived from its
+    # latency history within these bounds; request_timeout is the read ceiling
+    min_connect_timeout: float = 3.0
+    max_connect_timeout: float = 10.0
+    min_read_timeout: float = 5.0
+    latency_history_size: int = 50
+
+    # Circuit breaker: consecutive failures before a collector or host is skipped,
+    # and the cooldown (doubling on each re-open) before it is probed again
+    circuit_failure_threshold: int = 3
+    circuit_cooldown_hours: float = 12
+    circuit_max_cooldown_hours: float = 168
 
     # State management
     state_file: str = "state.json"
     max_state_entries: int = 500
 
+    # Stage snapshots (collect -> assemble -> render -> send), one directory per issue date
+    snapshot_dir: str = "snapshots"
+    max_snapshots: int = 14
+
+    # Daemon mode: polled items wait in the inbox until the daily issue
+    inbox_file: str = "inbox.ndjson"
+    issue_time_utc: str = "08:00"
+
+    # Catch-up after missed runs: how far back collectors may reach, and how many
+    # extra pages they fetch at once
+    catchup_max_days: int = 14
+    catchup_concurrency: int = 4
+
+    # Searches run per keyword in SEARCH_KEYWORDS, this many at once per collector
+    search_concurrency: int = 4
+
+    # Run report: JSON history of per-run timings, kept to the last N runs.
+    # Kept out of docs/, which is committed and published
+    run_report_file: str = "run-report.json"
+    max_run_reports: int = 90
+
     # Site
     buttondown_username: str = "openclaw-newsletter"
     buttondown_api_key: str = ""
@@ -70,6 +108,7 @@ class Config:
             twitter_bearer_token=os.environ.get("TWITTER_BEARER_TOKEN", ""),
             reddit_client_id=os.environ.get("REDDIT_CLIENT_ID", ""),
             reddit_client_secret=os.environ.get("REDDIT_CLIENT_SECRET", ""),
+            token_cache_file=os.environ.get("TOKEN_CACHE_FILE", ""),
             newsapi_key=os.environ.get("NEWSAPI_KEY", ""),
             discord_bot_token=os.environ.get("DISCORD_BOT_TOKEN", ""),
             moltbook_token=os.environ.get("MOLTBOOK_TOKEN", ""),
@@ -77,6 +116,11 @@ class Config:
             eventbrite_token=os.environ.get("EVENTBRITE_TOKEN", ""),
             buttondown_api_key=os.environ.get("BUTTONDOWN_API_KEY", ""),
             site_url=os.environ.get("SITE_URL", ""),
+            run_report_file=os.environ.get("RUN_REPORT_FILE", cls.run_report_file),
+            snapshot_dir=os.environ.get("SNAPSHOT_DIR", cls.snapshot_dir),
+            inbox_file=os.environ.get("INBOX_FILE", cls.inbox_file),
+            issue_time_utc=os.environ.get("ISSUE_TIME_UTC", cls.issue_time_utc),
+            prewarm_connections=os.environ.get("PREWARM_CONNECTIONS", "1").lower() not in ("0", "false", "no"),
         )
         if not instance.site_url:
             logger.warning(
@@ -123,6 +167,8 @@ LEARNCLAW_URL = "https://learnclaw.ai/changelog"
 # Tech media
 HACKERNEWS_API_URL = "https://hn.algolia.com/api/v1/search"
 DEVTO_API_URL = "https://dev.to/api/articles"
+# Dev.to searches by tag, not text; list only tags that exist on dev.to
+DEVTO_TAGS = ["openclaw"]
 MEDIUM_RSS_URL = "https://medium.com/feed/tag/openclaw"
 LOBSTERS_RSS_URL = "https://lobste.rs/rss"
 CACM_RSS_URL = "https://cacm.acm.org/feed"
@@ -161,6 +207,8 @@ ARXIV_API_URL = "https://export.arxiv.org/api/query"
 
 # Social media
 TWITTER_API_URL = "https://api.twitter.com/2"
+REDDIT_TOKEN_URL = "https://www.reddit.com/api/v1/access_token"
+REDDIT_OAUTH_URL = "https://oauth.reddit.com"
 REDDIT_SUBREDDITS = ["LocalLLM", "artificial", "programming"]
 DISCORD_GUILD_ID = ""
 MOLTBOOK_API_URL = "https://moltbook.com/api/v1"
@@ -234,3 +282,61 @@ COLLECTOR_SECTION_MAP = {
     # Security (standalone — too important to bury)
     "security_feeds": "security",
 }
+
+# Sections whose items are merged when several collectors report the same
+# story. Releases and security items are per-package or per-advisory records,
+# so look-alike titles there are distinct entries and are kept apart.
+DEDUP_SECTIONS = {"community", "news"}
+
+# Daemon polling cadence per collector, in minutes. Fast-moving feeds are
+# polled often so items don't age out of their API's search window;
+# collectors not listed here run once a day.
+DEFAULT_COLLECTOR_INTERVAL = 24 * 60
+COLLECTOR_INTERVALS = {
+    "twitter": 30,
+    "hackernews": 60,
+    "reddit": 60,
+    "discord_feed": 60,
+    "lobsters": 120,
+    "github_activity": 120,
+    "moltbook": 120,
+    "devto": 180,
+    "github_releases": 180,
+    "security_feeds": 180,
+    "tech_news": 180,
+    "linkedin_news": 360,
+    "docker_hub": 360,
+    "npm_registry": 360,
+    "homebrew_stats": 360,
+    "vscode_marketplace": 360,
+    "youtube": 360,
+    "stackoverflow": 360,
+    "product_hunt": 360,
+    "medium": 360,
+    "substack": 360,
+}
+
+# Freshness TTLs per collector, in minutes. A collector that completed
+# within its TTL is skipped before any network I/O and reported as "fresh":
+# a manual re-run or a restarted daemon doesn't fetch them again. Each TTL is
+# shorter than the collector's cadence (the daily run, or its
+# COLLECTOR_INTERVALS entry) so scheduled runs always fetch.
+# Daily stats are keyed by date, so their TTL stays under a day. The registry
+# version checks are polled every 6 hours by the daemon so new releases show
+# up the same day; their TTL stays under that.
+COLLECTOR_FRESHNESS = {
+    "github_stats": 20 * 60,
+    "github_sponsors": 20 * 60,
+    "digitalocean": 20 * 60,
+    "docker_hub": 5 * 60,
+    "npm_registry": 5 * 60,
+    "homebrew_stats": 5 * 60,
+    "vscode_marketplace": 5 * 60,
+}
+
+# Runs are daily. When the last issue was published more than
+# CATCH_UP_AFTER_HOURS ago (runs failed, found nothing or were skipped),
+# collectors widen their windows to cover the gap and the issue is marked as
+# a catch-up issue.
+RUN_INTERVAL_HOURS = 24
+CATCH_UP_AFTER_HOURS = 36
@@ -0,0 +1,123 @@
+"""Long-running scheduler that polls each collector on its own cadence.
+
+Collectors run at the intervals in COLLECTOR_INTERVALS and their new items
+are appended to the inbox. Once a day, at ``Config.issue_time_utc``, the
+issue is generated from the inbox instead of a full collection pass, so it
+only has to assemble, render and send.
+
+Collector instances (and their HTTP sessions) are kept across polls.
+"""
+
+import heapq
+import logging
+import signal
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from src.collectors.base import BaseCollector
+from src.collectors.registry import CollectorSpec
+from src.config import COLLECTOR_INTERVALS, DEFAULT_COLLECTOR_INTERVAL, Config
+from src.state.inbox import Inbox
+from src.state.state_manager import StateManager
+from src.telemetry import HttpStats
+
+logger = logging.getLogger(__name__)
+
+# Spacing between the first polls so startup doesn't hit every source at once
+_STARTUP_STAGGER_SECONDS = 2.0
+
+
+def next_issue_time(issue_time_utc: str, now: datetime) -> datetime:
+    """The next occurrence of HH:MM UTC strictly after ``now``."""
+    hour, minute = (int(part) for part in issue_time_utc.split(":"))
+    candidate = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if candidate <= now:
+        candidate += timedelta(days=1)
+    return candidate
+
+
+class CollectorDaemon:
+    """Polls configured collectors into the inbox and triggers the daily issue."""
+
+    def __init__(
+        self,
+        config: Config,
+        collectors: list[CollectorSpec],
+        generate_issue: Callable[[Inbox], None],
+    ):
+        self.config = config
+        self.specs = [spec for spec in collectors if spec.is_configured(config)]
+        self.generate_issue = generate_issue
+        self.inbox = Inbox(config.inbox_file)
+        self._instances: dict[str, BaseCollector] = {}
+        self._stop = threading.Event()
+
+    def stop(self, *_args) -> None:
+        logger.info("Daemon stopping after the current step...")
+        self._stop.set()
+
+    @staticmethod
+    def interval_seconds(name: str) -> float:
+        return COLLECTOR_INTERVALS.get(name, DEFAULT_COLLECTOR_INTERVAL) * 60
+
+    def poll(self, spec: CollectorSpec) -> None:
+        """Run one collector and append its new items to the inbox."""
+        collector = self._instances.get(spec.name)
+        if collector is None:
+            collector = self._instances[spec.name] = spec.load()(self.config)
+        collector.stats = HttpStats()
+        # Reload state each poll so items published in the last issue are filtered
+        state = StateManager(self.config.state_file, self.config.max_state_entries)
+        result = collector.run(state)
+        added = self.inbox.add(result.items)
+        state.save()  # Persist advanced feed cursors
+        logger.info(
+            f"[{spec.name}] {added} new items queued ({len(self.inbox)} in inbox, "
+            f"{collector.stats.requests} requests, {collector.wall_time:.1f}s)"
+        )
+
+    def run(self) -> None:
+        signal.signal(signal.SIGTERM, self.stop)
+        now = time.time()
+        schedule = [
+            (now + i * _STARTUP_STAGGER_SECONDS, i, spec) for i, spec in enumerate(self.specs)
+        ]
+        heapq.heapify(schedule)
+        issue_at = next_issue_time(self.config.issue_time_utc, datetime.now(timezone.utc))
+        logger.info(
+            f"Daemon polling {len(self.specs)} collectors; next issue at {issue_at.isoformat()}"
+        )
+
+        try:
+            while not self._stop.is_set():
+                now = time.time()
+                if now >= issue_at.timestamp():
+                    logger.info(f"Generating issue from {len(self.inbox)} inbox items")
+                    try:
+                        self.generate_issue(self.inbox)
+                    except Exception:
+                        logger.exception(
+                            "Issue generation failed; re-run the failed stage "
+                            "(python -m src.main assemble/render/send) to finish it"
+                        )
+                    issue_at = next_issue_time(self.config.issue_time_utc, datetime.now(timezone.utc))
+                    continue
+
+                if not schedule:
+                    self._stop.wait(issue_at.timestamp() - now)
+                    continue
+                due, index, spec = schedule[0]
+                if due <= now:
+                    heapq.heappop(schedule)
+                    try:
+                        self.poll(spec)
+                    except Exception:
+                        logger.exception(f"[{spec.name}] Poll failed")
+                    heapq.heappush(schedule, (now + self.interval_seconds(spec.name), index, spec))
+                    continue
+
+                self._stop.wait(min(due, issue_at.timestamp()) - now)
+        except KeyboardInterrupt:
+            logger.info("Daemon interrupted")
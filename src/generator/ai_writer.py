@@ -2,16 +2,77 @@
 
 import logging
 import re
+import time
 from html import escape
 
 from src.config import Config
 from src.generator.prompts import SECTION_PROMPTS, SYSTEM_PROMPT
 from src.models.data_models import ContentItem
+from src.telemetry.spans import span
 
 logger = logging.getLogger(__name__)
 
 MAX_DESCRIPTION_LENGTH = 200
 
+# Raw characters cleaned on the first attempt at a description
+_CLEAN_WINDOW = 1024
+
+# Description cleaning steps, applied in order as (pattern, replacement,
+# opener). The opener finds a construct the pattern could still complete if
+# the text went on past the end of the window being cleaned.
+_CLEAN_STEPS: list[tuple[re.Pattern, str, re.Pattern | None]] = [
+    # HTML comments
+    (re.compile(r"<!--.*?-->", re.DOTALL), "", re.compile(r"<!--")),
+    # HTML tags
+    (re.compile(r"<[^>]+>"), "", re.compile(r"<")),
+    # Greptile bot boilerplate (the "Context used:" footer runs to the end)
+    (
+        re.compile(
+            r"Greptile (?:Overview|Summary|Confidence Score)[^\n]*|Context used:.*",
+            re.DOTALL,
+        ),
+        "",
+        None,
+    ),
+    # Markdown headings
+    (re.compile(r"#{1,6}\s+"), "", None),
+    # Markdown bold/italic
+    (re.compile(r"\*{1,2}([^*]+)\*{1,2}"), r"\1", re.compile(r"\*")),
+    # Markdown links [text](url) -> text
+    (
+        re.compile(r"\[([^\]]+)\]\([^)]+\)"),
+        r"\1",
+        re.compile(r"\[(?:[^\]]*|[^\]]*\]\([^)]*)\Z"),
+    ),
+    # Markdown images ![alt](url)
+    (re.compile(r"!\[[^\]]*\]\([^)]+\)"), "", None),
+    # Markdown code fences (matched pairs)
+    (re.compile(r"```[^`]*```", re.DOTALL), "", re.compile(r"```")),
+]
+# Horizontal rules and table rows, applied once all backticks are dropped
+_CLEAN_LINES = re.compile(r"^(?:[-*_]{3,}\s*|\|.*\|)$", re.MULTILINE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _clean_chunk(text: str, partial: bool = False) -> str:
+    """Run the description cleaning steps over a chunk of raw text.
+
+    With ``partial`` the chunk is a line-aligned prefix of a longer text.
+    Whenever a step leaves a construct open, the text is cut back to the
+    start of that line, so the result is always a prefix of what cleaning
+    the whole text would produce.
+    """
+    for pattern, repl, opener in _CLEAN_STEPS:
+        text = pattern.sub(repl, text)
+        if partial and opener is not None:
+            match = opener.search(text)
+            if match:
+                text = text[: text.rfind("\n", 0, match.start()) + 1]
+    # Orphaned fences and inline code only lose their backticks
+    text = text.replace("`", "")
+    text = _CLEAN_LINES.sub("", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
 
 class AIWriter:
     """Generates newsletter section HTML using the Claude API."""
@@ -19,6 +80,9 @@ class AIWriter:
     def __init__(self, config: Config):
         self.config = config
         self.client = None
+        self._description_cache: dict[str, str] = {}
+        # Per-section token usage and latency, read into the run report
+        self.section_usage: dict[str, dict] = {}
         if config.anthropic_api_key:
             try:
                 import anthropic
@@ -37,6 +101,10 @@ class AIWriter:
 
         Falls back to simple HTML list if the API is unavailable or the call fails.
         """
+        with span(f"section:{section_id}", items=len(items)):
+            return self._generate_section(section_id, items)
+
+    def _generate_section(self, section_id: str, items: list[ContentItem]) -> str:
         if not items:
             return ""
 
@@ -52,6 +120,7 @@ class AIWriter:
         data_text = self._format_items(items)
         user_prompt = prompt_template.format(data=data_text)
 
+        start = time.perf_counter()
         try:
             response = self.client.messages.create(
                 model=self.config.claude_model,
@@ -59,11 +128,23 @@ class AIWriter:
                 system=SYSTEM_PROMPT,
                 messages=[{"role": "user", "content": user_prompt}],
             )
+            usage = getattr(response, "usage", None)
+            self.section_usage[section_id] = {
+                "items": len(items),
+                "input_tokens": getattr(usage, "input_tokens", None),
+                "output_tokens": getattr(usage, "output_tokens", None),
+                "latency_s": round(time.perf_counter() - start, 3),
+            }
             content = response.content[0].text
             content = self._fix_truncated_html(content)
             logger.info("Generated AI content for section '%s' (%d chars)", section_id, len(content))
             return content
         except Exception:
+            self.section_usage[section_id] = {
+                "items": len(items),
+                "error": True,
+                "latency_s": round(time.perf_counter() - start, 3),
+            }
             logger.exception("Claude API call failed for section '%s'; using fallback", section_id)
             return self._fallback_html(items)
 
@@ -106,6 +187,8 @@ class AIWriter:
         # Aggregated scores (Reddit score, HN points, SO score)
         score += m.get("score", 0)
         score += m.get("points", 0)
+        # Views are cheap next to the signals above, so count a hundred as one
+        score += m.get("view_count", 0) // 100
         return score
 
     def _format_items(self, items: list[ContentItem]) -> str:
@@ -126,7 +209,7 @@ class AIWriter:
             if item.url:
                 lines.append(f"  URL: {item.url}")
             if item.description:
-                desc = self._clean_description(item.description)
+                desc = self._item_description(item)
                 if desc:
                     lines.append(f"  Description: {desc}")
             if item.author:
@@ -141,42 +224,36 @@ class AIWriter:
             parts.append("\n".join(lines))
         return "\n\n".join(parts)
 
+    def _item_description(self, item: ContentItem) -> str:
+        """Return the cleaned description for an item, cached by item ID."""
+        cached = self._description_cache.get(item.id)
+        if cached is None:
+            cached = self._clean_description(item.description)
+            self._description_cache[item.id] = cached
+        return cached
+
     @staticmethod
     def _clean_description(text: str) -> str:
-        """Clean and truncate a description for display."""
+        """Clean and truncate a description for display.
+
+        Only a leading window of the raw text is cleaned; the window doubles
+        until it yields enough text for MAX_DESCRIPTION_LENGTH or covers the
+        whole input, so multi-KB release bodies cost about the same as short ones.
+        """
         if not text:
             return ""
-        # Strip HTML comments
-        text = re.sub(r"<!--.*?-->", "", text, flags=re.DOTALL)
-        # Strip HTML tags
-        text = re.sub(r"<[^>]+>", "", text)
-        # Strip Greptile bot boilerplate
-        text = re.sub(
-            r"Greptile (?:Overview|Summary|Confidence Score)[^\n]*", "", text
-        )
-        text = re.sub(r"Context used:.*", "", text, flags=re.DOTALL)
-        # Strip markdown headings
-        text = re.sub(r"#{1,6}\s+", "", text)
-        # Strip markdown bold/italic
-        text = re.sub(r"\*{1,2}([^*]+)\*{1,2}", r"\1", text)
-        # Strip markdown links [text](url) -> text
-        text = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", text)
-        # Strip markdown images ![alt](url)
-        text = re.sub(r"!\[[^\]]*\]\([^)]+\)", "", text)
-        # Strip markdown code fences (matched pairs)
-        text = re.sub(r"```[^`]*```", "", text, flags=re.DOTALL)
-        # Strip orphaned triple-backtick markers (from truncated fences)
-        text = text.replace("```", "")
-        # Strip inline code backticks
-        text = re.sub(r"`([^`]*)`", r"\1", text)
-        # Strip any remaining stray backticks
-        text = text.replace("`", "")
-        # Strip markdown horizontal rules
-        text = re.sub(r"^[-*_]{3,}\s*$", "", text, flags=re.MULTILINE)
-        # Strip markdown table rows
-        text = re.sub(r"^\|.*\|$", "", text, flags=re.MULTILINE)
-        # Collapse whitespace
-        text = re.sub(r"\s+", " ", text).strip()
+        window = _CLEAN_WINDOW
+        while len(text) > window:
+            # Cut on a line boundary so line-anchored patterns see whole lines
+            cut = text.rfind("\n", 0, window)
+            if cut > 0:
+                cleaned = _clean_chunk(text[:cut], partial=True)
+                if len(cleaned) > MAX_DESCRIPTION_LENGTH:
+                    text = cleaned
+                    break
+            window *= 2
+        else:
+            text = _clean_chunk(text)
         # Take first meaningful chunk
         if len(text) > MAX_DESCRIPTION_LENGTH:
             text = text[:MAX_DESCRIPTION_LENGTH].rsplit(" ", 1)[0] + "..."
@@ -193,7 +270,7 @@ class AIWriter:
                 link = f'<a href="{escape(item.url)}">{title}</a>'
             else:
                 link = title
-            desc_clean = self._clean_description(item.description)
+            desc_clean = self._item_description(item)
             # Suppress description if it just repeats the title
             if desc_clean and not item.title.startswith(desc_clean[:40]):
                 desc = f" &mdash; {escape(desc_clean)}"
@@ -2,8 +2,9 @@
 
 import logging
 
-from src.config import Config, SECTIONS, COLLECTOR_SECTION_MAP
+from src.config import Config, SECTIONS, COLLECTOR_SECTION_MAP, DEDUP_SECTIONS
 from src.generator.ai_writer import AIWriter
+from src.generator.dedup import deduplicate
 from src.models.data_models import CollectorResult, ContentItem, NewsletterSection, NewsletterIssue
 
 logger = logging.getLogger(__name__)
@@ -16,42 +17,58 @@ class ContentAssembler:
         self.config = config
         self.ai_writer = AIWriter(config)
 
-    def assemble(self, collector_results: list[CollectorResult], issue_date: str) -> NewsletterIssue:
+    def assemble(
+        self,
+        collector_results: list[CollectorResult],
+        issue_date: str,
+        catch_up_since: str = "",
+    ) -> NewsletterIssue:
         """Group items into sections, generate AI content, return complete issue.
 
         Args:
             collector_results: Results from all collectors.
             issue_date: Date string (YYYY-MM-DD) for the newsletter issue.
+            catch_up_since: Date (YYYY-MM-DD) of the last issue when runs were
+                missed, so the issue is marked as covering everything since.
 
         Returns:
             A fully assembled NewsletterIssue.
         """
-        # 1. Group all items by section using COLLECTOR_SECTION_MAP
-        section_items: dict[str, list[ContentItem]] = {}
-        all_items: list[ContentItem] = []
+        # 1. Gather items from collectors that map to a section
+        collected: list[ContentItem] = []
 
         for result in collector_results:
             if result.error or result.skipped:
                 continue
-            section_id = COLLECTOR_SECTION_MAP.get(result.collector_name)
-            if not section_id:
+            if result.collector_name not in COLLECTOR_SECTION_MAP:
                 logger.warning(
                     "No section mapping for collector '%s'; skipping %d items",
                     result.collector_name,
                     len(result.items),
                 )
                 continue
-            section_items.setdefault(section_id, []).extend(result.items)
-            all_items.extend(result.items)
+            collected.extend(result.items)
+
+        # 2. Group by section, then merge the same story reported by several
+        # sources within a section, so no item leaves the section it belongs to
+        section_items: dict[str, list[ContentItem]] = {}
+        for item in collected:
+            section_items.setdefault(COLLECTOR_SECTION_MAP[item.source], []).append(item)
+        for section_id in DEDUP_SECTIONS & section_items.keys():
+            section_items[section_id] = deduplicate(
+                section_items[section_id], rank=self.ai_writer._engagement_score
+            )
+        all_items = [item for items in section_items.values() for item in items]
 
         logger.info(
-            "Grouped %d items into %d sections from %d collector results",
+            "Grouped %d items (%d before merging duplicates) into %d sections from %d collector results",
             len(all_items),
+            len(collected),
             len(section_items),
             len(collector_results),
         )
 
-        # 2. For each section in SECTIONS, generate content
+        # 3. For each section in SECTIONS, generate content
         sections: list[NewsletterSection] = []
 
         for section_def in SECTIONS:
@@ -85,8 +102,8 @@ class ContentAssembler:
             sections.append(section)
             logger.info("Built section '%s' with %d items", section_id, len(section.items))
 
-        # 3. Return the complete issue
-        issue = NewsletterIssue(date=issue_date, sections=sections)
+        # 4. Return the complete issue
+        issue = NewsletterIssue(date=issue_date, sections=sections, catch_up_since=catch_up_since)
         logger.info(
             "Assembled newsletter issue for %s: %d sections, %d total items",
             issue_date,
@@ -0,0 +1,221 @@
+"""Cross-source near-duplicate detection for collected items.
+
+The same story often arrives through several collectors (Hacker News,
+Lobsters, Dev.to, TLDR, NewsAPI) under different IDs. Items are linked when
+their canonical URLs match or their titles are near-duplicates by MinHash
+estimate, then each cluster is merged into its most-engaged item. A cluster
+holds at most one item per collector, so two distinct items from one source
+are never folded together through a third.
+
+Title candidates come from MinHash LSH banding, so the work grows roughly
+linearly with the number of items instead of comparing every pair.
+"""
+
+import logging
+import random
+import re
+from dataclasses import replace
+from typing import Callable
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from src.models.data_models import ContentItem
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that only track where a click came from, on any site
+_TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid"}
+# Short names that are tracking only on these sites (and their subdomains);
+# elsewhere "s", "ref" or "source" can select different content
+_HOST_TRACKING_PARAMS = {
+    "twitter.com": {"s", "t", "ref_src", "ref_url"},
+    "x.com": {"s", "t", "ref_src", "ref_url"},
+    "youtube.com": {"si", "feature", "pp"},
+    "youtu.be": {"si", "feature"},
+    "medium.com": {"source", "sk"},
+    "linkedin.com": {"trk", "trackingid"},
+    "reddit.com": {"share_id", "ref", "ref_source"},
+}
+_HOST_PREFIXES = ("www.", "m.", "mobile.")
+
+# Words too common in this newsletter's titles to say two stories are the same
+_STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "how",
+    "in", "is", "it", "its", "new", "of", "on", "or", "the", "this", "to",
+    "vs", "what", "why", "with", "you", "your", "openclaw", "hn", "show", "ask",
+}
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+# Titles need this many distinct content words to be compared at all
+_MIN_TITLE_TOKENS = 4
+# Minimum Jaccard similarity of title words to count as the same story
+_TITLE_SIMILARITY = 0.6
+
+# MinHash signature: _BANDS bands of _ROWS hashes. Pairs at the similarity
+# threshold share a band with probability > 0.99.
+_BANDS = 16
+_ROWS = 2
+_HASH_MASK = (1 << 64) - 1
+# Each signature slot XORs token hashes with its own random mask before taking the min
+_SLOT_MASKS = [random.Random(slot).getrandbits(64) for slot in range(_BANDS * _ROWS)]
+# Cap on comparisons per LSH bucket so a flood of identical titles stays linear
+_MAX_BUCKET_COMPARISONS = 32
+
+# Engagement counters summed across merged duplicates (see AIWriter._engagement_score)
+_ENGAGEMENT_KEYS = (
+    "like_count", "likes", "retweet_count", "quote_count", "shares", "upvotes",
+    "reply_count", "num_comments", "comments", "answer_count", "score", "points",
+    "view_count",
+)
+
+
+def _host_tracking_params(host: str) -> set[str]:
+    labels = host.split(".")
+    for i in range(len(labels) - 1):
+        params = _HOST_TRACKING_PARAMS.get(".".join(labels[i:]))
+        if params:
+            return params
+    return set()
+
+
+def canonicalize_url(url: str) -> str:
+    """Normalize a URL so tracking and cosmetic variants compare equal."""
+    if not url:
+        return ""
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url
+    host = (parts.hostname or "").lower()
+    for prefix in _HOST_PREFIXES:
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+    tracking = _TRACKING_PARAMS | _host_tracking_params(host)
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in tracking
+    )
+    path = parts.path.rstrip("/")
+    return urlunsplit(("https", host, path, urlencode(query), ""))
+
+
+def _title_tokens(title: str) -> frozenset[str]:
+    return frozenset(t for t in _TOKEN.findall(title.lower()) if t not in _STOPWORDS)
+
+
+def _minhash(tokens: frozenset[str]) -> list[int]:
+    # Built-in string hashes are salted per process, which is fine within one run
+    hashes = [hash(t) & _HASH_MASK for t in tokens]
+    return [min([h ^ mask for h in hashes]) for mask in _SLOT_MASKS]
+
+
+def _jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    return len(a & b) / len(a | b)
+
+
+class _DisjointSet:
+    """Union-find over item indexes that never puts two items from one source together."""
+
+    def __init__(self, sources: list[str]):
+        self.parent = list(range(len(sources)))
+        self.sources = [{source} for source in sources]
+
+    def find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, i: int, j: int) -> None:
+        root_i, root_j = self.find(i), self.find(j)
+        # Items from one collector already have distinct IDs, so a cluster that
+        # would hold two of them is joining different stories
+        if root_i == root_j or self.sources[root_i] & self.sources[root_j]:
+            return
+        # Keep the earliest item as the root so cluster order is stable
+        root, child = min(root_i, root_j), max(root_i, root_j)
+        self.parent[child] = root
+        self.sources[root] |= self.sources[child]
+
+
+def _is_count(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _merge(cluster: list[ContentItem], rank: Callable[[ContentItem], int]) -> ContentItem:
+    """Merge a cluster into its highest-ranked item, combining engagement."""
+    best = max(cluster, key=rank)
+    metadata = dict(best.metadata)
+    for key in _ENGAGEMENT_KEYS:
+        counts = [item.metadata[key] for item in cluster if _is_count(item.metadata.get(key))]
+        if counts:
+            metadata[key] = sum(counts)
+    for item in cluster:
+        for key, value in item.metadata.items():
+            metadata.setdefault(key, value)
+    metadata["also_on"] = sorted({item.source for item in cluster if item is not best})
+    return replace(
+        best,
+        description=best.description or next((i.description for i in cluster if i.description), ""),
+        metadata=metadata,
+    )
+
+
+def deduplicate(
+    items: list[ContentItem], rank: Callable[[ContentItem], int]
+) -> list[ContentItem]:
+    """Merge copies of the same story reported by different collectors.
+
+    Args:
+        items: One section's items, in display order. The merged item keeps
+            the winner's source, so items from other sections must not be
+            passed together or one would leave its section.
+        rank: Scores an item; the highest-scoring copy in a cluster is kept.
+
+    Returns:
+        The items with each duplicate cluster replaced by one merged item,
+        placed where the cluster's first item appeared.
+    """
+    sets = _DisjointSet([item.source for item in items])
+    by_url: dict[str, int] = {}
+    buckets: dict[tuple, list[int]] = {}
+    tokens: list[frozenset[str]] = []
+    for i, item in enumerate(items):
+        url = canonicalize_url(item.url)
+        if url:
+            first = by_url.setdefault(url, i)
+            if first != i:
+                sets.union(first, i)
+
+        tokens.append(_title_tokens(item.title))
+        if len(tokens[i]) < _MIN_TITLE_TOKENS:
+            continue
+        signature = _minhash(tokens[i])
+        for band in range(_BANDS):
+            key = (band, *signature[band * _ROWS:(band + 1) * _ROWS])
+            bucket = buckets.setdefault(key, [])
+            for j in bucket[:_MAX_BUCKET_COMPARISONS]:
+                if items[j].source != item.source and _jaccard(tokens[i], tokens[j]) >= _TITLE_SIMILARITY:
+                    sets.union(j, i)
+            bucket.append(i)
+
+    clusters: dict[int, list[ContentItem]] = {}
+    for i, item in enumerate(items):
+        clusters.setdefault(sets.find(i), []).append(item)
+
+    merged: list[ContentItem] = []
+    duplicate_clusters = 0
+    for cluster in clusters.values():
+        if len(cluster) == 1:
+            merged.append(cluster[0])
+        else:
+            merged.append(_merge(cluster, rank))
+            duplicate_clusters += 1
+    if duplicate_clusters:
+        logger.info(
+            "Merged %d cross-source duplicates into %d items",
+            len(items) - len(merged) + duplicate_clusters,
+            duplicate_clusters,
+        )
+    return merged
@@ -1,56 +1,30 @@
 """Main orchestrator for the OpenClaw Newsletter generator."""
 
+import argparse
 import logging
+import os
 import sys
-from datetime import date
-
-from src.config import Config
-from src.collectors.github_releases import GitHubReleasesCollector
-from src.collectors.github_activity import GitHubActivityCollector
-from src.collectors.github_stats import GitHubStatsCollector
-from src.collectors.github_sponsors import GitHubSponsorsCollector
-from src.collectors.clawhub_skills import ClawHubSkillsCollector
-from src.collectors.awesome_skills import AwesomeSkillsCollector
-from src.collectors.npm_registry import NpmRegistryCollector
-from src.collectors.homebrew_stats import HomebrewStatsCollector
-from src.collectors.docker_hub import DockerHubCollector
-from src.collectors.vscode_marketplace import VSCodeMarketplaceCollector
-from src.collectors.huggingface import HuggingFaceCollector
-from src.collectors.digitalocean import DigitalOceanCollector
-from src.collectors.blog_feed import BlogFeedCollector
-from src.collectors.showcase import ShowcaseCollector
-from src.collectors.docs_updates import DocsUpdatesCollector
-from src.collectors.learnclaw import LearnClawCollector
-from src.collectors.hackernews import HackerNewsCollector
-from src.collectors.devto import DevToCollector
-from src.collectors.medium import MediumCollector
-from src.collectors.lobsters import LobstersCollector
-from src.collectors.academic_news import AcademicNewsCollector
-from src.collectors.substack import SubstackCollector
-from src.collectors.tldr_news import TldrNewsCollector
-from src.collectors.claw360 import Claw360Collector
-from src.collectors.clawhunt import ClawhuntCollector
-from src.collectors.alternativeto import AlternativeToCollector
-from src.collectors.wikipedia import WikipediaCollector
-from src.collectors.product_hunt import ProductHuntCollector
-from src.collectors.stackoverflow import StackOverflowCollector
-from src.collectors.g2_learning import G2LearningCollector
-from src.collectors.security_feeds import SecurityFeedsCollector
-from src.collectors.arxiv_papers import ArxivPapersCollector
-from src.collectors.twitter import TwitterCollector
-from src.collectors.reddit import RedditCollector
-from src.collectors.linkedin_news import LinkedInNewsCollector
-from src.collectors.discord_feed import DiscordFeedCollector
-from src.collectors.moltbook import MoltbookCollector
-from src.collectors.youtube import YouTubeCollector
-from src.collectors.events import EventsCollector
-from src.collectors.tech_news import TechNewsCollector
+import threading
+from datetime import date, datetime, timedelta, timezone
+
+from src.config import CATCH_UP_AFTER_HOURS, Config
+from src.collectors.http_pool import known_hosts, prewarm
+from src.collectors.registry import CollectorSpec, select_collectors
 from src.generator.content_assembler import ContentAssembler
 from src.renderer.html_renderer import HTMLRenderer
 from src.renderer.archive_builder import ArchiveBuilder
 from src.renderer.rss_builder import RSSBuilder
 from src.renderer.email_sender import EmailSender
-from src.state.state_manager import StateManager
+from src.models.data_models import CollectorResult, NewsletterIssue
+from src.daemon import CollectorDaemon
+from src.state.circuit_breaker import CircuitBreaker
+from src.state.host_latency import HostLatency
+from src.state.inbox import Inbox
+from src.state.snapshots import MissingSnapshotError, SnapshotStore
+from src.state.state_manager import StateManager, time_since
+from src.telemetry import HttpStats, RunReport, add_span_hook, remove_span_hook, span
+from src.telemetry.profiler import StageProfiler
+from src.telemetry.tracing import SpanTracer
 
 logging.basicConfig(
     level=logging.INFO,
@@ -58,126 +32,366 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-ALL_COLLECTORS = [
-    # Tier 1: Core GitHub
-    GitHubReleasesCollector,
-    GitHubActivityCollector,
-    GitHubStatsCollector,
-    GitHubSponsorsCollector,
-    ClawHubSkillsCollector,
-    AwesomeSkillsCollector,
-    # Tier 2: Package Registries
-    NpmRegistryCollector,
-    HomebrewStatsCollector,
-    DockerHubCollector,
-    VSCodeMarketplaceCollector,
-    HuggingFaceCollector,
-    DigitalOceanCollector,
-    # Tier 3: Official Web
-    BlogFeedCollector,
-    ShowcaseCollector,
-    DocsUpdatesCollector,
-    LearnClawCollector,
-    # Tier 4: Tech Media
-    HackerNewsCollector,
-    DevToCollector,
-    MediumCollector,
-    LobstersCollector,
-    AcademicNewsCollector,
-    SubstackCollector,
-    TldrNewsCollector,
-    # Tier 5: Ecosystem
-    Claw360Collector,
-    ClawhuntCollector,
-    AlternativeToCollector,
-    WikipediaCollector,
-    ProductHuntCollector,
-    StackOverflowCollector,
-    G2LearningCollector,
-    # Tier 6: Security & Research
-    SecurityFeedsCollector,
-    ArxivPapersCollector,
-    # Tier 7-9: API-key sources
-    TwitterCollector,
-    RedditCollector,
-    LinkedInNewsCollector,
-    DiscordFeedCollector,
-    MoltbookCollector,
-    YouTubeCollector,
-    EventsCollector,
-    TechNewsCollector,
-]
-
-
-def main() -> None:
-    """Run the newsletter generation pipeline."""
+
+COMMANDS = ("run", "collect", "assemble", "render", "send", "daemon")
+
+# Longest the collect stage waits for connection pre-warming to finish
+_PREWARM_WAIT_SECONDS = 10
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the newsletter generation pipeline, or one stage of it."""
+    parser = argparse.ArgumentParser(
+        description="Generate the OpenClaw newsletter.",
+        epilog="Stages hand data to each other through snapshots under SNAPSHOT_DIR, so any "
+               "stage can be re-run without repeating the ones before it.",
+    )
+    parser.add_argument(
+        "command",
+        nargs="?",
+        default="run",
+        choices=COMMANDS,
+        help="stage to run: collect, assemble, render or send; 'run' (default) does all four; "
+             "'daemon' polls collectors on their own schedules and generates the issue daily",
+    )
+    parser.add_argument(
+        "--date",
+        metavar="YYYY-MM-DD",
+        help="issue date to assemble, render or send (default: the latest collection)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="send the email even if this issue was already sent",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="profiles",
+        metavar="DIR",
+        help="profile each stage with cProfile and tracemalloc, writing reports under DIR "
+             "(default: profiles/)",
+    )
+    parser.add_argument(
+        "--trace",
+        nargs="?",
+        const="trace.json",
+        metavar="PATH",
+        help="write a Chrome Trace Event timeline of the run, viewable in Perfetto "
+             "(default: trace.json)",
+    )
+    parser.add_argument(
+        "--otlp-endpoint",
+        default=os.environ.get("OTEL_EXPORTER_OTLP_ENDPOINT", ""),
+        metavar="URL",
+        help="also export spans as OTLP/HTTP JSON to this collector, e.g. http://localhost:4318",
+    )
+    parser.add_argument(
+        "--collectors",
+        type=lambda value: [name.strip() for name in value.split(",") if name.strip()],
+        metavar="NAMES",
+        help="comma-separated collector names to run instead of all of them",
+    )
+    args = parser.parse_args(argv)
+    try:
+        collectors = select_collectors(args.collectors)
+    except ValueError as e:
+        parser.error(str(e))
+
     config = Config.from_env()
-    today = date.today().isoformat()
+    if args.command == "daemon":
+        CollectorDaemon(
+            config, collectors, lambda inbox: generate_from_inbox(config, collectors, inbox)
+        ).run()
+        return
+
+    if args.command in ("run", "collect"):
+        issue_date = date.today().isoformat()
+    else:
+        issue_date = (
+            args.date or SnapshotStore.latest_date(config.snapshot_dir) or date.today().isoformat()
+        )
+    report = RunReport(config.run_report_file, config.max_run_reports)
+    report.data["date"] = issue_date
+    report.data["command"] = args.command
+
+    profiler = None
+    if args.profile:
+        run_dir = os.path.join(args.profile, datetime.now().strftime("%Y%m%d-%H%M%S"))
+        profiler = StageProfiler(run_dir)
+        add_span_hook(profiler)
+    tracer = None
+    if args.trace or args.otlp_endpoint:
+        tracer = SpanTracer()
+        add_span_hook(tracer)
+
+    status = "error"
+    try:
+        with span("run", date=issue_date, command=args.command):
+            status = run_pipeline(
+                config, args.command, issue_date, report, collectors, force_send=args.force
+            )
+    except MissingSnapshotError as e:
+        logger.error(str(e))
+        sys.exit(1)
+    finally:
+        report.finish(status)
+        report.save()
+        if profiler:
+            remove_span_hook(profiler)
+            profiler.write_summary()
+        if tracer:
+            remove_span_hook(tracer)
+            if args.trace:
+                tracer.write_chrome_trace(args.trace)
+            if args.otlp_endpoint:
+                tracer.export_otlp(args.otlp_endpoint)
+
+
+def generate_from_inbox(config: Config, collectors: list[CollectorSpec], inbox: Inbox) -> None:
+    """Daemon callback: build, render and send today's issue from the inbox."""
+    issue_date = date.today().isoformat()
+    report = RunReport(config.run_report_file, config.max_run_reports)
+    report.data["date"] = issue_date
+    report.data["command"] = "daemon"
+    status = "error"
+    try:
+        with span("run", date=issue_date, command="daemon"):
+            status = run_pipeline(config, "run", issue_date, report, collectors, inbox=inbox)
+    finally:
+        report.finish(status)
+        report.save()
 
-    logger.info(f"=== OpenClaw Newsletter Generation - {today} ===")
+
+def run_pipeline(
+    config: Config,
+    command: str,
+    issue_date: str,
+    report: RunReport,
+    collectors: list[CollectorSpec],
+    force_send: bool = False,
+    inbox: Inbox | None = None,
+) -> str:
+    """Run ``command`` for one issue date; returns the run status.
+
+    Stages that aren't being run read their input from the snapshots the
+    earlier stages wrote. With an ``inbox``, collection drains it instead
+    of running the collectors.
+    """
+    logger.info(f"=== OpenClaw Newsletter Generation - {issue_date} ({command}) ===")
+    store = SnapshotStore(config.snapshot_dir, issue_date)
+
+    if command in ("run", "collect"):
+        results, progress = collect_stage(config, report, collectors, store, inbox)
+    else:
+        results, progress = store.read_collection()
+    total_items = sum(len(r.items) for r in results)
+    if total_items == 0:
+        logger.info("No new content found. Skipping issue generation.")
+        return "no_content"
+    if command == "collect":
+        return "ok"
+
+    if command in ("run", "assemble"):
+        issue = assemble_stage(config, issue_date, report, results, progress, store)
+    else:
+        issue = store.read_issue()
+    if command == "assemble":
+        return "ok"
+
+    if command in ("run", "render"):
+        issue_filename = render_stage(config, report, issue, results, progress, store)
+    else:
+        issue_filename = store.rendered_filename()
+    if command == "render":
+        return "ok"
+
+    return send_stage(config, report, issue, issue_filename, store, force=force_send)
+
+
+def collect_stage(
+    config: Config,
+    report: RunReport,
+    collectors: list[CollectorSpec],
+    store: SnapshotStore,
+    inbox: Inbox | None = None,
+) -> tuple[list[CollectorResult], dict]:
+    """Run the collectors (or drain the inbox) and snapshot the results with their progress."""
+    # Open connections to the source hosts while state loads
+    warmer = None
+    if inbox is None and config.prewarm_connections:
+        warmer = threading.Thread(target=prewarm, args=(known_hosts(),), name="prewarm", daemon=True)
+        warmer.start()
 
     # 1. Load state
-    state = StateManager(config.state_file, config.max_state_entries)
+    with report.stage("load_state"):
+        state = StateManager(config.state_file, config.max_state_entries)
     logger.info(f"State loaded. Last run: {state.last_run}. Covered items: {len(state.state['covered_items'])}")
 
-    # 2. Collect from all sources
-    logger.info(f"Running {len(ALL_COLLECTORS)} collectors...")
+    if warmer is not None:
+        with report.stage("prewarm"):
+            # DNS lookups can't be timed out; don't let a stuck one hold up collection
+            warmer.join(timeout=_PREWARM_WAIT_SECONDS)
+
+    # 2. Collect from all sources, or from what the daemon already polled
     results = []
-    for collector_cls in ALL_COLLECTORS:
-        collector = collector_cls(config)
-        result = collector.run(state)
-        results.append(result)
+    with report.stage("collect"):
+        if inbox is not None:
+            logger.info(f"Draining {len(inbox)} items from the inbox...")
+            for result in inbox.results():
+                result.items = [item for item in result.items if not state.is_covered(item.id)]
+                report.record_collector(result, 0.0, HttpStats())
+                results.append(result)
+        else:
+            logger.info(f"Running {len(collectors)} collectors...")
+            for spec in collectors:
+                # Unconfigured collectors are skipped without importing their module
+                if not spec.is_configured(config):
+                    logger.info(f"[{spec.name}] Skipped (missing API key or unavailable).")
+                    result = CollectorResult(collector_name=spec.name, skipped=True)
+                    report.record_collector(result, 0.0, HttpStats())
+                else:
+                    collector = spec.load()(config)
+                    result = collector.run(state)
+                    report.record_collector(result, collector.wall_time, collector.stats)
+                results.append(result)
 
     # Count results
     total_items = sum(len(r.items) for r in results)
-    available = sum(1 for r in results if not r.skipped and r.error is None)
+    available = sum(
+        1 for r in results
+        if not r.skipped and not r.fresh and not r.circuit_open and r.error is None
+    )
     skipped = sum(1 for r in results if r.skipped)
+    fresh = sum(1 for r in results if r.fresh)
+    circuit_open = sum(1 for r in results if r.circuit_open)
     errors = sum(1 for r in results if r.error)
     logger.info(
         f"Collection complete: {total_items} items from {available} sources "
-        f"({skipped} skipped, {errors} errors)"
+        f"({skipped} skipped, {fresh} fresh, {circuit_open} circuit open, {errors} errors)"
     )
 
-    # 3. Gate check
+    open_circuits = CircuitBreaker.from_config(state, config).open_circuits()
+    report.record_circuits(open_circuits)
+    report.record_hosts(HostLatency.from_config(state, config).summary())
+    if open_circuits:
+        logger.info(f"Open circuits: {', '.join(sorted(open_circuits))}")
+
+    progress = state.progress()
+    with report.stage("snapshot"):
+        store.write_collection(results, progress)
+        store.prune(config.max_snapshots)
+    if inbox is not None:
+        inbox.clear()
+
+    # 3. Gate check - with nothing to publish, only the collectors' progress needs saving
     if total_items == 0:
-        logger.info("No new content found. Skipping issue generation.")
         state.save()
-        return
+    return results, progress
+
 
-    # 4-5. Categorize and generate via content assembler
+def assemble_stage(
+    config: Config,
+    issue_date: str,
+    report: RunReport,
+    results: list[CollectorResult],
+    progress: dict,
+    store: SnapshotStore,
+) -> NewsletterIssue:
+    """Categorize the collected items and generate section content."""
     assembler = ContentAssembler(config)
-    issue = assembler.assemble(results, today)
+    catch_up_since = _catch_up_since(progress.get("last_published"))
+    if catch_up_since:
+        logger.info(f"Runs missed since {catch_up_since}; assembling a catch-up issue.")
+    with report.stage("assemble"):
+        issue = assembler.assemble(results, issue_date, catch_up_since)
+    report.record_sections(assembler.ai_writer.section_usage)
     logger.info(
         f"Issue assembled: {len(issue.active_sections)} active sections, "
         f"{issue.total_items} total items"
     )
+    with report.stage("snapshot"):
+        store.write_issue(issue)
+    return issue
 
-    # 6. Render HTML
+
+def _catch_up_since(last_published: str | None) -> str:
+    """The last issue's date if it was long enough ago that runs were missed, else ''."""
+    gap = time_since(last_published)
+    if gap is None or gap <= timedelta(hours=CATCH_UP_AFTER_HOURS):
+        return ""
+    return (datetime.now(timezone.utc) - gap).strftime("%Y-%m-%d")
+
+
+def render_stage(
+    config: Config,
+    report: RunReport,
+    issue: NewsletterIssue,
+    results: list[CollectorResult],
+    progress: dict,
+    store: SnapshotStore,
+) -> str:
+    """Render the site pages, then record the published items in state."""
     renderer = HTMLRenderer(config)
-    issue_filename = renderer.render_issue(issue)
+    with report.stage("render:issue"):
+        issue_filename = renderer.render_issue(issue)
 
     archive = ArchiveBuilder(config)
-    archive.build()
+    with report.stage("render:archive"):
+        archive.build()
 
     rss = RSSBuilder(config)
-    rss.build()
-
-    latest = archive.get_latest_issue()
-    renderer.render_index(latest)
+    with report.stage("render:rss"):
+        rss.build()
 
-    # 7. Send email via Buttondown
-    sender = EmailSender(config)
-    if sender.is_available():
-        sender.send(issue, issue_filename)
-    else:
-        logger.info("Email sending skipped (no BUTTONDOWN_API_KEY)")
+    with report.stage("render:index"):
+        latest = archive.get_latest_issue()
+        renderer.render_index(latest)
+    store.mark_rendered(issue_filename)
 
-    # 8. Save state - mark all collected items as covered
-    for result in results:
-        state.mark_items_covered([item.id for item in result.items])
-    state.save()
+    # Save state - mark all collected items as covered now that they're published
+    with report.stage("save_state"):
+        state = StateManager(config.state_file, config.max_state_entries)
+        for result in results:
+            state.mark_items_covered([item.id for item in result.items])
+        # Re-rendering an older issue mustn't move cursors, breakers or the
+        # catch-up window back to where they were when it was collected
+        if store.issue_date == SnapshotStore.latest_date(config.snapshot_dir):
+            state.apply_progress(progress)
+            state.mark_published()
+        else:
+            logger.info(f"Rendered an older collection ({store.issue_date}); collector progress left as is.")
+        state.save()
 
     logger.info(f"=== Newsletter generated: docs/issues/{issue_filename} ===")
+    return issue_filename
+
+
+def send_stage(
+    config: Config,
+    report: RunReport,
+    issue: NewsletterIssue,
+    issue_filename: str,
+    store: SnapshotStore,
+    force: bool = False,
+) -> str:
+    """Email the rendered issue via Buttondown, at most once unless forced."""
+    sent_at = store.sent_at()
+    if sent_at and not force:
+        logger.info(f"Issue {issue.date} was already sent at {sent_at}; use --force to resend.")
+        return "ok"
+
+    sender = EmailSender(config)
+    if not sender.is_available():
+        logger.info("Email sending skipped (no BUTTONDOWN_API_KEY)")
+        return "ok"
+    with report.stage("email"):
+        sent = sender.send(issue, issue_filename)
+    if not sent:
+        logger.warning(f"Email failed; retry with: python -m src.main send --date {issue.date}")
+        return "send_failed"
+    store.mark_sent()
+    return "ok"
 
 
 if __name__ == "__main__":
@@ -45,6 +45,29 @@ class CollectorResult:
     items: list[ContentItem] = field(default_factory=list)
     error: Optional[str] = None
     skipped: bool = False  # True if collector was unavailable (missing API key)
+    fresh: bool = False  # True if collector ran within its freshness TTL and wasn't re-fetched
+    circuit_open: bool = False  # True if collector was skipped because its circuit breaker is open
+
+    def to_dict(self) -> dict:
+        return {
+            "collector_name": self.collector_name,
+            "items": [item.to_dict() for item in self.items],
+            "error": self.error,
+            "skipped": self.skipped,
+            "fresh": self.fresh,
+            "circuit_open": self.circuit_open,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CollectorResult":
+        return cls(
+            collector_name=data["collector_name"],
+            items=[ContentItem.from_dict(item) for item in data.get("items", [])],
+            error=data.get("error"),
+            skipped=data.get("skipped", False),
+            fresh=data.get("fresh", False),
+            circuit_open=data.get("circuit_open", False),
+        )
 
 
 @dataclass
@@ -60,6 +83,23 @@ class NewsletterSection:
     def has_content(self) -> bool:
         return bool(self.content_html) or bool(self.items)
 
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "title": self.title,
+            "content_html": self.content_html,
+            "items": [item.to_dict() for item in self.items],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "NewsletterSection":
+        return cls(
+            id=data["id"],
+            title=data["title"],
+            content_html=data.get("content_html", ""),
+            items=[ContentItem.from_dict(item) for item in data.get("items", [])],
+        )
+
 
 @dataclass
 class NewsletterIssue:
@@ -69,6 +109,8 @@ class NewsletterIssue:
     sections: list[NewsletterSection] = field(default_factory=list)
     generated_at: str = ""
     total_items: int = 0
+    # Set when runs were missed: the date of the last published issue this one covers from
+    catch_up_since: str = ""
 
     def __post_init__(self):
         if not self.generated_at:
@@ -79,3 +121,18 @@ class NewsletterIssue:
     @property
     def active_sections(self) -> list[NewsletterSection]:
         return [s for s in self.sections if s.has_content]
+
+    def to_dict(self) -> dict:
+        return {
+            "date": self.date,
+            "sections": [section.to_dict() for section in self.sections],
+            "generated_at": self.generated_at,
+            "total_items": self.total_items,
+            "catch_up_since": self.catch_up_since,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "NewsletterIssue":
+        fields = {k: v for k, v in data.items() if k in cls.__dataclass_fields__}
+        fields["sections"] = [NewsletterSection.from_dict(s) for s in data.get("sections", [])]
+        return cls(**fields)
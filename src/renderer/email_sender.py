@@ -43,6 +43,7 @@ class EmailSender:
         return template.render(
             issue=issue,
             date=self._format_date(issue.date),
+            catch_up_since=self._format_date(issue.catch_up_since),
             site_url=self.config.site_url,
         )
 
@@ -65,6 +65,7 @@ class HTMLRenderer:
         html = template.render(
             issue=issue,
             date=self._format_date(issue.date),
+            catch_up_since=self._format_date(issue.catch_up_since),
             og_title=og_title,
             og_description=og_description,
             og_url=og_url,
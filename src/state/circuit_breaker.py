@@ -0,0 +1,98 @@
+"""Circuit breaker for sources that keep failing, persisted in state.json.
+
+Each key (``collector:<name>`` or ``host:<hostname>``) counts consecutive
+failed runs; however many requests fail within one run, they count once.
+After ``threshold`` of them the circuit opens and the source is skipped
+until a cooldown passes; the cooldown doubles every time the circuit
+re-opens, up to a cap. Once the cooldown is over the circuit is half-open:
+one attempt per run is let through as a probe, closing the circuit on
+success and re-opening it on failure.
+"""
+
+import threading
+from datetime import datetime, timedelta, timezone
+
+from src.config import Config
+from src.state.state_manager import StateManager
+from src.telemetry.redact import redact
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker over ``state["circuits"]``."""
+
+    def __init__(
+        self,
+        state: StateManager,
+        threshold: int = 3,
+        base_cooldown_hours: float = 12,
+        max_cooldown_hours: float = 168,
+    ):
+        self.circuits: dict[str, dict] = state.state.setdefault("circuits", {})
+        self.run_id = state.run_id
+        self.threshold = threshold
+        self.base_cooldown = timedelta(hours=base_cooldown_hours)
+        self.max_cooldown = timedelta(hours=max_cooldown_hours)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, state: StateManager, config: Config) -> "CircuitBreaker":
+        return cls(
+            state,
+            config.circuit_failure_threshold,
+            config.circuit_cooldown_hours,
+            config.circuit_max_cooldown_hours,
+        )
+
+    def allow(self, key: str) -> bool:
+        """Return False while the circuit is open or another caller holds this run's probe.
+
+        Once the cooldown is over the circuit turns half-open and the first
+        caller in each run gets through as the probe.
+        """
+        with self._lock:
+            entry = self.circuits.get(key)
+            if not entry or entry["state"] == CLOSED:
+                return True
+            if entry["state"] == OPEN:
+                open_until = datetime.fromisoformat(entry["open_until"])
+                if datetime.now(timezone.utc) < open_until:
+                    return False
+                entry["state"] = HALF_OPEN
+            if entry.get("probe_run") == self.run_id:
+                return False
+            entry["probe_run"] = self.run_id
+            return True
+
+    def open_until(self, key: str) -> str | None:
+        entry = self.circuits.get(key)
+        return entry.get("open_until") if entry and entry["state"] != CLOSED else None
+
+    def record_success(self, key: str) -> None:
+        with self._lock:
+            self.circuits.pop(key, None)
+
+    def record_failure(self, key: str, error: str = "") -> None:
+        with self._lock:
+            entry = self.circuits.setdefault(key, {"state": CLOSED, "failures": 0, "opens": 0})
+            # state.json is committed, so no URL query strings (API keys) go in
+            entry["last_error"] = redact(error)[:200]
+            if entry["state"] == OPEN or (
+                entry["state"] == CLOSED and entry.get("failed_run") == self.run_id
+            ):
+                # Already counted (or opened) this run
+                return
+            entry["failures"] += 1
+            entry["failed_run"] = self.run_id
+            if entry["state"] == HALF_OPEN or entry["failures"] >= self.threshold:
+                cooldown = min(self.base_cooldown * 2 ** entry["opens"], self.max_cooldown)
+                entry["state"] = OPEN
+                entry["opens"] += 1
+                entry["open_until"] = (datetime.now(timezone.utc) + cooldown).isoformat()
+
+    def open_circuits(self) -> dict[str, dict]:
+        """Circuits that are currently open or awaiting a probe."""
+        return {key: dict(entry) for key, entry in self.circuits.items() if entry["state"] != CLOSED}
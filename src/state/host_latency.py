@@ -0,0 +1,89 @@
+"""Per-host response latency history, persisted in state.json.
+
+Each host keeps its most recent response times. Once enough samples exist,
+the p50 and p99 set the connect and read timeouts for that host, clamped to
+configured bounds: a host that normally answers in 200ms doesn't get 30s to
+hang, while a slow marketplace page still gets the time it usually needs.
+"""
+
+import math
+import threading
+
+from src.config import Config
+from src.state.state_manager import StateManager
+
+# Fewer samples than this and the configured defaults are used
+MIN_SAMPLES = 5
+# Timeouts are this many times the observed latency
+HEADROOM = 3.0
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class HostLatency:
+    """Rolling latency samples per host over ``state["host_latency"]``."""
+
+    def __init__(
+        self,
+        state: StateManager,
+        history_size: int = 50,
+        connect_bounds: tuple[float, float] = (3.0, 10.0),
+        read_bounds: tuple[float, float] = (5.0, 30.0),
+    ):
+        self.hosts: dict[str, list[float]] = state.state.setdefault("host_latency", {})
+        self.history_size = history_size
+        self.connect_bounds = connect_bounds
+        self.read_bounds = read_bounds
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, state: StateManager, config: Config) -> "HostLatency":
+        return cls(
+            state,
+            config.latency_history_size,
+            (config.min_connect_timeout, config.max_connect_timeout),
+            (config.min_read_timeout, config.request_timeout),
+        )
+
+    def record(self, host: str, seconds: float) -> None:
+        with self._lock:
+            samples = self.hosts.setdefault(host, [])
+            samples.append(round(seconds, 3))
+            del samples[:-self.history_size]
+
+    def percentiles(self, host: str) -> dict[str, float] | None:
+        samples = self.hosts.get(host)
+        if not samples:
+            return None
+        return {f"p{pct}": percentile(samples, pct) for pct in (50, 95, 99)}
+
+    def timeout(self, host: str) -> tuple[float, float]:
+        """(connect, read) timeouts for ``host``, from its history or the upper bounds."""
+        samples = self.hosts.get(host, [])
+        if len(samples) < MIN_SAMPLES:
+            return self.connect_bounds[1], self.read_bounds[1]
+        connect = _clamp(percentile(samples, 50) * HEADROOM, self.connect_bounds)
+        read = _clamp(percentile(samples, 99) * HEADROOM, self.read_bounds)
+        return round(connect, 2), round(read, 2)
+
+    def summary(self) -> dict[str, dict]:
+        """Percentiles and the derived timeouts for every host with history."""
+        result = {}
+        for host in sorted(self.hosts):
+            stats = self.percentiles(host)
+            if stats is None:
+                continue
+            connect, read = self.timeout(host)
+            result[host] = {**stats, "samples": len(self.hosts[host]),
+                            "connect_timeout": connect, "read_timeout": read}
+        return result
+
+
+def _clamp(value: float, bounds: tuple[float, float]) -> float:
+    low, high = bounds
+    return min(max(value, low), high)
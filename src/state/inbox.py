@@ -0,0 +1,74 @@
+"""Append-only inbox of items polled by the daemon between issues.
+
+Each line of the inbox file is one collected ContentItem. Items are
+deduplicated by ID on the way in, so a source that keeps returning the
+same results between issues doesn't pile up copies.
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+
+from src.models.data_models import CollectorResult, ContentItem
+
+logger = logging.getLogger(__name__)
+
+
+class Inbox:
+    """Items waiting for the next issue, persisted as NDJSON."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._ids: set[str] = {item.id for item in self._read()}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _read(self) -> list[ContentItem]:
+        if not os.path.exists(self.path):
+            return []
+        items = []
+        with open(self.path, encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    items.append(ContentItem.from_dict(json.loads(line)["item"]))
+                except (json.JSONDecodeError, KeyError, TypeError) as e:
+                    # A crash mid-append can leave a partial last line
+                    logger.warning(f"Skipping unreadable inbox line {line_no}: {e}")
+        return items
+
+    def add(self, items: list[ContentItem]) -> int:
+        """Append items not already in the inbox; returns how many were new."""
+        new = [item for item in items if item.id not in self._ids]
+        if not new:
+            return 0
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        collected_at = datetime.utcnow().isoformat()
+        with open(self.path, "a", encoding="utf-8") as f:
+            for item in new:
+                f.write(json.dumps({"collected_at": collected_at, "item": item.to_dict()},
+                                   ensure_ascii=False))
+                f.write("\n")
+        self._ids.update(item.id for item in new)
+        return len(new)
+
+    def results(self) -> list[CollectorResult]:
+        """The inbox grouped into one CollectorResult per source, in arrival order."""
+        grouped: dict[str, list[ContentItem]] = {}
+        seen: set[str] = set()
+        for item in self._read():
+            if item.id in seen:
+                continue
+            seen.add(item.id)
+            grouped.setdefault(item.source, []).append(item)
+        return [CollectorResult(collector_name=name, items=items) for name, items in grouped.items()]
+
+    def clear(self) -> None:
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self._ids.clear()
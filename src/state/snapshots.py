@@ -0,0 +1,151 @@
+"""Compressed NDJSON snapshots that hand data between pipeline stages.
+
+Each issue date gets its own directory under the snapshot root:
+
+    collection.ndjson.gz  header (collector progress), then one CollectorResult per line
+    issue.ndjson.gz       header (issue fields), then one NewsletterSection per line
+    rendered.json         filename of the rendered issue page
+    sent.json             when the issue was emailed
+
+Files are written under a temporary name and renamed into place, so a
+stage that dies part-way never leaves a truncated snapshot behind.
+"""
+
+import gzip
+import json
+import logging
+import os
+import shutil
+from datetime import datetime
+from typing import Iterable, Iterator
+
+from src.models.data_models import CollectorResult, NewsletterIssue, NewsletterSection
+
+logger = logging.getLogger(__name__)
+
+_COLLECTION = "collection.ndjson.gz"
+_ISSUE = "issue.ndjson.gz"
+_RENDERED = "rendered.json"
+_SENT = "sent.json"
+
+
+class MissingSnapshotError(FileNotFoundError):
+    """An earlier stage hasn't produced the snapshot this stage needs."""
+
+
+def _write_ndjson(path: str, rows: Iterable[dict]) -> None:
+    tmp_path = f"{path}.tmp"
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False))
+            f.write("\n")
+    os.replace(tmp_path, path)
+
+
+def _read_ndjson(path: str) -> Iterator[dict]:
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _write_json(path: str, data: dict) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+class SnapshotStore:
+    """Reads and writes the stage snapshots for one issue date."""
+
+    def __init__(self, root: str, issue_date: str):
+        self.root = root
+        self.issue_date = issue_date
+        self.directory = os.path.join(root, issue_date)
+
+    @staticmethod
+    def latest_date(root: str) -> str | None:
+        """The most recent issue date that has a collection snapshot."""
+        if not os.path.isdir(root):
+            return None
+        dates = [
+            name for name in os.listdir(root)
+            if os.path.exists(os.path.join(root, name, _COLLECTION))
+        ]
+        return max(dates) if dates else None
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def _require(self, name: str, stage: str) -> str:
+        path = self._path(name)
+        if not os.path.exists(path):
+            raise MissingSnapshotError(
+                f"No {name} for {self.issue_date} in {self.root}; run the '{stage}' stage first."
+            )
+        return path
+
+    def write_collection(self, results: list[CollectorResult], progress: dict) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        header = {"kind": "collection", "date": self.issue_date, "progress": progress}
+        _write_ndjson(self._path(_COLLECTION), [header, *(r.to_dict() for r in results)])
+        # A fresh collection invalidates anything built from the previous one
+        for name in (_ISSUE, _RENDERED):
+            if os.path.exists(self._path(name)):
+                os.remove(self._path(name))
+        logger.info(f"Wrote collection snapshot to {self._path(_COLLECTION)}")
+
+    def read_collection(self) -> tuple[list[CollectorResult], dict]:
+        """Return the collector results and the progress they recorded in state."""
+        rows = _read_ndjson(self._require(_COLLECTION, "collect"))
+        header = next(rows)
+        return [CollectorResult.from_dict(row) for row in rows], header.get("progress", {})
+
+    def write_issue(self, issue: NewsletterIssue) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        header = {k: v for k, v in issue.to_dict().items() if k != "sections"}
+        _write_ndjson(
+            self._path(_ISSUE),
+            [{"kind": "issue", **header}, *(s.to_dict() for s in issue.sections)],
+        )
+        logger.info(f"Wrote issue snapshot to {self._path(_ISSUE)}")
+
+    def read_issue(self) -> NewsletterIssue:
+        rows = _read_ndjson(self._require(_ISSUE, "assemble"))
+        header = next(rows)
+        header.pop("kind", None)
+        issue = NewsletterIssue.from_dict(header)
+        issue.sections = [NewsletterSection.from_dict(row) for row in rows]
+        return issue
+
+    def mark_rendered(self, issue_filename: str) -> None:
+        _write_json(self._path(_RENDERED), {
+            "issue_filename": issue_filename,
+            "rendered_at": datetime.utcnow().isoformat(),
+        })
+
+    def rendered_filename(self) -> str:
+        with open(self._require(_RENDERED, "render")) as f:
+            return json.load(f)["issue_filename"]
+
+    def mark_sent(self) -> None:
+        _write_json(self._path(_SENT), {"sent_at": datetime.utcnow().isoformat()})
+
+    def sent_at(self) -> str | None:
+        path = self._path(_SENT)
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return json.load(f).get("sent_at")
+
+    def prune(self, keep: int) -> None:
+        """Delete all but the newest ``keep`` issue dates."""
+        if not os.path.isdir(self.root):
+            return
+        dates = sorted(
+            name for name in os.listdir(self.root)
+            if os.path.isdir(os.path.join(self.root, name))
+        )
+        for name in dates[:-keep] if keep > 0 else []:
+            shutil.rmtree(os.path.join(self.root, name), ignore_errors=True)
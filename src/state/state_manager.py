@@ -3,7 +3,9 @@
 import json
 import logging
 import os
-from datetime import datetime
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +17,8 @@ class StateManager:
         self.state_file = state_file
         self.max_entries = max_entries
         self.state = self._load()
+        # Identifies this run (one load of state) in what collectors record
+        self.run_id = uuid.uuid4().hex
 
     def _load(self) -> dict:
         if os.path.exists(self.state_file):
@@ -56,7 +60,105 @@ class StateManager:
             # Convert to list to slice, then back to set
             self.state["covered_items"] = set(list(items)[-self.max_entries:])
             logger.info(f"Pruned state to {self.max_entries} entries.")
+        now = datetime.utcnow().isoformat()
+        cache = self.state.get("cache", {})
+        expired = [key for key, entry in cache.items() if entry.get("expires_at", now) < now]
+        for key in expired:
+            del cache[key]
+
+    def get_cursor(self, key: str) -> str | None:
+        """Return the stored high-water mark for a feed or query, if any."""
+        return self.state.get("cursors", {}).get(key)
+
+    def set_cursor(self, key: str, value: str) -> None:
+        self.state.setdefault("cursors", {})[key] = value
+
+    def collector_ran_at(self, name: str) -> str | None:
+        """When the collector last completed without error, if ever."""
+        return self.state.get("collector_runs", {}).get(name)
+
+    def mark_collector_ran(self, name: str) -> None:
+        self.state.setdefault("collector_runs", {})[name] = datetime.utcnow().isoformat()
+
+    def get_cached(self, key: str, max_age: timedelta | None = None) -> Any:
+        """Return a value stored with set_cached, or None if missing, expired or older than ``max_age``."""
+        entry = self.state.get("cache", {}).get(key)
+        if entry is None:
+            return None
+        now = datetime.utcnow()
+        if max_age is not None and now - datetime.fromisoformat(entry["stored_at"]) > max_age:
+            return None
+        if "expires_at" in entry and datetime.fromisoformat(entry["expires_at"]) <= now:
+            return None
+        return entry["value"]
+
+    def set_cached(self, key: str, value: Any, ttl: timedelta | None = None) -> None:
+        """Store a value; with a ``ttl`` it expires then and is pruned when state is saved."""
+        now = datetime.utcnow()
+        entry = {"value": value, "stored_at": now.isoformat()}
+        if ttl is not None:
+            entry["expires_at"] = (now + ttl).isoformat()
+        self.state.setdefault("cache", {})[key] = entry
+
+    def progress(self) -> dict:
+        """What collectors recorded during this run: cursors, run times, cache, circuits and latencies."""
+        return {
+            "cursors": dict(self.state.get("cursors", {})),
+            "cache": dict(self.state.get("cache", {})),
+            "collector_runs": dict(self.state.get("collector_runs", {})),
+            "circuits": dict(self.state.get("circuits", {})),
+            "host_latency": dict(self.state.get("host_latency", {})),
+            # When the previous issue was published, read back when assembling; not applied
+            "last_published": self.last_published,
+        }
+
+    def apply_progress(self, progress: dict) -> None:
+        """Commit what the latest collection recorded (see ``progress``) to state.
+
+        Run times and cache entries already in state are kept where they're
+        newer than the ones recorded.
+        """
+        if progress.get("cursors"):
+            self.state.setdefault("cursors", {}).update(progress["cursors"])
+        runs = self.state.setdefault("collector_runs", {})
+        for name, ran_at in progress.get("collector_runs", {}).items():
+            if ran_at > runs.get(name, ""):
+                runs[name] = ran_at
+        cache = self.state.setdefault("cache", {})
+        for key, entry in progress.get("cache", {}).items():
+            if entry.get("stored_at", "") >= cache.get(key, {}).get("stored_at", ""):
+                cache[key] = entry
+        # Closed circuits are dropped and latency histories trimmed, so replace instead of merging
+        for key in ("circuits", "host_latency"):
+            if key in progress:
+                self.state[key] = dict(progress[key])
 
     @property
     def last_run(self) -> str | None:
         return self.state.get("last_run")
+
+    @property
+    def last_published(self) -> str | None:
+        """When an issue was last published (ISO, UTC).
+
+        Unlike last_run, this doesn't move on runs that produced no issue
+        (nothing new, every collector failed) or on daemon polls.
+        """
+        return self.state.get("last_published")
+
+    def mark_published(self) -> None:
+        self.state["last_published"] = datetime.now(timezone.utc).isoformat()
+
+    def time_since_last_published(self) -> timedelta | None:
+        """How long ago the last issue was published, or None if none has been."""
+        return time_since(self.last_published)
+
+
+def time_since(timestamp: str | None) -> timedelta | None:
+    """Time elapsed since an ISO timestamp; naive ones are taken as UTC."""
+    if not timestamp:
+        return None
+    then = datetime.fromisoformat(timestamp)
+    if then.tzinfo is None:
+        then = then.replace(tzinfo=timezone.utc)
+    return datetime.now(timezone.utc) - then
@@ -0,0 +1,98 @@
+"""OAuth access tokens cached across runs in a private per-user file.
+
+Tokens are credentials, so they're kept out of state.json (which is
+committed to the repo) in a file under the user's cache directory that
+only the owner can read.
+
+The cache pays off for the daemon and for local runs. The scheduled
+GitHub Actions job starts each run with an empty home directory, so it
+fetches a new token every time. That is deliberate: Reddit's app-only
+tokens last 24 hours, about one daily run, and an Actions cache would
+make the token readable by workflows on other branches.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Treat a token as expired this long before it actually is
+_EXPIRY_MARGIN_SECONDS = 60
+
+
+def default_token_file() -> str:
+    """$XDG_CACHE_HOME/openclaw-newsletter/tokens.json, falling back to ~/.cache."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "openclaw-newsletter", "tokens.json")
+
+
+class TokenCache:
+    """Bearer tokens keyed by service and client ID, with their expiry times."""
+
+    def __init__(self, path: str = ""):
+        self.path = path or default_token_file()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(service: str, client_id: str) -> str:
+        # The client ID isn't secret, but there's no need to write it out either
+        return f"{service}:{hashlib.sha256(client_id.encode()).hexdigest()[:16]}"
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable token cache {self.path}: {e}")
+            return {}
+
+    def _write(self, tokens: dict) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(tokens, f)
+        os.chmod(tmp, 0o600)
+        os.replace(tmp, self.path)
+
+    def get(self, service: str, client_id: str) -> str | None:
+        """The cached token, or None if there isn't one or it's about to expire."""
+        with self._lock:
+            entry = self._read().get(self._key(service, client_id))
+        if not entry or entry.get("expires_at", 0) - _EXPIRY_MARGIN_SECONDS <= time.time():
+            return None
+        return entry.get("access_token")
+
+    def put(self, service: str, client_id: str, access_token: str, expires_in: float) -> None:
+        with self._lock:
+            tokens = self._read()
+            now = time.time()
+            # Drop other expired tokens while we're rewriting the file
+            tokens = {k: v for k, v in tokens.items() if v.get("expires_at", 0) > now}
+            tokens[self._key(service, client_id)] = {
+                "access_token": access_token,
+                "expires_at": now + expires_in,
+            }
+            try:
+                self._write(tokens)
+            except OSError as e:
+                logger.warning(f"Failed to write token cache {self.path}: {e}")
+
+    def drop(self, service: str, client_id: str) -> None:
+        """Forget a token the service rejected."""
+        with self._lock:
+            tokens = self._read()
+            if tokens.pop(self._key(service, client_id), None) is None:
+                return
+            try:
+                self._write(tokens)
+            except OSError as e:
+                logger.warning(f"Failed to write token cache {self.path}: {e}")
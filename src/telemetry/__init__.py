@@ -0,0 +1,3 @@
+from .redact import redact
+from .run_report import HttpStats, RunReport
+from .spans import add_span_hook, remove_span_hook, span
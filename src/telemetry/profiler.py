@@ -0,0 +1,136 @@
+"""Per-stage cProfile and tracemalloc capture for ``--profile`` runs."""
+
+import cProfile
+import io
+import logging
+import os
+import pstats
+import re
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+# Frames that belong to the measuring itself
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+)
+
+_UNSAFE_CHARS = re.compile(r"[^\w.-]+")
+
+
+@dataclass
+class _Frame:
+    name: str
+    profile: cProfile.Profile
+    snapshot: tracemalloc.Snapshot
+    start: float
+
+
+@dataclass
+class _StageResult:
+    name: str
+    seconds: float
+    net_alloc_kb: float
+    pstats_path: str
+    hot_spots: list[str]
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+
+
+class StageProfiler:
+    """Span hook that profiles every span separately.
+
+    cProfile can only have one active profiler per thread, so nested spans
+    pause the enclosing profiler: each .pstats file holds the time spent in
+    that stage excluding its child stages. Spans opened from other threads
+    are ignored, and HTTP calls are profiled as part of their collector.
+    """
+
+    skip_prefixes = ("http:",)
+
+    def __init__(self, output_dir: str, top: int = 10):
+        self.output_dir = output_dir
+        self.top = top
+        self._thread = threading.get_ident()
+        self._stack: list[_Frame] = []
+        self._results: list[_StageResult] = []
+        os.makedirs(output_dir, exist_ok=True)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def _ignored(self, name: str) -> bool:
+        return threading.get_ident() != self._thread or name.startswith(self.skip_prefixes)
+
+    def start(self, name: str, attrs: dict) -> None:
+        if self._ignored(name):
+            return
+        if self._stack:
+            self._stack[-1].profile.disable()
+        frame = _Frame(name, cProfile.Profile(), _snapshot(), 0.0)
+        self._stack.append(frame)
+        frame.start = time.perf_counter()
+        frame.profile.enable()
+
+    def end(self, name: str, attrs: dict, error: BaseException | None) -> None:
+        if self._ignored(name) or not self._stack:
+            return
+        frame = self._stack.pop()
+        frame.profile.disable()
+        seconds = time.perf_counter() - frame.start
+        self._write_stage(frame, seconds, _snapshot())
+        if self._stack:
+            self._stack[-1].profile.enable()
+
+    def _write_stage(self, frame: _Frame, seconds: float, snapshot: tracemalloc.Snapshot) -> None:
+        safe_name = _UNSAFE_CHARS.sub("_", frame.name)
+        base = os.path.join(self.output_dir, f"{len(self._results):03d}-{safe_name}")
+        frame.profile.dump_stats(f"{base}.pstats")
+
+        diffs = snapshot.compare_to(frame.snapshot, "lineno")
+        with open(f"{base}.alloc.txt", "w") as f:
+            f.write(f"Top {self.top} allocation changes in {frame.name}\n")
+            for stat in diffs[:self.top]:
+                f.write(f"{stat}\n")
+
+        stream = io.StringIO()
+        stats = pstats.Stats(frame.profile, stream=stream)
+        hot_spots = [
+            f"{func[2]} ({os.path.basename(func[0])}:{func[1]}) {row[2]:.3f}s"
+            for func, row in sorted(stats.stats.items(), key=lambda kv: -kv[1][2])[:3]
+        ]
+        self._results.append(_StageResult(
+            name=frame.name,
+            seconds=seconds,
+            net_alloc_kb=sum(d.size_diff for d in diffs) / 1024,
+            pstats_path=f"{base}.pstats",
+            hot_spots=hot_spots,
+        ))
+
+    def write_summary(self) -> str:
+        """Write summary.txt with stage timings and the run's top hot spots."""
+        path = os.path.join(self.output_dir, "summary.txt")
+        with open(path, "w") as f:
+            f.write("Stage wall time and net allocations (each .pstats excludes nested stages)\n\n")
+            for result in sorted(self._results, key=lambda r: -r.seconds):
+                f.write(f"{result.seconds * 1000:10.1f} ms {result.net_alloc_kb:10.1f} KB  "
+                        f"{result.name}\n")
+                for hot_spot in result.hot_spots:
+                    f.write(f"{'':28}{hot_spot}\n")
+
+            if self._results:
+                stream = io.StringIO()
+                stats = pstats.Stats(self._results[0].pstats_path, stream=stream)
+                for result in self._results[1:]:
+                    stats.add(result.pstats_path)
+                stats.sort_stats("tottime").print_stats(self.top * 2)
+                f.write("\nHot spots across all stages\n")
+                f.write(stream.getvalue())
+        logger.info(f"Profile written to {self.output_dir} (see summary.txt)")
+        return path
@@ -0,0 +1,37 @@
+"""Strip credentials from error text before it's written anywhere.
+
+Error messages end up in state.json, the run report and exported traces,
+some of which are committed. A requests ``HTTPError`` reads "... for url:
+<full URL>", and the query string carries API keys (YouTube ``key=``,
+NewsAPI ``apiKey=``), so query strings, URL userinfo and bearer tokens are
+removed before any of it is stored.
+"""
+
+import re
+
+# Everything after "?" in a URL (or urllib3's "with url: /path?..."), up to
+# whitespace or a closing quote/bracket
+_QUERY = re.compile(
+    r"((?:\b[a-z][a-z0-9+.-]*://|\burl: )[^\s?#'\"<>]*)\?[^\s'\"<>)\]]*", re.IGNORECASE
+)
+# user:password@ (or token@) in front of a URL's host
+_USERINFO = re.compile(r"(\b[a-z][a-z0-9+.-]*://)[^\s/@'\"<>]+@", re.IGNORECASE)
+_BEARER = re.compile(r"(\bBearer\s+)[A-Za-z0-9._~+/=-]+", re.IGNORECASE)
+# key=value / "key": "value" pairs whose name says they hold a secret
+_SECRET_FIELD = re.compile(
+    r"""(["']?\b(?:[a-z_]*_)?(?:api_?key|key|token|secret|password)["']?"""
+    r"""\s*[=:]\s*["']?)[^\s&'",}]+""",
+    re.IGNORECASE,
+)
+
+REDACTED = "[redacted]"
+
+
+def redact(text: str) -> str:
+    """``text`` with URL query strings, URL credentials and token values removed."""
+    if not text:
+        return text
+    text = _USERINFO.sub(r"\1", text)
+    text = _QUERY.sub(rf"\1?{REDACTED}", text)
+    text = _BEARER.sub(rf"\1{REDACTED}", text)
+    return _SECRET_FIELD.sub(rf"\1{REDACTED}", text)
@@ -0,0 +1,142 @@
+"""Machine-readable report of where each run spent its time and resources."""
+
+import json
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Iterator
+
+from src.models.data_models import CollectorResult
+from src.telemetry.redact import redact
+from src.telemetry.spans import span
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HttpStats:
+    """HTTP counters for one collector's run."""
+
+    requests: int = 0
+    bytes_downloaded: int = 0
+    retries: int = 0
+    cache_hits: int = 0  # requests not sent because a cached answer (state cache, token cache) was used
+    coalesced: int = 0  # GETs that shared another collector's in-flight response
+    oversized: list[str] = field(default_factory=list)  # URLs cut off at the collector's max_bytes
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident set size of this process in MB, if the platform reports it."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+class RunReport:
+    """Collects per-stage timings for one run and appends them to a JSON history.
+
+    The report file holds a list of runs, oldest first, capped at
+    ``max_entries`` so regressions can be spotted across days.
+    """
+
+    def __init__(self, path: str, max_entries: int = 90):
+        self.path = path
+        self.max_entries = max_entries
+        self._start = time.perf_counter()
+        self.data: dict = {
+            "started_at": datetime.utcnow().isoformat(),
+            "status": "running",
+            "stages": {},
+            "collectors": {},
+            "sections": {},
+        }
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a pipeline stage; nested or repeated names accumulate."""
+        start = time.perf_counter()
+        try:
+            with span(name):
+                yield
+        finally:
+            elapsed = time.perf_counter() - start
+            stages = self.data["stages"]
+            stages[name] = round(stages.get(name, 0.0) + elapsed, 4)
+
+    def record_collector(self, result: CollectorResult, wall_time: float, http: HttpStats) -> None:
+        if result.skipped:
+            status = "skipped"
+        elif result.fresh:
+            status = "fresh"
+        elif result.circuit_open:
+            status = "circuit_open"
+        elif result.error:
+            status = "error"
+        else:
+            status = "ok"
+        entry = {
+            "status": status,
+            "items": len(result.items),
+            "wall_time_s": round(wall_time, 4),
+            **asdict(http),
+        }
+        if result.error:
+            entry["error"] = redact(result.error)
+        self.data["collectors"][result.collector_name] = entry
+
+    def record_circuits(self, circuits: dict[str, dict]) -> None:
+        """Record the circuit breakers left open (or half-open) after collection."""
+        self.data["open_circuits"] = circuits
+
+    def record_hosts(self, hosts: dict[str, dict]) -> None:
+        """Record per-host latency percentiles and the timeouts derived from them."""
+        self.data["hosts"] = hosts
+
+    def record_sections(self, usage: dict[str, dict]) -> None:
+        """Record per-section Claude usage as reported by AIWriter."""
+        self.data["sections"].update(usage)
+
+    def finish(self, status: str) -> None:
+        self.data["status"] = status
+        self.data["duration_s"] = round(time.perf_counter() - self._start, 3)
+        self.data["peak_rss_mb"] = peak_rss_mb()
+        collectors = self.data["collectors"].values()
+        self.data["totals"] = {
+            "items": sum(c["items"] for c in collectors),
+            "http_requests": sum(c["requests"] for c in collectors),
+            "bytes_downloaded": sum(c["bytes_downloaded"] for c in collectors),
+            "retries": sum(c["retries"] for c in collectors),
+            "cache_hits": sum(c["cache_hits"] for c in collectors),
+            "coalesced": sum(c["coalesced"] for c in collectors),
+            "oversized_responses": sum(len(c["oversized"]) for c in collectors),
+        }
+
+    def save(self) -> None:
+        """Append this run to the report history file."""
+        history: list[dict] = []
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r") as f:
+                    history = json.load(f)
+            except (json.JSONDecodeError, IOError) as e:
+                logger.warning(f"Failed to load run report history: {e}. Starting fresh.")
+        if not isinstance(history, list):
+            history = []
+        history.append(self.data)
+        history = history[-self.max_entries:]
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "w") as f:
+            json.dump(history, f, indent=2)
+        logger.info(f"Run report written to {self.path} ({len(history)} runs kept).")
@@ -0,0 +1,47 @@
+"""Named spans around pipeline stages, observed by pluggable hooks.
+
+Code marks a unit of work with ``with span("collector:hackernews"):``.
+With no hooks registered a span costs a list check; profilers and tracers
+register a hook to be told when each span starts and ends.
+"""
+
+from contextlib import contextmanager
+from typing import Iterator, Protocol
+
+
+class SpanHook(Protocol):
+    def start(self, name: str, attrs: dict) -> None: ...
+
+    def end(self, name: str, attrs: dict, error: BaseException | None) -> None: ...
+
+
+_hooks: list[SpanHook] = []
+
+
+def add_span_hook(hook: SpanHook) -> None:
+    _hooks.append(hook)
+
+
+def remove_span_hook(hook: SpanHook) -> None:
+    if hook in _hooks:
+        _hooks.remove(hook)
+
+
+@contextmanager
+def span(name: str, **attrs) -> Iterator[dict]:
+    """Mark a unit of work; yields the attrs dict so callers can add to it."""
+    if not _hooks:
+        yield attrs
+        return
+    hooks = list(_hooks)
+    for hook in hooks:
+        hook.start(name, attrs)
+    error = None
+    try:
+        yield attrs
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        for hook in reversed(hooks):
+            hook.end(name, attrs, error)
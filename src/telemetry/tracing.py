@@ -0,0 +1,181 @@
+"""Span export to Chrome Trace Event JSON and, optionally, OTLP/HTTP.
+
+The Chrome trace opens directly in Perfetto (ui.perfetto.dev) or
+chrome://tracing, with one track per thread. OTLP export posts the same
+spans as OTLP/HTTP JSON to a local collector such as the OpenTelemetry
+Collector or Jaeger.
+"""
+
+import json
+import logging
+import os
+import secrets
+import threading
+import time
+from dataclasses import dataclass, field
+
+import requests
+
+from src.telemetry.redact import redact
+
+logger = logging.getLogger(__name__)
+
+_SERVICE_NAME = "openclaw-newsletter"
+
+
+@dataclass
+class _OpenSpan:
+    name: str
+    span_id: str
+    parent_id: str
+    start_ns: int
+
+
+@dataclass
+class _FinishedSpan:
+    name: str
+    span_id: str
+    parent_id: str
+    start_ns: int
+    end_ns: int
+    thread_id: int
+    thread_name: str
+    attrs: dict = field(default_factory=dict)
+    error: str = ""
+
+    @property
+    def category(self) -> str:
+        return self.name.split(":", 1)[0]
+
+
+class SpanTracer:
+    """Span hook that records every span for export as a timeline.
+
+    Spans nest per thread; a span opened on a worker thread with nothing
+    open there is parented to the run's first span.
+    """
+
+    def __init__(self):
+        self.trace_id = secrets.token_hex(16)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._spans: list[_FinishedSpan] = []
+        self._root_id = ""
+
+    def _stack(self) -> list[_OpenSpan]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def start(self, name: str, attrs: dict) -> None:
+        stack = self._stack()
+        span_id = secrets.token_hex(8)
+        parent_id = stack[-1].span_id if stack else self._root_id
+        if not self._root_id:
+            self._root_id = span_id
+        stack.append(_OpenSpan(name, span_id, parent_id, time.time_ns()))
+
+    def end(self, name: str, attrs: dict, error: BaseException | None) -> None:
+        stack = self._stack()
+        if not stack:
+            return
+        open_span = stack.pop()
+        thread = threading.current_thread()
+        finished = _FinishedSpan(
+            name=open_span.name,
+            span_id=open_span.span_id,
+            parent_id=open_span.parent_id,
+            start_ns=open_span.start_ns,
+            end_ns=time.time_ns(),
+            thread_id=thread.ident or 0,
+            thread_name=thread.name,
+            attrs=dict(attrs),
+            # repr() of an HTTPError includes the URL and its query string
+            error=redact(repr(error)) if error else "",
+        )
+        with self._lock:
+            self._spans.append(finished)
+
+    def write_chrome_trace(self, path: str) -> None:
+        """Write a Chrome Trace Event file of complete ("X") events."""
+        with self._lock:
+            spans = list(self._spans)
+        pid = os.getpid()
+        events: list[dict] = []
+        threads: dict[int, str] = {}
+        for s in spans:
+            threads[s.thread_id] = s.thread_name
+            args = {k: v for k, v in s.attrs.items() if v is not None}
+            if s.error:
+                args["error"] = s.error
+            events.append({
+                "name": s.name,
+                "cat": s.category,
+                "ph": "X",
+                "ts": s.start_ns / 1000,
+                "dur": (s.end_ns - s.start_ns) / 1000,
+                "pid": pid,
+                "tid": s.thread_id,
+                "args": args,
+            })
+        for tid, thread_name in threads.items():
+            events.append({
+                "name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                "args": {"name": thread_name},
+            })
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        logger.info(f"Trace with {len(spans)} spans written to {path}")
+
+    def export_otlp(self, endpoint: str, timeout: float = 10) -> None:
+        """Post the spans to an OTLP/HTTP collector (JSON encoding)."""
+        with self._lock:
+            spans = list(self._spans)
+        otlp_spans = []
+        for s in spans:
+            attributes = [
+                {"key": k, "value": _otlp_value(v)} for k, v in s.attrs.items() if v is not None
+            ]
+            attributes.append({"key": "thread.name", "value": {"stringValue": s.thread_name}})
+            otlp_spans.append({
+                "traceId": self.trace_id,
+                "spanId": s.span_id,
+                "parentSpanId": s.parent_id,
+                "name": s.name,
+                "kind": 3 if s.category == "http" else 1,  # CLIENT / INTERNAL
+                "startTimeUnixNano": str(s.start_ns),
+                "endTimeUnixNano": str(s.end_ns),
+                "attributes": attributes,
+                "status": {"code": 2, "message": s.error} if s.error else {},
+            })
+        payload = {
+            "resourceSpans": [{
+                "resource": {
+                    "attributes": [{"key": "service.name", "value": {"stringValue": _SERVICE_NAME}}],
+                },
+                "scopeSpans": [{"scope": {"name": "src.telemetry"}, "spans": otlp_spans}],
+            }],
+        }
+        url = endpoint.rstrip("/")
+        if not url.endswith("/v1/traces"):
+            url += "/v1/traces"
+        try:
+            resp = requests.post(url, json=payload, timeout=timeout)
+            resp.raise_for_status()
+            logger.info(f"Exported {len(otlp_spans)} spans to {url}")
+        except requests.RequestException as e:
+            logger.warning(f"OTLP export to {url} failed: {e}")
+
+
+def _otlp_value(value) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
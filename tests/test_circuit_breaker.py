@@ -0,0 +1,104 @@
+"""Circuit breaker state transitions across runs."""
+
+from datetime import datetime, timedelta, timezone
+
+from src.collectors.base import BaseCollector, CircuitOpenError
+from src.config import Config
+from src.state.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from src.state.state_manager import StateManager
+
+KEY = "host:example.com"
+
+
+def _breaker(state: StateManager, run_id: str) -> CircuitBreaker:
+    state.run_id = run_id
+    return CircuitBreaker(state, threshold=3, base_cooldown_hours=12, max_cooldown_hours=168)
+
+
+def _expire(state: StateManager) -> None:
+    past = datetime.now(timezone.utc) - timedelta(minutes=1)
+    state.state["circuits"][KEY]["open_until"] = past.isoformat()
+
+
+def test_failures_count_once_per_run(tmp_path):
+    state = StateManager(str(tmp_path / "state.json"))
+    breaker = _breaker(state, "run1")
+    for _ in range(5):
+        breaker.record_failure(KEY, "boom")
+    assert state.state["circuits"][KEY]["failures"] == 1
+    assert breaker.allow(KEY)
+
+    _breaker(state, "run2").record_failure(KEY)
+    breaker = _breaker(state, "run3")
+    breaker.record_failure(KEY)
+    assert state.state["circuits"][KEY]["state"] == OPEN
+    assert not breaker.allow(KEY)
+    assert breaker.open_until(KEY)
+
+
+def test_half_open_lets_one_probe_through_per_run(tmp_path):
+    state = StateManager(str(tmp_path / "state.json"))
+    for run in ("run1", "run2", "run3"):
+        _breaker(state, run).record_failure(KEY)
+    _expire(state)
+
+    breaker = _breaker(state, "run4")
+    assert breaker.allow(KEY)
+    assert state.state["circuits"][KEY]["state"] == HALF_OPEN
+    assert not breaker.allow(KEY)
+
+    # A later run gets its own probe while the first never reported back
+    assert _breaker(state, "run5").allow(KEY)
+
+
+def test_failed_probe_reopens_with_a_longer_cooldown(tmp_path):
+    state = StateManager(str(tmp_path / "state.json"))
+    for run in ("run1", "run2", "run3"):
+        _breaker(state, run).record_failure(KEY)
+    first_until = datetime.fromisoformat(state.state["circuits"][KEY]["open_until"])
+    _expire(state)
+
+    breaker = _breaker(state, "run4")
+    assert breaker.allow(KEY)
+    breaker.record_failure(KEY)
+    entry = state.state["circuits"][KEY]
+    assert entry["state"] == OPEN
+    assert entry["opens"] == 2
+    assert datetime.fromisoformat(entry["open_until"]) - first_until > timedelta(hours=11)
+
+
+def test_successful_probe_closes_the_circuit(tmp_path):
+    state = StateManager(str(tmp_path / "state.json"))
+    for run in ("run1", "run2", "run3"):
+        _breaker(state, run).record_failure(KEY)
+    _expire(state)
+
+    breaker = _breaker(state, "run4")
+    assert breaker.allow(KEY)
+    breaker.record_success(KEY)
+    assert KEY not in state.state["circuits"]
+    assert breaker.allow(KEY)
+    assert breaker.open_circuits() == {}
+
+
+def test_last_error_is_redacted(tmp_path):
+    state = StateManager(str(tmp_path / "state.json"))
+    _breaker(state, "run1").record_failure(
+        KEY, "403 Client Error: Forbidden for url: https://example.com/v3/search?q=x&key=SECRET"
+    )
+    entry = state.state["circuits"][KEY]
+    assert entry["state"] == CLOSED
+    assert "SECRET" not in entry["last_error"]
+
+
+def test_open_host_circuit_does_not_count_against_the_collector(tmp_path):
+    class Blocked(BaseCollector):
+        name = "blocked"
+
+        def collect(self, state):
+            raise CircuitOpenError("Circuit open for example.com")
+
+    state = StateManager(str(tmp_path / "state.json"))
+    result = Blocked(Config()).run(state)
+    assert result.error
+    assert "collector:blocked" not in state.state.get("circuits", {})
@@ -0,0 +1,71 @@
+"""Cross-source duplicate merging."""
+
+from src.config import Config
+from src.generator.content_assembler import ContentAssembler
+from src.generator.dedup import canonicalize_url, deduplicate
+from src.models.data_models import CollectorResult, ContentItem
+
+
+def _points(item: ContentItem) -> int:
+    return item.metadata.get("points", 0)
+
+
+def test_same_url_across_sources_merges_into_most_engaged():
+    items = [
+        ContentItem(id="lobsters:1", source="lobsters", title="A", url="https://example.com/post?utm_source=x",
+                    metadata={"points": 5}),
+        ContentItem(id="hn:1", source="hackernews", title="B", url="https://www.example.com/post/",
+                    metadata={"points": 40}),
+    ]
+    merged = deduplicate(items, rank=_points)
+    assert len(merged) == 1
+    assert merged[0].id == "hn:1"
+    assert merged[0].metadata["points"] == 45
+    assert merged[0].metadata["also_on"] == ["lobsters"]
+
+
+def test_same_source_items_are_not_joined_through_a_third():
+    # Both HN stories link to one post; the dev.to copy matches either by URL
+    items = [
+        ContentItem(id="hn:1", source="hackernews", title="First", url="https://example.com/post"),
+        ContentItem(id="devto:1", source="devto", title="Copy", url="https://example.com/post"),
+        ContentItem(id="hn:2", source="hackernews", title="Second", url="https://example.com/post"),
+    ]
+    merged = deduplicate(items, rank=_points)
+    assert sorted(item.id for item in merged) == ["hn:1", "hn:2"]
+
+
+def test_near_duplicate_titles_merge():
+    items = [
+        ContentItem(id="hn:1", source="hackernews", title="OpenClaw ships plugin sandbox for local agents"),
+        ContentItem(id="devto:1", source="devto", title="OpenClaw ships a plugin sandbox for local agents"),
+        ContentItem(id="devto:2", source="devto", title="Benchmarking vector databases on laptops"),
+    ]
+    merged = deduplicate(items, rank=_points)
+    assert [item.id for item in merged] == ["hn:1", "devto:2"]
+
+
+def test_tracking_params_are_only_dropped_on_sites_that_use_them():
+    assert canonicalize_url("https://x.com/a/status/1?s=20&t=abc") == "https://x.com/a/status/1"
+    assert canonicalize_url("https://youtu.be/abc?si=xyz") == "https://youtu.be/abc"
+    assert canonicalize_url("https://blog.medium.com/p?source=rss") == "https://blog.medium.com/p"
+    assert canonicalize_url("https://example.com/search?s=claw") == "https://example.com/search?s=claw"
+    assert canonicalize_url("https://github.com/o/r/blob/x?ref=dev") == "https://github.com/o/r/blob/x?ref=dev"
+    assert canonicalize_url("https://example.com/p?fbclid=1&utm_medium=x") == "https://example.com/p"
+
+
+def test_items_stay_in_their_own_section():
+    repo = "https://github.com/openclaw/openclaw"
+    results = [
+        CollectorResult(collector_name="github_stats", items=[
+            ContentItem(id="github_stats:openclaw", source="github_stats", title="openclaw/openclaw", url=repo),
+        ]),
+        CollectorResult(collector_name="hackernews", items=[
+            ContentItem(id="hn:1", source="hackernews", title="OpenClaw", url=repo, metadata={"points": 300}),
+        ]),
+    ]
+    issue = ContentAssembler(Config()).assemble(results, "2026-01-01")
+    sections = {section.id: section for section in issue.sections}
+    assert [item.id for item in sections["releases"].items] == ["github_stats:openclaw"]
+    assert [item.id for item in sections["news"].items] == ["hn:1"]
+    assert "also_on" not in sections["news"].items[0].metadata
@@ -0,0 +1,46 @@
+"""Feed parsing against a cursor."""
+
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from src.collectors.base import BaseCollector
+from src.collectors.feed_reader import parse_feed_stream
+from src.config import Config
+from src.state.state_manager import StateManager
+
+_FEED = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel>
+<item><title>Updated</title><link>https://example.com/a</link><pubDate>Mon, 05 Jan 2026 10:00:00 GMT</pubDate></item>
+<item><title>Old</title><link>https://example.com/b</link><pubDate>Thu, 01 Jan 2026 10:00:00 GMT</pubDate></item>
+<item><title>Unseen</title><link>https://example.com/c</link><pubDate>Sun, 04 Jan 2026 10:00:00 GMT</pubDate></item>
+<item><title>Future</title><link>https://example.com/d</link><pubDate>Fri, 01 Jan 2100 00:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+
+class _FeedCollector(BaseCollector):
+    name = "feed_test"
+
+    def collect(self, state):
+        return []
+
+    @contextmanager
+    def _stream(self, url, max_bytes=None, **kwargs):
+        class Body:
+            @staticmethod
+            def chunks():
+                return iter([_FEED[:200], _FEED[200:]])
+        yield Body()
+
+
+def test_older_entries_are_skipped_without_stopping():
+    since = datetime(2026, 1, 3, tzinfo=timezone.utc)
+    entries = parse_feed_stream(iter([_FEED]), since)
+    assert [e.title for e in entries] == ["Updated", "Unseen", "Future"]
+
+
+def test_cursor_is_capped_at_now(tmp_path):
+    state = StateManager(str(tmp_path / "state.json"))
+    collector = _FeedCollector(Config())
+    collector._read_feed("https://example.com/feed", state)
+    cursor = datetime.fromisoformat(state.get_cursor("feed_test:https://example.com/feed"))
+    assert cursor <= datetime.now(timezone.utc)
@@ -0,0 +1,90 @@
+"""Streaming key extraction from large JSON documents."""
+
+import json
+import random
+
+from src.collectors.json_stream import extract_json
+
+
+def _chunked(data: bytes, size: int) -> list[bytes]:
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def _lookup(document, path):
+    for key in path:
+        if not isinstance(document, dict) or key not in document:
+            return None
+        document = document[key]
+    return document
+
+
+_PACKUMENT = {
+    "name": "openclaw",
+    "versions": {
+        f"1.{i}.0": {"description": 'a "quoted" \\ desc ü', "deps": {"x": [1, 2, {"time": "nope"}]}}
+        for i in range(50)
+    },
+    "time": {"created": "2025-01-01T00:00:00Z", "1.49.0": "2026-01-02T03:04:05Z", "1.0.0": None},
+    "tags": ["a", {"time": "in an array"}],
+}
+
+
+def test_matches_json_loads_at_every_chunk_size():
+    data = json.dumps(_PACKUMENT, ensure_ascii=False).encode()
+    paths = [("time", "1.49.0"), ("time", "1.0.0"), ("name",), ("time", "missing"), ("versions", "1.3.0", "deps")]
+    expected = {path: _lookup(_PACKUMENT, path) for path in paths if _lookup(_PACKUMENT, path) is not None}
+    expected[("time", "1.0.0")] = None
+    for size in (1, 2, 3, 7, 64, 4096, len(data)):
+        assert extract_json(_chunked(data, size), paths) == expected, size
+
+
+def test_paths_through_arrays_and_missing_keys_are_absent():
+    data = json.dumps(_PACKUMENT).encode()
+    assert extract_json([data], [("tags", "time"), ("nope",)]) == {}
+
+
+def test_stops_reading_once_everything_is_found():
+    data = json.dumps({"time": {"1.0.0": "t"}, "versions": {}}).encode()
+    consumed = []
+
+    def chunks():
+        for chunk in _chunked(data, 4):
+            consumed.append(chunk)
+            yield chunk
+        raise AssertionError("read past the wanted key")
+
+    assert extract_json(chunks(), [("time", "1.0.0")]) == {("time", "1.0.0"): "t"}
+    assert len(consumed) < len(_chunked(data, 4))
+
+
+def test_random_documents_agree_with_json_loads():
+    rng = random.Random(42)
+
+    def value(depth):
+        kind = rng.randrange(6 if depth < 3 else 4)
+        if kind == 0:
+            return rng.choice([None, True, False, -1.5e3, 0, 17])
+        if kind in (1, 2):
+            return "".join(rng.choice('ab"\\/\n{}[]:,ü ') for _ in range(rng.randrange(6)))
+        if kind == 3:
+            return rng.randrange(1000)
+        if kind == 4:
+            return [value(depth + 1) for _ in range(rng.randrange(4))]
+        return {rng.choice("abc") + str(i): value(depth + 1) for i in range(rng.randrange(4))}
+
+    for _ in range(200):
+        document = {f"k{i}": value(0) for i in range(rng.randrange(1, 5))}
+        data = json.dumps(document, ensure_ascii=rng.random() < 0.5).encode()
+        paths = {("k0",), ("k1", "a0"), ("k2", "b1", "c0"), ("k0", "a1")}
+        expected = {}
+        for path in paths:
+            node, ok = document, True
+            for key in path:
+                if isinstance(node, dict) and key in node:
+                    node = node[key]
+                else:
+                    ok = False
+                    break
+            if ok:
+                expected[path] = node
+        assert extract_json(_chunked(data, rng.randrange(1, 20)), paths) == expected
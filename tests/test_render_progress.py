@@ -0,0 +1,65 @@
+"""Rendering commits collector progress to state only for the latest collection."""
+
+from src.config import Config
+from src.main import render_stage
+from src.models.data_models import CollectorResult, ContentItem, NewsletterIssue, NewsletterSection
+from src.state.snapshots import SnapshotStore
+from src.state.state_manager import StateManager
+from src.telemetry import RunReport
+
+
+def _render(config: Config, issue_date: str, progress: dict) -> None:
+    store = SnapshotStore(config.snapshot_dir, issue_date)
+    item = ContentItem(id=f"hn:{issue_date}", source="hackernews", title="Story", url="https://example.com")
+    results = [CollectorResult(collector_name="hackernews", items=[item])]
+    store.write_collection(results, progress)
+    issue = NewsletterIssue(
+        date=issue_date,
+        sections=[NewsletterSection(id="news", title="News", content_html="<p>x</p>", items=[item])],
+    )
+    report = RunReport(str(config.run_report_file))
+    render_stage(config, report, issue, results, progress, store)
+
+
+def _config(tmp_path) -> Config:
+    return Config(
+        state_file=str(tmp_path / "state.json"),
+        snapshot_dir=str(tmp_path / "snapshots"),
+        docs_dir=str(tmp_path / "docs"),
+        issues_dir=str(tmp_path / "docs" / "issues"),
+        run_report_file=str(tmp_path / "run-report.json"),
+    )
+
+
+def test_rerendering_an_older_issue_keeps_newer_progress(tmp_path):
+    config = _config(tmp_path)
+    old = {
+        "cursors": {"lobsters:feed": "2026-01-01T00:00:00+00:00"},
+        "collector_runs": {"hackernews": "2026-01-01T08:00:00"},
+        "circuits": {},
+    }
+    new = {
+        "cursors": {"lobsters:feed": "2026-01-02T00:00:00+00:00"},
+        "collector_runs": {"hackernews": "2026-01-02T08:00:00"},
+        "circuits": {"host:example.com": {"state": "open", "failures": 3, "opens": 1}},
+    }
+    _render(config, "2026-01-01", old)
+    _render(config, "2026-01-02", new)
+    published = StateManager(config.state_file).last_published
+
+    _render(config, "2026-01-01", old)
+
+    state = StateManager(config.state_file)
+    assert state.get_cursor("lobsters:feed") == "2026-01-02T00:00:00+00:00"
+    assert state.collector_ran_at("hackernews") == "2026-01-02T08:00:00"
+    assert "host:example.com" in state.state["circuits"]
+    assert state.last_published == published
+    assert state.is_covered("hn:2026-01-01")
+
+
+def test_newer_run_times_in_state_are_kept(tmp_path):
+    state = StateManager(str(tmp_path / "state.json"))
+    state.state["collector_runs"] = {"github_stats": "2026-01-03T08:00:00"}
+    state.apply_progress({"collector_runs": {"github_stats": "2026-01-02T08:00:00", "npm_registry": "2026-01-02T08:00:00"}})
+    assert state.collector_ran_at("github_stats") == "2026-01-03T08:00:00"
+    assert state.collector_ran_at("npm_registry") == "2026-01-02T08:00:00"
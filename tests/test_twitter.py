@@ -0,0 +1,111 @@
+"""TwitterCollector pagination and its since_id/until_id resume state."""
+
+import time
+
+from src.collectors import twitter
+from src.collectors.twitter import TwitterCollector
+from src.config import Config
+from src.state.state_manager import StateManager
+
+
+def _tweet_id(seconds_ago: float) -> str:
+    ms = int((time.time() - seconds_ago) * 1000)
+    return str((ms - twitter._TWITTER_EPOCH_MS) << 22)
+
+
+class _Response:
+    def __init__(self, data: dict):
+        self._data = data
+
+    def json(self) -> dict:
+        return self._data
+
+
+class _FakeSearch:
+    """Recent search over a fixed set of tweets, newest first."""
+
+    def __init__(self, tweet_ids: list[str]):
+        self.ids = sorted(tweet_ids, key=int, reverse=True)
+        self.calls: list[dict] = []
+
+    def get(self, url, **kwargs):
+        params = kwargs["params"]
+        self.calls.append(params)
+        since, until = params.get("since_id"), params.get("until_id")
+        matching = [
+            i for i in self.ids
+            if (since is None or int(i) > int(since)) and (until is None or int(i) < int(until))
+        ]
+        offset = int(params.get("next_token", 0))
+        page = matching[offset:offset + params["max_results"]]
+        meta = {}
+        if page:
+            meta = {"newest_id": page[0], "oldest_id": page[-1]}
+        if offset + len(page) < len(matching):
+            meta["next_token"] = str(offset + len(page))
+        return _Response({"data": [{"id": i, "text": "openclaw"} for i in page], "meta": meta})
+
+
+def _run(state: StateManager) -> list[str]:
+    items = TwitterCollector(Config(twitter_bearer_token="t")).collect(state)
+    return [item.id.removeprefix("tweet:") for item in items]
+
+
+def _cursor(state: StateManager, key: str) -> str | None:
+    return state.get_cursor(key) or None
+
+
+def test_budget_exhausted_then_resumed(tmp_path, monkeypatch):
+    ids = [_tweet_id(3600 + i * 60) for i in range(450)]
+    search = _FakeSearch(ids)
+    monkeypatch.setattr(TwitterCollector, "_get", search.get)
+    state = StateManager(str(tmp_path / "state.json"))
+    since = _tweet_id(3 * 24 * 3600)
+    state.set_cursor(twitter._SINCE_KEY, since)
+
+    first = _run(state)
+    assert len(first) == 300
+    # since_id waits until the walk down to it is complete
+    assert _cursor(state, twitter._SINCE_KEY) == since
+    assert _cursor(state, twitter._UNTIL_KEY) == first[-1]
+    assert _cursor(state, twitter._PENDING_KEY) == search.ids[0]
+
+    # New tweets arrive before the next run; it finishes the old window first
+    search.ids.insert(0, _tweet_id(60))
+    second = _run(state)
+    assert search.calls[-1]["until_id"] == first[-1]
+    assert sorted(first + second, key=int) == sorted(ids, key=int)
+    assert _cursor(state, twitter._SINCE_KEY) == ids[0]
+    assert _cursor(state, twitter._UNTIL_KEY) is None
+    assert _cursor(state, twitter._PENDING_KEY) is None
+
+    third = _run(state)
+    assert third == [search.ids[0]]
+    assert _cursor(state, twitter._SINCE_KEY) == search.ids[0]
+
+
+def test_cursors_outside_the_search_window_are_not_sent(tmp_path, monkeypatch):
+    search = _FakeSearch([_tweet_id(600), _tweet_id(1200)])
+    monkeypatch.setattr(TwitterCollector, "_get", search.get)
+    state = StateManager(str(tmp_path / "state.json"))
+    stale = _tweet_id(8 * 24 * 3600)
+    state.set_cursor(twitter._SINCE_KEY, stale)
+    state.set_cursor(twitter._UNTIL_KEY, stale)
+    state.set_cursor(twitter._PENDING_KEY, _tweet_id(7.5 * 24 * 3600))
+
+    assert len(_run(state)) == 2
+    assert "since_id" not in search.calls[0]
+    assert "until_id" not in search.calls[0]
+    # The stale pending_newest is dropped along with until_id
+    assert _cursor(state, twitter._SINCE_KEY) == search.ids[0]
+    assert _cursor(state, twitter._UNTIL_KEY) is None
+    assert _cursor(state, twitter._PENDING_KEY) is None
+
+
+def test_no_results_keeps_since_id(tmp_path, monkeypatch):
+    monkeypatch.setattr(TwitterCollector, "_get", _FakeSearch([]).get)
+    state = StateManager(str(tmp_path / "state.json"))
+    since = _tweet_id(3600)
+    state.set_cursor(twitter._SINCE_KEY, since)
+    assert _run(state) == []
+    assert _cursor(state, twitter._SINCE_KEY) == since
@@ -0,0 +1,51 @@
+"""YouTubeCollector statistics enrichment."""
+
+from src.collectors.youtube import YouTubeCollector
+from src.config import Config
+from src.state.state_manager import StateManager
+
+
+class _Response:
+    def __init__(self, data: dict):
+        self._data = data
+
+    def json(self) -> dict:
+        return self._data
+
+
+def _fake_get(calls: list):
+    def get(self, url, **kwargs):
+        params = kwargs["params"]
+        calls.append(url.rsplit("/", 1)[-1])
+        if url.endswith("/search"):
+            return _Response({"items": [
+                {"id": {"videoId": "v1"}, "snippet": {"title": "One"}},
+                {"id": {"videoId": "v2"}, "snippet": {"title": "Two"}},
+            ]})
+        return _Response({"items": [
+            {"id": video_id, "statistics": {"viewCount": "1200", "likeCount": "30", "commentCount": "4"}}
+            for video_id in params["id"].split(",")
+        ]})
+    return get
+
+
+def test_statistics_are_batched_then_served_from_cache(tmp_path, monkeypatch):
+    calls: list[str] = []
+    monkeypatch.setattr(YouTubeCollector, "_get", _fake_get(calls))
+    config = Config(youtube_api_key="key")
+    state = StateManager(str(tmp_path / "state.json"))
+
+    first = YouTubeCollector(config)
+    items = first.collect(state)
+    assert calls.count("videos") == 1
+    assert first.stats.cache_hits == 0
+    assert items[0].metadata["view_count"] == 1200
+    assert items[0].metadata["like_count"] == 30
+    assert items[0].metadata["comments"] == 4
+
+    calls.clear()
+    second = YouTubeCollector(config)
+    items = second.collect(state)
+    assert "videos" not in calls
+    assert second.stats.cache_hits == 2
+    assert items[1].metadata["view_count"] == 1200